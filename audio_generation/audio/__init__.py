@@ -1,8 +1,22 @@
 """Audio processing module."""
 
+from audio_generation.audio.buffer import AudioBuffer
 from audio_generation.audio.concatenator import SegmentConcatenator
-from audio_generation.audio.effects import AudioEffects
+from audio_generation.audio.effects import AudioEffects, ComfortNoiseBank
+from audio_generation.audio.encoder_pool import EncoderPool
 from audio_generation.audio.exporter import MP3Exporter
 from audio_generation.audio.processor import AudioProcessor
+from audio_generation.audio.stream_encoder import StreamingMP3Encoder
+from audio_generation.audio.timeline import Timeline
 
-__all__ = ["AudioProcessor", "AudioEffects", "SegmentConcatenator", "MP3Exporter"]
+__all__ = [
+    "AudioBuffer",
+    "AudioProcessor",
+    "AudioEffects",
+    "ComfortNoiseBank",
+    "EncoderPool",
+    "SegmentConcatenator",
+    "MP3Exporter",
+    "StreamingMP3Encoder",
+    "Timeline",
+]
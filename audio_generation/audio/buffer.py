@@ -0,0 +1,177 @@
+"""Compact NumPy audio buffer used between decoding and encoding."""
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+from pydub import AudioSegment
+
+from audio_generation.audio.resampler import get_resampler
+from audio_generation.domain.constants import GEMINI_TTS_SAMPLE_RATE
+
+MAX_AMPLITUDE = 32768  # Full scale of 16-bit samples, as pydub's dBFS uses
+
+
+@dataclass(frozen=True)
+class AudioBuffer:
+    """Mono 16-bit audio as a NumPy array plus its sample rate.
+
+    Audio stays in this form from the TTS bytes to the encoder: buffers
+    wrap PCM without copying, slicing returns views, and only the exporter
+    converts to a pydub AudioSegment. Samples may be read-only (when they
+    wrap immutable bytes), so operations return new buffers instead of
+    modifying samples in place.
+
+    Attributes:
+        samples: 16-bit signed mono samples
+        sample_rate: Sample rate in Hz
+    """
+
+    samples: np.ndarray
+    sample_rate: int
+
+    @classmethod
+    def from_pcm(
+        cls, pcm_data: bytes, sample_rate: int = GEMINI_TTS_SAMPLE_RATE
+    ) -> "AudioBuffer":
+        """Wrap raw PCM without copying.
+
+        Args:
+            pcm_data: Raw PCM audio (16-bit signed little-endian, mono)
+            sample_rate: Source sample rate
+
+        Returns:
+            Read-only buffer sharing memory with pcm_data
+        """
+        usable = len(pcm_data) - len(pcm_data) % 2  # Drop a trailing odd byte
+        return cls(np.frombuffer(pcm_data, dtype="<i2", count=usable // 2), sample_rate)
+
+    @classmethod
+    def from_segment(cls, audio: AudioSegment) -> "AudioBuffer":
+        """Convert a pydub AudioSegment to a mono 16-bit buffer.
+
+        Args:
+            audio: Segment to convert
+
+        Returns:
+            Buffer at the segment's sample rate
+        """
+        if audio.channels != 1:
+            audio = audio.set_channels(1)
+        if audio.sample_width != 2:
+            audio = audio.set_sample_width(2)
+        return cls(np.frombuffer(audio.raw_data, dtype=np.int16), audio.frame_rate)
+
+    @classmethod
+    def silent(cls, duration_ms: float, sample_rate: int) -> "AudioBuffer":
+        """Create digital silence.
+
+        Args:
+            duration_ms: Duration in milliseconds
+            sample_rate: Sample rate in Hz
+
+        Returns:
+            Buffer of zeros
+        """
+        num_samples = int(sample_rate * duration_ms / 1000)
+        return cls(np.zeros(num_samples, dtype=np.int16), sample_rate)
+
+    def to_segment(self) -> AudioSegment:
+        """Convert to a pydub AudioSegment (for encoding).
+
+        Returns:
+            Mono 16-bit AudioSegment
+        """
+        return AudioSegment(
+            data=self.samples.tobytes(),
+            sample_width=2,
+            frame_rate=self.sample_rate,
+            channels=1,
+        )
+
+    def to_pcm(self) -> bytes:
+        """Get the samples as raw 16-bit PCM bytes."""
+        return self.samples.tobytes()
+
+    def resample(self, sample_rate: int) -> "AudioBuffer":
+        """Convert to another sample rate with the polyphase resampler.
+
+        Args:
+            sample_rate: Target sample rate in Hz
+
+        Returns:
+            This buffer if already at the rate, otherwise a converted copy
+        """
+        if sample_rate == self.sample_rate:
+            return self
+        resampler = get_resampler(self.sample_rate, sample_rate)
+        return AudioBuffer(resampler.resample(self.samples), sample_rate)
+
+    def slice_ms(self, start_ms: float, end_ms: float | None = None) -> "AudioBuffer":
+        """Get a view of a time range.
+
+        Args:
+            start_ms: Start of the range in milliseconds
+            end_ms: End of the range in milliseconds (None for the end)
+
+        Returns:
+            Buffer sharing memory with this one
+        """
+        start = self.ms_to_samples(start_ms)
+        end = None if end_ms is None else self.ms_to_samples(end_ms)
+        return AudioBuffer(self.samples[start:end], self.sample_rate)
+
+    def fade(self, fade_in_ms: float = 0, fade_out_ms: float = 0) -> "AudioBuffer":
+        """Apply linear fade-in and fade-out ramps.
+
+        Args:
+            fade_in_ms: Fade-in duration in milliseconds
+            fade_out_ms: Fade-out duration in milliseconds
+
+        Returns:
+            New buffer with the fades applied
+        """
+        samples = self.samples.copy()
+        fade_in = min(self.ms_to_samples(fade_in_ms), len(samples))
+        fade_out = min(self.ms_to_samples(fade_out_ms), len(samples))
+        if fade_in:
+            ramp = np.linspace(0.0, 1.0, fade_in, endpoint=False, dtype=np.float32)
+            samples[:fade_in] = samples[:fade_in] * ramp
+        if fade_out:
+            ramp = np.linspace(1.0, 0.0, fade_out, endpoint=False, dtype=np.float32)
+            samples[-fade_out:] = samples[-fade_out:] * ramp
+        return AudioBuffer(samples, self.sample_rate)
+
+    def concat(self, *others: "AudioBuffer") -> "AudioBuffer":
+        """Join buffers end to end (all at this buffer's sample rate).
+
+        Args:
+            others: Buffers to append, in order
+
+        Returns:
+            New buffer holding every buffer's samples
+        """
+        parts = [self.samples] + [o.resample(self.sample_rate).samples for o in others]
+        return AudioBuffer(np.concatenate(parts), self.sample_rate)
+
+    def ms_to_samples(self, duration_ms: float) -> int:
+        """Convert a duration to a sample count at this buffer's rate."""
+        return int(self.sample_rate * duration_ms / 1000)
+
+    @property
+    def num_samples(self) -> int:
+        """Get the number of samples."""
+        return len(self.samples)
+
+    @property
+    def duration_ms(self) -> int:
+        """Get the duration in whole milliseconds (as len() of an AudioSegment)."""
+        return round(1000 * len(self.samples) / self.sample_rate)
+
+    @property
+    def dBFS(self) -> float:
+        """Get the RMS level relative to full scale (-inf for silence)."""
+        if not len(self.samples):
+            return -math.inf
+        rms = math.sqrt(np.mean(np.square(self.samples, dtype=np.float64)))
+        return 20 * math.log10(rms / MAX_AMPLITUDE) if rms > 0 else -math.inf
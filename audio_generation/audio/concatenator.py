@@ -1,17 +1,33 @@
 """Segment concatenator with context-aware pauses."""
 
 import logging
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator
 
 import numpy as np
-from pydub import AudioSegment
 
 from audio_generation.domain.models import PauseConfig, Segment
 from audio_generation.domain.constants import (
     INTER_SEGMENT_PAUSE_MS,
     TARGET_SAMPLE_RATE,
 )
+from audio_generation.audio.buffer import AudioBuffer
 from audio_generation.audio.effects import AudioEffects
 from audio_generation.audio.processor import AudioProcessor
+from audio_generation.audio.timeline import Timeline
+
+
+@dataclass
+class NormalizedSegments:
+    """Decoded, edge-normalized segments ready to be mixed.
+
+    Attributes:
+        segments: Normalized audio of each segment, in order
+        noise_db: Comfort noise level shared by every pause in the file
+    """
+
+    segments: list[AudioBuffer]
+    noise_db: float
 
 
 class SegmentConcatenator:
@@ -46,24 +62,44 @@ class SegmentConcatenator:
         audio_segments: list[bytes],
         segment_metadata: list[Segment] | None = None,
         pause_ms: int = INTER_SEGMENT_PAUSE_MS,
-    ) -> AudioSegment:
+    ) -> AudioBuffer:
         """Concatenate segment audio with professional-grade transitions.
 
         Enhanced pipeline for smooth audio transitions:
-        1. Convert PCM to AudioSegment
+        1. Wrap PCM in AudioBuffer and resample it to 44.1 kHz
         2. Analyze overall noise floor for consistency
         3. Normalize each segment with comfort noise buffers and fades
         4. Calculate context-aware pause durations
         5. Join with comfort noise pauses and non-linear crossfades
         6. Add file-level leading/trailing with comfort noise
 
+        Steps 4-6 lay every clip out on a Timeline first and mix them into
+        one preallocated buffer, so mixing time is linear in chapter length.
+
+        Steps 1-3 (normalize) and 4-6 (mix) are also available separately,
+        so a staged pipeline can run them as distinct stages.
+
         Args:
             audio_segments: List of raw PCM audio data
             segment_metadata: Optional list of Segment objects for context-aware pausing
             pause_ms: Default pause duration between segments (fallback)
 
         Returns:
-            Combined AudioSegment
+            Combined AudioBuffer
+
+        Raises:
+            ValueError: If no audio segments provided
+        """
+        return self.mix(self.normalize(audio_segments), segment_metadata, pause_ms)
+
+    def normalize(self, audio_segments: list[bytes]) -> NormalizedSegments:
+        """Decode PCM and normalize every segment (steps 1-3 of concatenate).
+
+        Args:
+            audio_segments: List of raw PCM audio data
+
+        Returns:
+            NormalizedSegments for mix
 
         Raises:
             ValueError: If no audio segments provided
@@ -71,134 +107,273 @@ class SegmentConcatenator:
         if not audio_segments:
             raise ValueError("No audio segments to concatenate")
 
+        # Step 1: Wrap all PCM in AudioBuffer and resample to the output
+        # rate, so all later DSP runs at a single rate
+        raw_segments = [self._decode(pcm_data) for pcm_data in audio_segments]
+
+        # Step 2: Analyze overall noise floor for consistency (if using comfort noise)
+        target_noise_db = self._noise_level(raw_segments)
+
+        # Step 3: Normalize each segment with fades and comfort noise
+        processed_segments = [
+            self._normalize_segment(i, audio, target_noise_db)
+            for i, audio in enumerate(raw_segments)
+        ]
+
+        return NormalizedSegments(segments=processed_segments, noise_db=target_noise_db)
+
+    def mix(
+        self,
+        normalized: NormalizedSegments,
+        segment_metadata: list[Segment] | None = None,
+        pause_ms: int = INTER_SEGMENT_PAUSE_MS,
+    ) -> AudioBuffer:
+        """Join normalized segments with pauses (steps 4-6 of concatenate).
+
+        Args:
+            normalized: Result of normalize
+            segment_metadata: Optional list of Segment objects for context-aware pausing
+            pause_ms: Default pause duration between segments (fallback)
+
+        Returns:
+            Combined AudioBuffer
+        """
+        config = self._config
+        processed_segments = normalized.segments
+        target_noise_db = normalized.noise_db
+        use_context_aware = self._log_mix(
+            len(processed_segments), segment_metadata, pause_ms
+        )
+
+        # Step 4 & 5: Lay out the leading buffer, then every segment preceded
+        # by its context-aware pause, all joined with non-linear crossfades
+        timeline = Timeline(
+            TARGET_SAMPLE_RATE, config.crossfade_ms, config.crossfade_curve
+        )
+        self._append_gap(timeline, config.file_leading_ms, target_noise_db, 0)
+
+        for i, segment_audio in enumerate(processed_segments):
+            if i > 0:
+                pause_duration = self._pause_before(
+                    i, segment_metadata if use_context_aware else None, pause_ms
+                )
+                self._append_gap(timeline, pause_duration, target_noise_db, i)
+
+            timeline.append_buffer(segment_audio)
+
+        # Step 6: Add trailing buffer
+        self._append_gap(
+            timeline,
+            config.file_trailing_ms,
+            target_noise_db,
+            len(processed_segments),
+        )
+
+        # Mix everything in a single pass
+        return timeline.to_buffer()
+
+    def stream(
+        self,
+        segment_count: int,
+        load_segment: Callable[[int], bytes],
+        segment_metadata: list[Segment] | None = None,
+        pause_ms: int = INTER_SEGMENT_PAUSE_MS,
+    ) -> Iterator[np.ndarray]:
+        """Concatenate segments loaded one at a time, yielding mixed samples.
+
+        Same steps as concatenate, but only one segment is decoded and
+        normalized at a time, and the timeline is flushed after each, so
+        memory is bounded by one segment whatever the chapter length. The
+        noise floor (step 2) needs every segment, so segments are loaded
+        twice: once to measure it, once to mix. Output matches concatenate.
+
+        Args:
+            segment_count: Number of segments
+            load_segment: Returns the raw PCM audio of a segment by index
+            segment_metadata: Optional list of Segment objects for context-aware pausing
+            pause_ms: Default pause duration between segments (fallback)
+
+        Yields:
+            16-bit mono samples at TARGET_SAMPLE_RATE, in playback order
+
+        Raises:
+            ValueError: If no audio segments provided
+        """
+        if segment_count == 0:
+            raise ValueError("No audio segments to concatenate")
+
+        config = self._config
+        target_noise_db = self._noise_level(
+            self._decode(load_segment(i)) for i in range(segment_count)
+        )
+        use_context_aware = self._log_mix(segment_count, segment_metadata, pause_ms)
+
+        timeline = Timeline(
+            TARGET_SAMPLE_RATE, config.crossfade_ms, config.crossfade_curve
+        )
+        self._append_gap(timeline, config.file_leading_ms, target_noise_db, 0)
+
+        for i in range(segment_count):
+            if i > 0:
+                pause_duration = self._pause_before(
+                    i, segment_metadata if use_context_aware else None, pause_ms
+                )
+                self._append_gap(timeline, pause_duration, target_noise_db, i)
+
+            audio = self._decode(load_segment(i))
+            timeline.append_buffer(self._normalize_segment(i, audio, target_noise_db))
+            yield timeline.flush()
+
+        self._append_gap(
+            timeline, config.file_trailing_ms, target_noise_db, segment_count
+        )
+        yield timeline.render()
+
+    def _decode(self, pcm_data: bytes) -> AudioBuffer:
+        """Wrap segment PCM and resample it to the output rate (step 1)."""
+        return self._processor.pcm_to_buffer(pcm_data).resample(TARGET_SAMPLE_RATE)
+
+    def _noise_level(self, raw_segments: Iterable[AudioBuffer]) -> float:
+        """Pick the comfort noise level from the segments' noise floors (step 2).
+
+        Args:
+            raw_segments: Decoded segments (consumed one at a time)
+
+        Returns:
+            Comfort noise level in dBFS
+        """
+        config = self._config
+        target_noise_db = config.comfort_noise_db
+        if not config.use_comfort_noise:
+            return target_noise_db
+
+        noise_floors = [
+            self._effects.analyze_noise_floor(seg)
+            for seg in raw_segments
+            if seg.dBFS > -float("inf")
+        ]
+        if noise_floors:
+            avg_noise_floor = float(np.mean(noise_floors))
+            # Use slightly below average to be subtle
+            target_noise_db = min(config.comfort_noise_db, avg_noise_floor - 5)
+            logging.debug(f"Target comfort noise level: {target_noise_db:.1f} dBFS")
+        return target_noise_db
+
+    def _normalize_segment(
+        self, index: int, audio: AudioBuffer, noise_db: float
+    ) -> AudioBuffer:
+        """Normalize one segment with fades and comfort noise (step 3).
+
+        Args:
+            index: Segment index (for logging and comfort noise keys)
+            audio: Decoded segment
+            noise_db: Comfort noise level in dBFS
+
+        Returns:
+            Normalized segment
+        """
+        config = self._config
+        normalized = self._processor.normalize(
+            audio,
+            buffer_ms=config.segment_edge_buffer_ms,
+            fade_in_ms=config.segment_fade_in_ms,
+            fade_out_ms=config.segment_fade_out_ms,
+            use_comfort_noise=config.use_comfort_noise,
+            comfort_noise_db=noise_db,
+            noise_key=2 * index + 1,
+        )
+        logging.debug(
+            f"Segment {index + 1}: {audio.duration_ms}ms -> "
+            f"{normalized.duration_ms}ms (normalized)"
+        )
+        return normalized
+
+    def _log_mix(
+        self,
+        segment_count: int,
+        segment_metadata: list[Segment] | None,
+        pause_ms: int,
+    ) -> bool:
+        """Log how segments will be joined.
+
+        Args:
+            segment_count: Number of segments
+            segment_metadata: Optional list of Segment objects
+            pause_ms: Default pause duration between segments
+
+        Returns:
+            True if context-aware pausing can be used
+        """
         config = self._config
 
         # Determine if we can use context-aware pausing
-        use_context_aware = segment_metadata is not None and len(
-            segment_metadata
-        ) == len(audio_segments)
+        use_context_aware = (
+            segment_metadata is not None and len(segment_metadata) == segment_count
+        )
 
         smoothing_mode = (
             "comfort noise" if config.use_comfort_noise else "digital silence"
         )
         if use_context_aware:
             logging.info(
-                f"Concatenating {len(audio_segments)} segments with context-aware pausing "
+                f"Concatenating {segment_count} segments with context-aware pausing "
                 f"({smoothing_mode}, {config.crossfade_curve} crossfade)"
             )
         else:
             logging.info(
-                f"Concatenating {len(audio_segments)} segments with {pause_ms}ms pauses "
+                f"Concatenating {segment_count} segments with {pause_ms}ms pauses "
                 f"({smoothing_mode})"
             )
+        return use_context_aware
 
-        # Step 1: Convert all PCM to AudioSegment
-        raw_segments: list[AudioSegment] = []
-        for pcm_data in audio_segments:
-            audio = self._processor.pcm_to_segment(pcm_data)
-            raw_segments.append(audio)
+    def _pause_before(
+        self,
+        index: int,
+        segment_metadata: list[Segment] | None,
+        pause_ms: int,
+    ) -> int:
+        """Get the pause between a segment and the one before it.
 
-        # Step 2: Analyze overall noise floor for consistency (if using comfort noise)
-        target_noise_db = config.comfort_noise_db
-        if config.use_comfort_noise and raw_segments:
-            noise_floors = [
-                self._effects.analyze_noise_floor(seg)
-                for seg in raw_segments
-                if seg.dBFS > -float("inf")
-            ]
-            if noise_floors:
-                avg_noise_floor = float(np.mean(noise_floors))
-                # Use slightly below average to be subtle
-                target_noise_db = min(config.comfort_noise_db, avg_noise_floor - 5)
-                logging.debug(f"Target comfort noise level: {target_noise_db:.1f} dBFS")
+        Args:
+            index: Index of the later segment (at least 1)
+            segment_metadata: Segment metadata, None without context-aware pausing
+            pause_ms: Pause used without context-aware pausing
 
-        # Step 3: Normalize each segment with fades and comfort noise
-        processed_segments: list[AudioSegment] = []
-        for i, audio in enumerate(raw_segments):
-            normalized = self._processor.normalize(
-                audio,
-                buffer_ms=config.segment_edge_buffer_ms,
-                fade_in_ms=config.segment_fade_in_ms,
-                fade_out_ms=config.segment_fade_out_ms,
-                use_comfort_noise=config.use_comfort_noise,
-                comfort_noise_db=target_noise_db,
-            )
-            processed_segments.append(normalized)
-            logging.debug(
-                f"Segment {i + 1}: {len(audio)}ms -> {len(normalized)}ms (normalized)"
+        Returns:
+            Pause duration in milliseconds
+        """
+        if segment_metadata:
+            return self._calculate_pause(
+                segment_metadata[index - 1], segment_metadata[index]
             )
+        return pause_ms
 
-        # Step 4 & 5: Combine with context-aware pauses and non-linear crossfades
-        # Generate leading buffer (comfort noise or silence)
-        if config.use_comfort_noise:
-            combined = self._effects.generate_comfort_noise(
-                config.file_leading_ms,
-                target_db=target_noise_db,
-                sample_rate=TARGET_SAMPLE_RATE,
-            )
-        else:
-            combined = AudioSegment.silent(duration=config.file_leading_ms)
+    def _append_gap(
+        self, timeline: Timeline, duration_ms: int, noise_db: float, index: int
+    ) -> None:
+        """Place a pause of comfort noise or digital silence on the timeline.
 
-        for i, segment_audio in enumerate(processed_segments):
-            if i == 0:
-                # First segment - join with leading buffer
-                combined = self._effects.apply_crossfade(
-                    combined,
-                    segment_audio,
-                    config.crossfade_ms,
-                    config.crossfade_curve,
-                )
-            else:
-                # Calculate pause duration
-                if use_context_aware and segment_metadata:
-                    prev_seg = segment_metadata[i - 1]
-                    curr_seg = segment_metadata[i]
-                    pause_duration = self._calculate_pause(prev_seg, curr_seg)
-                else:
-                    pause_duration = pause_ms
-
-                # Create pause with comfort noise or digital silence
-                if config.use_comfort_noise:
-                    pause = self._effects.generate_comfort_noise(
-                        pause_duration,
-                        target_db=target_noise_db,
-                        sample_rate=TARGET_SAMPLE_RATE,
-                    )
-                else:
-                    pause = AudioSegment.silent(duration=pause_duration)
-
-                # Apply crossfade through the pause to the next segment
-                combined = self._effects.apply_crossfade(
-                    combined,
-                    pause,
-                    config.crossfade_ms,
-                    config.crossfade_curve,
-                )
-                combined = self._effects.apply_crossfade(
-                    combined,
-                    segment_audio,
-                    config.crossfade_ms,
-                    config.crossfade_curve,
-                )
+        Comfort noise is keyed by position (even keys for gaps, odd keys for
+        segment edge buffers), so a chapter's noise does not depend on what
+        else the shared noise bank served meanwhile.
 
-        # Step 6: Add trailing buffer
-        if config.use_comfort_noise:
-            trailing = self._effects.generate_comfort_noise(
-                config.file_trailing_ms,
-                target_db=target_noise_db,
-                sample_rate=TARGET_SAMPLE_RATE,
+        Args:
+            timeline: Timeline being laid out
+            duration_ms: Pause duration in milliseconds
+            noise_db: Comfort noise level in dBFS
+            index: Index of the segment the gap precedes (segment count for
+                the trailing buffer)
+        """
+        if self._config.use_comfort_noise:
+            noise = self._effects.generate_comfort_noise(
+                duration_ms,
+                target_db=noise_db,
+                sample_rate=timeline.sample_rate,
+                key=2 * index,
             )
+            timeline.append_buffer(noise)
         else:
-            trailing = AudioSegment.silent(duration=config.file_trailing_ms)
-
-        combined = self._effects.apply_crossfade(
-            combined,
-            trailing,
-            config.crossfade_ms,
-            config.crossfade_curve,
-        )
-
-        return combined
+            timeline.append_silence(duration_ms)
 
     def _calculate_pause(
         self,
@@ -1,18 +1,267 @@
 """Audio effects: crossfade, comfort noise, analysis."""
 
-import array
+import hashlib
 import logging
+import math
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 
 import numpy as np
-from pydub import AudioSegment
 
+from audio_generation.audio.buffer import AudioBuffer
 from audio_generation.domain.constants import (
     COMFORT_NOISE_LEVEL_DB,
+    CROSSFADE_CURVE_CACHE_SIZE,
     CROSSFADE_MS,
+    NOISE_BANK_CALIBRATION_MS,
+    NOISE_BANK_DURATION_SEC,
+    NOISE_BANK_LEVEL_STEP_DB,
+    NOISE_BANK_LOOP_MS,
+    NOISE_BANK_MAX_LEVELS,
+    NOISE_BANK_SEED,
     NOISE_FADE_MS,
     TARGET_SAMPLE_RATE,
 )
 
+# Paul Kellet's economy pink noise filter: three one-pole low-passes plus a
+# direct white term, y[n] = sum_k b_k[n] + 0.5362 w[n] with
+# b_k[n] = POLES[k] * b_k[n-1] + GAINS[k] * w[n]
+PINK_POLES = np.array([0.99886, 0.99332, 0.96900])
+PINK_GAINS = np.array([0.0555179, 0.0750759, 0.1538520])
+PINK_DIRECT_GAIN = 0.5362
+PINK_BLOCK_SIZE = 256  # Samples filtered per matrix product
+
+
+@lru_cache(maxsize=4)
+def _pink_filter_kernels(
+    block_size: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Precompute the block form of the pink noise filter.
+
+    Args:
+        block_size: Samples per block
+
+    Returns:
+        Tuple of (response, final, carry, decay):
+        - response (B, B): zero-state output of the whole filter for a block,
+          as ``block @ response``
+        - final (B, 3): each pole's state at the end of a block, as
+          ``block @ final``
+        - carry (3, B): contribution of each pole's incoming state to every
+          output sample of the block
+        - decay (3,): each pole's decay over one block
+    """
+    n = np.arange(block_size)
+    lag = n[:, None] - n[None, :]  # lag[i, j] = i - j
+    causal = lag >= 0
+
+    response = np.zeros((block_size, block_size))
+    for pole, gain in zip(PINK_POLES, PINK_GAINS):
+        response += np.where(causal, gain * pole ** np.maximum(lag, 0), 0.0)
+    response += PINK_DIRECT_GAIN * np.eye(block_size)
+
+    final = PINK_GAINS[None, :] * PINK_POLES[None, :] ** (block_size - 1 - n[:, None])
+    carry = PINK_POLES[:, None] ** (n[None, :] + 1)
+    decay = PINK_POLES**block_size
+
+    # response is applied as block @ response, i.e. transposed
+    return response.T.copy(), final, carry, decay
+
+
+@lru_cache(maxsize=CROSSFADE_CURVE_CACHE_SIZE)
+def _fade_curve_table(
+    num_samples: int, curve_type: str
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute read-only float32 (fade_out, fade_in) gains for a crossfade.
+
+    Tables are cached per (length, curve), i.e. per crossfade duration and
+    sample rate, since a run only ever uses a few crossfade lengths.
+    """
+    t = np.linspace(0, 1, num_samples)
+
+    # Generate fade curves based on type
+    if curve_type == "logarithmic":
+        # Logarithmic: slow decay, natural for audio fade-outs
+        fade_out = 1 - np.log1p(t * (np.e - 1)) / np.log(np.e)
+        fade_in = np.log1p(t * (np.e - 1)) / np.log(np.e)
+    elif curve_type == "exponential":
+        # Exponential: quick start, slow finish
+        fade_out = 1 - t**2
+        fade_in = t**2
+    elif curve_type == "s_curve":
+        # S-curve (smoothstep): slow-fast-slow, very smooth
+        fade_in = t * t * (3 - 2 * t)  # smoothstep function
+        fade_out = 1 - fade_in
+    elif curve_type == "equal_power":
+        # Equal power: constant summed power for uncorrelated material
+        fade_out = np.cos(t * np.pi / 2)
+        fade_in = np.sin(t * np.pi / 2)
+    else:
+        # Fallback to linear
+        fade_out = 1 - t
+        fade_in = t
+
+    tables = (fade_out.astype(np.float32), fade_in.astype(np.float32))
+    for table in tables:
+        table.flags.writeable = False
+    return tables
+
+
+_scratch = threading.local()
+
+
+def _mix_scratch(num_samples: int) -> tuple[np.ndarray, np.ndarray]:
+    """Get two float32 work arrays, reused across calls on the same thread."""
+    buffer = getattr(_scratch, "buffer", None)
+    if buffer is None or buffer.shape[1] < num_samples:
+        buffer = np.empty((2, num_samples), dtype=np.float32)
+        _scratch.buffer = buffer
+    return buffer[0, :num_samples], buffer[1, :num_samples]
+
+
+class ComfortNoiseBank:
+    """Precomputed pink noise loops, sliced on demand.
+
+    A chapter asks for comfort noise for every pause and edge buffer, but at
+    only a few distinct levels. The bank generates one long, seeded noise
+    loop per (sample rate, level) and hands out slices of it, so each
+    request costs a copy instead of a filter run. Each loop's end is
+    crossfaded into its start, so slices may wrap around without a click.
+    Where a slice starts is derived from the caller's key and the slice
+    length only, so the same pause always gets the same noise whatever
+    other chapters are mixed concurrently, while pauses with different
+    keys (e.g. positions in a chapter) get different parts of the loop.
+    """
+
+    def __init__(
+        self,
+        duration_sec: float = NOISE_BANK_DURATION_SEC,
+        max_levels: int = NOISE_BANK_MAX_LEVELS,
+        seed: int = NOISE_BANK_SEED,
+    ):
+        """Initialize noise bank.
+
+        Args:
+            duration_sec: Length of each noise loop
+            max_levels: Loops kept in memory, least recently used evicted
+            seed: Random seed, so a run's noise is reproducible
+        """
+        self._duration_sec = duration_sec
+        self._max_levels = max_levels
+        self._seed = seed
+        self._lock = threading.Lock()
+        self._loops: OrderedDict[tuple[int, float], np.ndarray] = OrderedDict()
+
+    def slice(
+        self,
+        num_samples: int,
+        target_db: float,
+        sample_rate: int,
+        fade_samples: int = 0,
+        key: int = 0,
+    ) -> np.ndarray:
+        """Take a slice of noise at a level.
+
+        Args:
+            num_samples: Number of samples wanted
+            target_db: Peak level in dBFS (rounded down to the level step)
+            sample_rate: Sample rate of the noise
+            fade_samples: Length of the linear fade in and out (0 for none)
+            key: Identifies the request (e.g. its position in a chapter);
+                the same key and length always give the same slice
+
+        Returns:
+            16-bit samples, a new array the caller may modify
+        """
+        level = (sample_rate, self.quantize_level(target_db))
+        with self._lock:
+            loop = self._loops.get(level)
+            if loop is None:
+                loop = self._generate(*level)
+                self._loops[level] = loop
+                if len(self._loops) > self._max_levels:
+                    self._loops.popitem(last=False)
+            else:
+                self._loops.move_to_end(level)
+        offset = self.slice_offset(key, num_samples, len(loop))
+
+        if offset + num_samples <= len(loop):
+            samples = loop[offset : offset + num_samples].copy()
+        else:
+            samples = np.take(
+                loop, np.arange(offset, offset + num_samples), mode="wrap"
+            )
+
+        if fade_samples > 0 and num_samples > 2 * fade_samples:
+            ramp = np.linspace(0.0, 1.0, fade_samples, endpoint=False)
+            samples[:fade_samples] = samples[:fade_samples] * ramp
+            samples[-fade_samples:] = samples[-fade_samples:] * ramp[::-1]
+        return samples
+
+    def __len__(self) -> int:
+        """Number of noise loops currently in memory."""
+        return len(self._loops)
+
+    @staticmethod
+    def slice_offset(key: int, num_samples: int, loop_len: int) -> int:
+        """Map a request to where its slice starts in a loop.
+
+        Args:
+            key: Request key passed to slice
+            num_samples: Length of the slice
+            loop_len: Length of the loop
+
+        Returns:
+            Start offset in [0, loop_len)
+        """
+        digest = hashlib.blake2b(f"{key}:{num_samples}".encode(), digest_size=8)
+        return int.from_bytes(digest.digest(), "little") % loop_len
+
+    @staticmethod
+    def quantize_level(target_db: float) -> float:
+        """Round a level down to the bank's level step.
+
+        Rounding down keeps the noise at or below the requested level while
+        letting nearby levels (e.g. from per-segment noise floors) share a
+        loop.
+
+        Args:
+            target_db: Requested level in dBFS
+
+        Returns:
+            Level of the loop that serves the request
+        """
+        step = NOISE_BANK_LEVEL_STEP_DB
+        return math.floor(target_db / step + 1e-9) * step
+
+    def _generate(self, sample_rate: int, target_db: float) -> np.ndarray:
+        """Generate a seamless noise loop scaled to a level."""
+        loop_len = max(1, int(sample_rate * self._duration_sec))
+        overlap = min(loop_len, int(sample_rate * NOISE_BANK_LOOP_MS / 1000))
+        rng = np.random.default_rng([self._seed, sample_rate])
+        pink = AudioEffects._pink_filter(rng.standard_normal(loop_len + overlap))
+
+        # Blend the samples that follow the loop into its start, so the last
+        # sample flows into the first as in the unbroken filter output
+        ramp = np.linspace(0.0, 1.0, overlap, endpoint=False)
+        loop = pink[:loop_len].copy()
+        loop[:overlap] = pink[loop_len:] * (1 - ramp) + loop[:overlap] * ramp
+
+        # Noise generated per pause used to be scaled to that pause's own
+        # peak; the whole loop's peak is a rarer, higher excursion. Scale to
+        # the median peak of pause-length windows so slices keep the level,
+        # clipping the few higher excursions to the requested peak.
+        window = max(1, min(loop_len, sample_rate * NOISE_BANK_CALIBRATION_MS // 1000))
+        usable = loop_len - loop_len % window
+        peak = np.median(np.abs(loop[:usable]).reshape(-1, window).max(axis=1))
+        loop = np.clip(loop / peak, -1.0, 1.0) if peak > 0 else loop
+        amplitude = 10 ** (target_db / 20) * 32767
+        logging.debug(
+            f"Generated comfort noise loop: {sample_rate} Hz, {target_db:.1f} dBFS"
+        )
+        return (loop * amplitude).astype(np.int16)
+
 
 class AudioEffects:
     """Audio effects for professional-grade transitions.
@@ -21,79 +270,103 @@ class AudioEffects:
     for smooth segment transitions.
     """
 
+    def __init__(self, noise_bank: ComfortNoiseBank | None = None):
+        """Initialize effects.
+
+        Args:
+            noise_bank: Source of comfort noise (created if None; share one
+                between instances to reuse the generated loops)
+        """
+        self._noise_bank = noise_bank or ComfortNoiseBank()
+
     def generate_comfort_noise(
         self,
         duration_ms: int,
         target_db: float = COMFORT_NOISE_LEVEL_DB,
         sample_rate: int = TARGET_SAMPLE_RATE,
-        reference_audio: AudioSegment | None = None,
-    ) -> AudioSegment:
+        reference_audio: AudioBuffer | None = None,
+        key: int = 0,
+    ) -> AudioBuffer:
         """Generate low-level pink noise to replace digital silence.
 
         Uses pink noise (1/f spectrum) which sounds more natural than white noise
         and better matches room tone. If reference_audio is provided, the noise
-        level is adjusted to match the reference's noise floor.
+        level is adjusted to match the reference's noise floor. The noise is
+        sliced from a precomputed ComfortNoiseBank loop.
 
         Args:
             duration_ms: Duration in milliseconds
             target_db: Target noise level in dBFS (default -55 dB)
             sample_rate: Output sample rate
             reference_audio: Optional audio to match noise floor from
+            key: Identifies the request, so it always gets the same noise
+                (see ComfortNoiseBank.slice)
 
         Returns:
-            AudioSegment containing comfort noise
+            AudioBuffer containing comfort noise
         """
         if duration_ms <= 0:
-            return AudioSegment.silent(duration=0, frame_rate=sample_rate)
+            return AudioBuffer.silent(0, sample_rate)
 
         num_samples = int(sample_rate * duration_ms / 1000)
 
-        # Generate white noise as base
-        white = np.random.randn(num_samples)
-
-        # Apply simple pink noise approximation using a cumulative filter
-        # This gives 1/f characteristics (equal energy per octave)
-        pink = np.zeros(num_samples)
-        b0, b1, b2 = 0.0, 0.0, 0.0
-        for i in range(num_samples):
-            white_sample = white[i]
-            b0 = 0.99886 * b0 + white_sample * 0.0555179
-            b1 = 0.99332 * b1 + white_sample * 0.0750759
-            b2 = 0.96900 * b2 + white_sample * 0.1538520
-            pink[i] = b0 + b1 + b2 + white_sample * 0.5362
-        pink = pink / np.max(np.abs(pink)) if np.max(np.abs(pink)) > 0 else pink
-
         # Adjust target level if reference audio provided
         if reference_audio is not None and reference_audio.dBFS > -float("inf"):
             # Match slightly below the reference's quiet portions
             ref_noise_floor = self.analyze_noise_floor(reference_audio)
             target_db = min(target_db, ref_noise_floor - 3)
 
-        # Convert dB to linear amplitude (16-bit range)
-        target_amplitude = 10 ** (target_db / 20) * 32767
+        # Slice pink noise (1/f spectrum: equal energy per octave) from the
+        # bank, with micro-fades to prevent clicks at edges
+        fade_samples = 0
+        if duration_ms > NOISE_FADE_MS * 2:
+            fade_samples = int(sample_rate * NOISE_FADE_MS / 1000)
+        pink = self._noise_bank.slice(
+            num_samples, target_db, sample_rate, fade_samples, key
+        )
 
-        # Scale noise to target level
-        pink = (pink * target_amplitude).astype(np.int16)
+        return AudioBuffer(pink, sample_rate)
 
-        # Convert to AudioSegment
-        noise_segment = AudioSegment(
-            data=pink.tobytes(),
-            sample_width=2,
-            frame_rate=sample_rate,
-            channels=1,
-        )
+    @staticmethod
+    def _pink_filter(white: np.ndarray) -> np.ndarray:
+        """Apply the Kellet pink noise filter to white noise, vectorized.
 
-        # Apply micro-fades to prevent clicks at edges
-        if duration_ms > NOISE_FADE_MS * 2:
-            noise_segment = noise_segment.fade_in(NOISE_FADE_MS).fade_out(NOISE_FADE_MS)
+        Equivalent to running the three one-pole recursions sample by
+        sample. The signal is cut into fixed-size blocks: the zero-state
+        response of every block is one matrix product, and the filter state
+        carried between blocks is propagated in a short loop over blocks.
+
+        Args:
+            white: White noise samples
+
+        Returns:
+            Pink noise samples (same length, not normalized)
+        """
+        num_samples = len(white)
+        block = PINK_BLOCK_SIZE
+        num_blocks = -(-num_samples // block)
+        response, final, carry, decay = _pink_filter_kernels(block)
 
-        return noise_segment
+        blocks = np.zeros((num_blocks, block))
+        blocks.reshape(-1)[:num_samples] = white
 
-    def analyze_noise_floor(self, audio: AudioSegment, percentile: int = 10) -> float:
+        output = blocks @ response
+        block_final = blocks @ final  # (num_blocks, 3) end state, zero start
+
+        # State entering each block: s[k] = decay * s[k-1] + final[k-1]
+        incoming = np.zeros((num_blocks, len(PINK_POLES)))
+        for k in range(1, num_blocks):
+            incoming[k] = decay * incoming[k - 1] + block_final[k - 1]
+        output += incoming @ carry
+
+        return output.reshape(-1)[:num_samples]
+
+    def analyze_noise_floor(self, audio: AudioBuffer, percentile: int = 10) -> float:
         """Analyze the noise floor of an audio segment.
 
         Examines the quietest portions of the audio to determine
-        the inherent noise floor level.
+        the inherent noise floor level. Window levels are computed in one
+        vectorized pass.
 
         Args:
             audio: Audio segment to analyze
@@ -102,25 +375,21 @@ class AudioEffects:
         Returns:
             Noise floor level in dBFS
         """
-        # Get samples as numpy array
-        samples = np.array(audio.get_array_of_samples(), dtype=np.float64)
-
         # Calculate RMS in small windows (10ms windows)
-        window_size = int(audio.frame_rate * 0.010)
-        num_windows = len(samples) // window_size
+        window_size = int(audio.sample_rate * 0.010)
+        num_windows = audio.num_samples // window_size
 
         if num_windows < 10:
             # Not enough data, return conservative estimate
             return audio.dBFS - 20 if audio.dBFS > -float("inf") else -60
 
-        rms_values = []
-        for i in range(num_windows):
-            window = samples[i * window_size : (i + 1) * window_size]
-            rms = np.sqrt(np.mean(window**2))
-            if rms > 0:
-                rms_values.append(rms)
+        windows = audio.samples[: num_windows * window_size].reshape(
+            num_windows, window_size
+        )
+        rms_values = np.sqrt(np.mean(np.square(windows, dtype=np.float64), axis=1))
+        rms_values = rms_values[rms_values > 0]
 
-        if not rms_values:
+        if not len(rms_values):
             return -60  # Default quiet level
 
         # Get the percentile (quietest non-silent portions)
@@ -136,11 +405,11 @@ class AudioEffects:
 
     def apply_crossfade(
         self,
-        audio1: AudioSegment,
-        audio2: AudioSegment,
+        audio1: AudioBuffer,
+        audio2: AudioBuffer,
         crossfade_ms: int = CROSSFADE_MS,
         curve_type: str = "logarithmic",
-    ) -> AudioSegment:
+    ) -> AudioBuffer:
         """Apply crossfade between two audio segments with configurable curve.
 
         Crossfading prevents clicks and pops at edit points by smoothly
@@ -148,10 +417,11 @@ class AudioEffects:
         natural-sounding transitions than linear crossfades.
 
         Curve types:
-        - "linear": Standard linear fade (pydub default)
+        - "linear": Standard linear fade
         - "logarithmic": Slower start, faster end - natural decay
         - "exponential": Faster start, slower end - natural attack
         - "s_curve": Slow start/end, fast middle - smoothest perceived transition
+        - "equal_power": Sine/cosine gains - constant loudness across the fade
 
         Args:
             audio1: First audio segment
@@ -160,16 +430,20 @@ class AudioEffects:
             curve_type: Type of fade curve to apply
 
         Returns:
-            Combined audio with crossfade applied
+            Combined audio with crossfade applied, at the higher sample rate
         """
+        sample_rate = max(audio1.sample_rate, audio2.sample_rate)
+        audio1 = audio1.resample(sample_rate)
+        audio2 = audio2.resample(sample_rate)
+
         if crossfade_ms <= 0:
-            return audio1 + audio2
+            return audio1.concat(audio2)
 
         # Ensure crossfade doesn't exceed segment lengths
-        max_crossfade = min(len(audio1), len(audio2), crossfade_ms)
+        max_crossfade = min(audio1.duration_ms, audio2.duration_ms, crossfade_ms)
 
         if max_crossfade < 10:  # Too short for meaningful crossfade
-            return audio1 + audio2
+            return audio1.concat(audio2)
 
         if max_crossfade < crossfade_ms:
             logging.debug(
@@ -177,54 +451,61 @@ class AudioEffects:
                 f"(segment too short)"
             )
 
-        # For linear curves, use pydub's built-in (more efficient)
-        if curve_type == "linear":
-            return audio1.append(audio2, crossfade=max_crossfade)
-
-        # For non-linear curves, we need manual implementation
-        # Extract crossfade regions
-        fade_out_region = audio1[-max_crossfade:]
-        fade_in_region = audio2[:max_crossfade]
-
-        # Get samples as numpy arrays
-        samples1 = np.array(fade_out_region.get_array_of_samples(), dtype=np.float64)
-        samples2 = np.array(fade_in_region.get_array_of_samples(), dtype=np.float64)
-
-        # Ensure same length (may differ slightly due to sample rate rounding)
-        min_len = min(len(samples1), len(samples2))
-        samples1 = samples1[:min_len]
-        samples2 = samples2[:min_len]
-
-        num_samples = min_len
-        t = np.linspace(0, 1, num_samples)
-
-        # Generate fade curves based on type
-        if curve_type == "logarithmic":
-            # Logarithmic: slow decay, natural for audio fade-outs
-            fade_out = 1 - np.log1p(t * (np.e - 1)) / np.log(np.e)
-            fade_in = np.log1p(t * (np.e - 1)) / np.log(np.e)
-        elif curve_type == "exponential":
-            # Exponential: quick start, slow finish
-            fade_out = 1 - t**2
-            fade_in = t**2
-        elif curve_type == "s_curve":
-            # S-curve (smoothstep): slow-fast-slow, very smooth
-            fade_in = t * t * (3 - 2 * t)  # smoothstep function
-            fade_out = 1 - fade_in
-        else:
-            # Fallback to linear
-            fade_out = 1 - t
-            fade_in = t
+        # Sample rate rounding may leave one side a sample short
+        overlap = min(
+            audio1.ms_to_samples(max_crossfade), audio1.num_samples, audio2.num_samples
+        )
+        head = audio1.num_samples - overlap
+        samples = np.empty(head + audio2.num_samples, dtype=np.int16)
+        samples[:head] = audio1.samples[:head]
+        samples[audio1.num_samples :] = audio2.samples[overlap:]
+
+        # Apply fades and mix into the overlap
+        self.mix_crossfade(
+            audio1.samples[head:],
+            audio2.samples[:overlap],
+            samples[head : audio1.num_samples],
+            curve_type,
+        )
+        return AudioBuffer(samples, sample_rate)
 
-        # Apply fades and mix
-        mixed = (samples1 * fade_out + samples2 * fade_in).astype(np.int16)
+    @staticmethod
+    def crossfade_curves(
+        num_samples: int, curve_type: str = "logarithmic"
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Get the fade-out and fade-in gains of a crossfade.
 
-        # Create mixed segment with same properties as original
-        mixed_segment = fade_out_region._spawn(
-            array.array(fade_out_region.array_type, mixed)
-        )
+        Args:
+            num_samples: Length of the crossfade region in samples
+            curve_type: Type of fade curve (see apply_crossfade)
 
-        # Combine: audio1 (without overlap) + mixed + audio2 (without overlap)
-        result = audio1[:-max_crossfade] + mixed_segment + audio2[max_crossfade:]
+        Returns:
+            Tuple of (fade_out, fade_in) read-only float32 gain arrays,
+            shared between calls
+        """
+        return _fade_curve_table(num_samples, curve_type)
 
-        return result
+    @staticmethod
+    def mix_crossfade(
+        fading_out: np.ndarray,
+        fading_in: np.ndarray,
+        out: np.ndarray,
+        curve_type: str = "logarithmic",
+    ) -> None:
+        """Mix a crossfade region into an output array in float32.
+
+        Uses cached curve tables and per-thread work arrays, so nothing is
+        allocated. ``out`` may be the same array as ``fading_out``.
+
+        Args:
+            fading_out: 16-bit samples being faded out
+            fading_in: 16-bit samples being faded in (same length)
+            out: 16-bit array receiving the mix (same length)
+            curve_type: Type of fade curve (see apply_crossfade)
+        """
+        gains_out, gains_in = _fade_curve_table(len(out), curve_type)
+        mixed, faded_in = _mix_scratch(len(out))
+        np.multiply(fading_out, gains_out, out=mixed)
+        np.multiply(fading_in, gains_in, out=faded_in)
+        np.add(mixed, faded_in, out=mixed)
+        np.copyto(out, mixed, casting="unsafe")  # Truncates like astype
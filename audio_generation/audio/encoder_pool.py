@@ -0,0 +1,102 @@
+"""Pool of MP3 encoder workers for exporting many files at once."""
+
+import logging
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+from audio_generation.audio.buffer import AudioBuffer
+from audio_generation.audio.exporter import MP3Exporter
+from audio_generation.domain.models import EncodeResult
+from audio_generation.verification.mp3_verifier import MP3Verifier
+
+
+class EncoderPool:
+    """Encodes MP3 files in parallel on long-lived worker threads.
+
+    Each worker streams one file at a time through its own ffmpeg process
+    (see StreamingMP3Encoder), so the encoding itself runs out of process
+    and the pool scales with the CPU count. Workers only hold the buffer
+    they are encoding plus the encoder's fixed-size chunks; callers bound
+    how many buffers wait in the pool by submitting at most ``workers``
+    files at a time (as the pack build's encode stage does).
+    """
+
+    def __init__(
+        self,
+        exporter: MP3Exporter | None = None,
+        verifier: MP3Verifier | None = None,
+        workers: int | None = None,
+    ):
+        """Start the workers.
+
+        Args:
+            exporter: Exporter shared by all workers
+            verifier: Verifier applied to each exported file
+            workers: Number of concurrent encodes (default: CPU count)
+        """
+        self._exporter = exporter or MP3Exporter()
+        self._verifier = verifier or MP3Verifier()
+        self._workers = workers or os.cpu_count() or 1
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._workers, thread_name_prefix="mp3-encoder"
+        )
+
+    def submit(
+        self, audio: AudioBuffer, output_path: Path, verify: bool = True
+    ) -> Future[EncodeResult]:
+        """Queue a file for encoding.
+
+        Args:
+            audio: Audio to export
+            output_path: Output MP3 file path
+            verify: If True, verify the format after export
+
+        Returns:
+            Future of the encode result (raises if the export failed)
+        """
+        return self._executor.submit(self._encode, audio, output_path, verify)
+
+    def encode_all(
+        self, jobs: list[tuple[AudioBuffer, Path]], verify: bool = True
+    ) -> list[EncodeResult]:
+        """Encode several files in parallel.
+
+        Args:
+            jobs: (audio, output path) pairs
+            verify: If True, verify each file after export
+
+        Returns:
+            Encode results in job order
+
+        Raises:
+            RuntimeError: If any export failed
+        """
+        futures = [self.submit(audio, path, verify) for audio, path in jobs]
+        return [future.result() for future in futures]
+
+    def close(self) -> None:
+        """Wait for queued encodes and stop the workers."""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "EncoderPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def workers(self) -> int:
+        """Get the number of concurrent encodes."""
+        return self._workers
+
+    def _encode(
+        self, audio: AudioBuffer, output_path: Path, verify: bool
+    ) -> EncodeResult:
+        """Export and verify one file on a worker thread."""
+        encoded = self._exporter.export(audio, output_path)
+        verification = self._verifier.verify_encoded(encoded) if verify else None
+        logging.debug(f"Encoded {output_path.name} ({encoded.size_bytes:,} bytes)")
+        return EncodeResult(
+            output_path=output_path, encoded=encoded, verification=verification
+        )
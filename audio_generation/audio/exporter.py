@@ -3,20 +3,41 @@
 import io
 import logging
 from pathlib import Path
+from typing import Iterable
 
-from pydub import AudioSegment
+import numpy as np
 
-from audio_generation.domain.constants import TARGET_CHANNELS, TARGET_SAMPLE_RATE
+from audio_generation.audio.buffer import AudioBuffer
+from audio_generation.audio.stream_encoder import ID3Stripper, StreamingMP3Encoder
+from audio_generation.domain.constants import TARGET_SAMPLE_RATE
+from audio_generation.domain.models import EncodedMP3
 
 
 class MP3Exporter:
-    """Exports AudioSegment to MP3 format.
+    """Exports AudioBuffer to MP3 format.
 
     Handles the final export to MP3 with proper format specifications
-    and ID3 tag removal.
+    and ID3 tag removal. By default PCM is streamed through an ffmpeg pipe
+    straight to the output file (see StreamingMP3Encoder); with
+    ``streaming=False`` the file is encoded in memory by pydub instead.
+    This is the only place audio is handed to an encoder.
     """
 
-    def export(self, audio: AudioSegment, output_path: Path) -> bytes:
+    def __init__(
+        self,
+        streaming: bool = True,
+        encoder: StreamingMP3Encoder | None = None,
+    ):
+        """Initialize exporter.
+
+        Args:
+            streaming: If True, stream PCM through ffmpeg to the output file
+            encoder: Streaming encoder (default: ffmpeg from PATH)
+        """
+        self._streaming = streaming
+        self._encoder = encoder or StreamingMP3Encoder()
+
+    def export(self, audio: AudioBuffer, output_path: Path) -> EncodedMP3:
         """Export audio to MP3 with ID3 tags stripped.
 
         Ensures output meets requirements:
@@ -26,30 +47,21 @@ class MP3Exporter:
         - ID3 Tags: NOT present
 
         Args:
-            audio: AudioSegment to export
+            audio: AudioBuffer to export
             output_path: Output file path
 
         Returns:
-            MP3 data bytes
-        """
-        # Ensure correct format (mono, 44100Hz)
-        if audio.frame_rate != TARGET_SAMPLE_RATE:
-            audio = audio.set_frame_rate(TARGET_SAMPLE_RATE)
-        if audio.channels != TARGET_CHANNELS:
-            audio = audio.set_channels(TARGET_CHANNELS)
+            Summary of the written file (the MP3 data itself is not
+            returned; use export_to_bytes for that)
 
-        # Export to MP3 without ID3 tags
-        mp3_buffer = io.BytesIO()
-        audio.export(
-            mp3_buffer,
-            format="mp3",
-            parameters=["-id3v2_version", "0"],
-        )
+        Raises:
+            RuntimeError: If streaming and ffmpeg is missing or fails
+        """
+        audio = self._to_target_rate(audio)
+        if self._streaming:
+            return self._encoder.encode(audio, output_path)
 
-        mp3_data = mp3_buffer.getvalue()
-
-        # Strip any remaining ID3 tags
-        mp3_data = self._strip_id3_tags(mp3_data)
+        mp3_data = self.export_to_bytes(audio)
 
         # Ensure output directory exists and save
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -57,29 +69,51 @@ class MP3Exporter:
 
         logging.info(f"Exported audio to: {output_path}")
         logging.info(
-            f"Total duration: {len(audio)}ms, File size: {len(mp3_data):,} bytes"
+            f"Total duration: {audio.duration_ms}ms, File size: {len(mp3_data):,} bytes"
         )
 
-        return mp3_data
+        return EncodedMP3(output_path=output_path, size_bytes=len(mp3_data))
+
+    def export_stream(
+        self, chunks: Iterable[np.ndarray], sample_rate: int, output_path: Path
+    ) -> EncodedMP3:
+        """Export audio produced chunk by chunk to MP3.
+
+        When streaming, chunks go to the encoder as they are produced, so
+        the whole file is never held in memory. Otherwise they are joined
+        and exported like export.
+
+        Args:
+            chunks: 16-bit mono sample chunks in playback order
+            sample_rate: Sample rate of the chunks
+            output_path: Output file path
+
+        Returns:
+            Summary of the written file
+
+        Raises:
+            RuntimeError: If streaming and ffmpeg is missing or fails
+        """
+        if self._streaming and sample_rate == TARGET_SAMPLE_RATE:
+            return self._encoder.encode_stream(chunks, sample_rate, output_path)
+
+        samples = np.concatenate([np.empty(0, np.int16), *chunks])
+        return self.export(AudioBuffer(samples, sample_rate), output_path)
 
-    def export_to_bytes(self, audio: AudioSegment) -> bytes:
+    def export_to_bytes(self, audio: AudioBuffer) -> bytes:
         """Export audio to MP3 bytes without writing to file.
 
         Args:
-            audio: AudioSegment to export
+            audio: AudioBuffer to export
 
         Returns:
             MP3 data bytes
         """
-        # Ensure correct format (mono, 44100Hz)
-        if audio.frame_rate != TARGET_SAMPLE_RATE:
-            audio = audio.set_frame_rate(TARGET_SAMPLE_RATE)
-        if audio.channels != TARGET_CHANNELS:
-            audio = audio.set_channels(TARGET_CHANNELS)
+        segment = self._to_target_rate(audio).to_segment()
 
         # Export to MP3 without ID3 tags
         mp3_buffer = io.BytesIO()
-        audio.export(
+        segment.export(
             mp3_buffer,
             format="mp3",
             parameters=["-id3v2_version", "0"],
@@ -90,6 +124,25 @@ class MP3Exporter:
         # Strip any remaining ID3 tags
         return self._strip_id3_tags(mp3_data)
 
+    def _to_target_rate(self, audio: AudioBuffer) -> AudioBuffer:
+        """Bring mixed audio to 44.1 kHz for encoding.
+
+        Segments are resampled right after decoding, so the mix normally
+        arrives at the target rate and no full-file conversion happens here.
+
+        Args:
+            audio: Mixed audio (buffers are always mono)
+
+        Returns:
+            Audio at the target sample rate
+        """
+        if audio.sample_rate != TARGET_SAMPLE_RATE:
+            logging.warning(
+                f"Resampling the whole mix from {audio.sample_rate} Hz at export"
+            )
+            audio = audio.resample(TARGET_SAMPLE_RATE)
+        return audio
+
     def _strip_id3_tags(self, mp3_data: bytes) -> bytes:
         """Remove ID3v1 and ID3v2 tags from MP3 data.
 
@@ -102,31 +155,4 @@ class MP3Exporter:
         Returns:
             MP3 data with all ID3 tags removed
         """
-        data = bytearray(mp3_data)
-
-        # Strip ID3v2 (at beginning)
-        while data[:3] == b"ID3":
-            # ID3v2 header: "ID3" + 2 version bytes + 1 flags byte + 4 size bytes
-            if len(data) < 10:
-                break
-
-            # Size is stored as syncsafe integer (7 bits per byte)
-            size_bytes = data[6:10]
-            size = (
-                (size_bytes[0] & 0x7F) << 21
-                | (size_bytes[1] & 0x7F) << 14
-                | (size_bytes[2] & 0x7F) << 7
-                | (size_bytes[3] & 0x7F)
-            )
-
-            # Total header size = 10 (header) + size (tag data)
-            total_size = 10 + size
-            logging.debug(f"Stripping ID3v2 tag: {total_size} bytes")
-            data = data[total_size:]
-
-        # Strip ID3v1 (at end) - always 128 bytes starting with "TAG"
-        if len(data) >= 128 and data[-128:-125] == b"TAG":
-            logging.debug("Stripping ID3v1 tag: 128 bytes")
-            data = data[:-128]
-
-        return bytes(data)
+        return ID3Stripper.strip(mp3_data)
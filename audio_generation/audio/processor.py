@@ -1,28 +1,27 @@
 """Audio processor for PCM conversion and normalization."""
 
-import io
-import logging
-import wave
+import math
 
-from pydub import AudioSegment
-from pydub.silence import detect_leading_silence as pydub_detect_silence
+import numpy as np
 
+from audio_generation.audio.buffer import MAX_AMPLITUDE, AudioBuffer
 from audio_generation.domain.constants import (
     COMFORT_NOISE_LEVEL_DB,
     GEMINI_TTS_SAMPLE_RATE,
     SEGMENT_FADE_IN_MS,
     SEGMENT_FADE_OUT_MS,
     SILENCE_BUFFER_MS,
+    SILENCE_SCAN_BLOCK_CHUNKS,
 )
 from audio_generation.domain.models import PauseConfig
 from audio_generation.audio.effects import AudioEffects
 
 
 class AudioProcessor:
-    """Handles PCM to AudioSegment conversion and normalization.
+    """Handles PCM to AudioBuffer conversion and normalization.
 
-    Provides methods for converting raw PCM data from TTS API
-    to AudioSegment objects, and normalizing audio with fades
+    Provides methods for wrapping raw PCM data from TTS API
+    in AudioBuffer objects, and normalizing audio with fades
     and comfort noise buffers.
     """
 
@@ -34,37 +33,30 @@ class AudioProcessor:
         """
         self._effects = effects or AudioEffects()
 
-    def pcm_to_segment(
+    def pcm_to_buffer(
         self, pcm_data: bytes, sample_rate: int = GEMINI_TTS_SAMPLE_RATE
-    ) -> AudioSegment:
-        """Convert raw PCM data to AudioSegment.
+    ) -> AudioBuffer:
+        """Wrap raw PCM data in an AudioBuffer without copying it.
 
         Args:
             pcm_data: Raw PCM audio (16-bit signed, mono)
             sample_rate: Source sample rate
 
         Returns:
-            AudioSegment object
+            AudioBuffer object
         """
-        wav_buffer = io.BytesIO()
-        with wave.open(wav_buffer, "wb") as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)  # 16-bit
-            wf.setframerate(sample_rate)
-            wf.writeframes(pcm_data)
-
-        wav_buffer.seek(0)
-        return AudioSegment.from_wav(wav_buffer)
+        return AudioBuffer.from_pcm(pcm_data, sample_rate)
 
     def normalize(
         self,
-        audio: AudioSegment,
+        audio: AudioBuffer,
         buffer_ms: int = SILENCE_BUFFER_MS,
         fade_in_ms: int = SEGMENT_FADE_IN_MS,
         fade_out_ms: int = SEGMENT_FADE_OUT_MS,
         use_comfort_noise: bool = True,
         comfort_noise_db: float = COMFORT_NOISE_LEVEL_DB,
-    ) -> AudioSegment:
+        noise_key: int = 0,
+    ) -> AudioBuffer:
         """Normalize segment with fades and comfort noise buffers.
 
         Processing pipeline:
@@ -79,6 +71,8 @@ class AudioProcessor:
             fade_out_ms: Fade out duration for speech end
             use_comfort_noise: Use comfort noise instead of digital silence
             comfort_noise_db: Target noise level for comfort noise
+            noise_key: Key of the comfort noise buffers (see
+                AudioEffects.generate_comfort_noise)
 
         Returns:
             Normalized audio segment with smooth edges
@@ -86,48 +80,45 @@ class AudioProcessor:
         # Detect and trim leading/trailing silence
         silence_threshold = audio.dBFS - 16 if audio.dBFS > -float("inf") else -50
 
-        # Use pydub's silence detection
-        start_trim = pydub_detect_silence(audio, silence_threshold=silence_threshold)
-        end_trim = pydub_detect_silence(
-            audio.reverse(), silence_threshold=silence_threshold
-        )
+        start_trim, end_trim = self._edge_silence(audio, silence_threshold)
 
         # Trim silence (with safety bounds)
-        duration = len(audio)
-        start_trim = min(start_trim, duration // 2)
-        end_trim = min(end_trim, duration // 2)
+        num_samples = audio.num_samples
+        start_trim = min(start_trim, num_samples // 2)
+        end_trim = min(end_trim, num_samples // 2)
 
-        if start_trim + end_trim < duration:
-            trimmed = audio[start_trim : duration - end_trim]
+        if start_trim + end_trim < num_samples:
+            trimmed = AudioBuffer(
+                audio.samples[start_trim : num_samples - end_trim], audio.sample_rate
+            )
         else:
             trimmed = audio  # Don't trim if it would remove everything
 
         # Apply fades to the speech content to prevent clicks
-        trimmed_len = len(trimmed)
+        trimmed_len = trimmed.duration_ms
         if trimmed_len > fade_in_ms + fade_out_ms:
-            trimmed = trimmed.fade_in(fade_in_ms).fade_out(fade_out_ms)
+            trimmed = trimmed.fade(fade_in_ms, fade_out_ms)
         elif trimmed_len > 20:  # Minimum viable fade
             mini_fade = max(5, trimmed_len // 4)
-            trimmed = trimmed.fade_in(mini_fade).fade_out(mini_fade)
+            trimmed = trimmed.fade(mini_fade, mini_fade)
 
         # Add buffer with comfort noise or digital silence
         if use_comfort_noise and buffer_ms > 0:
             buffer = self._effects.generate_comfort_noise(
                 buffer_ms,
                 target_db=comfort_noise_db,
-                sample_rate=audio.frame_rate,
+                sample_rate=audio.sample_rate,
                 reference_audio=audio,
+                key=noise_key,
             )
         else:
-            buffer = AudioSegment.silent(
-                duration=buffer_ms, frame_rate=audio.frame_rate
-            )
+            buffer = AudioBuffer.silent(buffer_ms, audio.sample_rate)
 
-        return buffer + trimmed + buffer
+        return buffer.concat(trimmed, buffer)
 
     def normalize_with_config(
-        self, audio: AudioSegment, config: PauseConfig
-    ) -> AudioSegment:
+        self, audio: AudioBuffer, config: PauseConfig
+    ) -> AudioBuffer:
         """Normalize segment using PauseConfig settings.
 
         Args:
@@ -145,3 +136,71 @@ class AudioProcessor:
             use_comfort_noise=config.use_comfort_noise,
             comfort_noise_db=config.comfort_noise_db,
         )
+
+    @staticmethod
+    def _edge_silence(
+        audio: AudioBuffer, silence_threshold: float, chunk_ms: int = 10
+    ) -> tuple[int, int]:
+        """Measure leading and trailing silence with a vectorized RMS envelope.
+
+        Gives the same trim points as pydub's detect_leading_silence on the
+        audio and on its reverse: chunks are aligned to each end and a chunk
+        is silent while its integer RMS is below the threshold. The trailing
+        side scans a reversed view, so no reversed copy is made.
+
+        Args:
+            audio: Audio to scan
+            silence_threshold: Level in dBFS below which a chunk is silence
+            chunk_ms: Chunk size in milliseconds
+
+        Returns:
+            Tuple of (leading, trailing) silent samples, in whole chunks
+            (a silent buffer reports its length rounded up to a chunk)
+        """
+        chunk = max(1, audio.ms_to_samples(chunk_ms))
+        # audioop.rms truncates to an integer, so a chunk is loud once its
+        # mean square reaches the square of the next integer RMS
+        min_rms = math.ceil(MAX_AMPLITUDE * 10 ** (silence_threshold / 20))
+        min_mean_square = float(min_rms) ** 2
+
+        return (
+            AudioProcessor._silent_prefix(audio.samples, chunk, min_mean_square),
+            AudioProcessor._silent_prefix(audio.samples[::-1], chunk, min_mean_square),
+        )
+
+    @staticmethod
+    def _silent_prefix(samples: np.ndarray, chunk: int, min_mean_square: float) -> int:
+        """Count the samples before the first loud chunk.
+
+        The RMS envelope is computed over blocks of chunks that double in
+        size, so the scan stops soon after the speech starts instead of
+        covering the whole segment.
+
+        Args:
+            samples: Samples to scan, starting at the edge being trimmed
+            chunk: Chunk size in samples
+            min_mean_square: Mean square at or above which a chunk is loud
+
+        Returns:
+            Number of silent samples, in whole chunks
+        """
+        num_samples = len(samples)
+        scanned = 0
+        block_chunks = SILENCE_SCAN_BLOCK_CHUNKS
+        while scanned < num_samples:
+            block = samples[scanned : scanned + block_chunks * chunk]
+            squares = np.square(block, dtype=np.float64)
+
+            full = len(block) // chunk
+            sums = squares[: full * chunk].reshape(full, chunk).sum(axis=1)
+            counts = np.full(full, chunk)
+            if len(block) % chunk:
+                sums = np.append(sums, squares[full * chunk :].sum())
+                counts = np.append(counts, len(block) % chunk)
+
+            loud = np.flatnonzero(sums >= min_mean_square * counts)
+            if len(loud):
+                return scanned + int(loud[0]) * chunk
+            scanned += len(sums) * chunk
+            block_chunks *= 2
+        return scanned
@@ -0,0 +1,123 @@
+"""Polyphase sample rate conversion with NumPy."""
+
+from functools import lru_cache
+from math import gcd
+
+import numpy as np
+
+from audio_generation.domain.constants import (
+    RESAMPLER_CUTOFF,
+    RESAMPLER_KAISER_BETA,
+    RESAMPLER_TAPS_PER_PHASE,
+)
+
+
+class PolyphaseResampler:
+    """Rational-ratio resampler using a Kaiser-windowed sinc filter.
+
+    Converting ``source_rate`` to ``target_rate`` is upsampling by ``up``,
+    low-pass filtering and downsampling by ``down`` (147/80 for 24 kHz to
+    44.1 kHz). Only the filter taps that land on real input samples are
+    evaluated. Every ``down`` input samples produce exactly ``up`` output
+    samples through the same set of polyphase branches, so the filter is
+    laid out once as an ``(up, span)`` matrix over a window of inputs, and
+    a whole segment is one matrix product with overlapping input windows
+    taken ``down`` samples apart.
+    """
+
+    def __init__(
+        self,
+        source_rate: int,
+        target_rate: int,
+        taps_per_phase: int = RESAMPLER_TAPS_PER_PHASE,
+        kaiser_beta: float = RESAMPLER_KAISER_BETA,
+        cutoff: float = RESAMPLER_CUTOFF,
+    ):
+        """Design the filter for a rate pair.
+
+        Args:
+            source_rate: Input sample rate in Hz
+            target_rate: Output sample rate in Hz
+            taps_per_phase: Filter taps per polyphase branch
+            kaiser_beta: Kaiser window shape (higher: more stopband attenuation)
+            cutoff: Passband edge as a fraction of the lower Nyquist frequency
+        """
+        divisor = gcd(source_rate, target_rate)
+        self._source_rate = source_rate
+        self._target_rate = target_rate
+        self._up = target_rate // divisor
+        self._down = source_rate // divisor
+        self._taps = taps_per_phase
+
+        # Odd-length prototype so its group delay is a whole upsampled sample
+        num_taps = self._up * taps_per_phase - 1
+        self._delay = (num_taps - 1) // 2
+        fc = 0.5 * cutoff / max(self._up, self._down)  # Cycles per sample
+        n = np.arange(num_taps) - self._delay
+        prototype = 2 * fc * np.sinc(2 * fc * n) * np.kaiser(num_taps, kaiser_beta)
+        prototype *= self._up / prototype.sum()  # Unity gain after zero-stuffing
+
+        padded = np.zeros(self._up * taps_per_phase)
+        padded[:num_taps] = prototype
+        # phases[p, i] weights input sample k - (taps - 1) + i for phase p,
+        # where k is the newest input an output sample depends on
+        phases = padded.reshape(taps_per_phase, self._up).T[:, ::-1]
+
+        # Output r of each block of `up` reads inputs from `newest[r]`
+        # onwards, relative to the block's first input
+        positions = np.arange(self._up) * self._down + self._delay
+        newest = positions // self._up
+        self._offset = int(newest[0])
+        self._span = int(newest[-1] - newest[0]) + taps_per_phase
+        self._block_filter = np.zeros((self._span, self._up), dtype=np.float32)
+        for r, (phase, start) in enumerate(zip(positions % self._up, newest)):
+            column = start - self._offset
+            self._block_filter[column : column + taps_per_phase, r] = phases[phase]
+
+    def output_length(self, num_samples: int) -> int:
+        """Number of output samples for an input length (duration rounded up)."""
+        return -(-num_samples * self._up // self._down)
+
+    def resample(self, samples: np.ndarray) -> np.ndarray:
+        """Convert 16-bit samples to the target rate.
+
+        Args:
+            samples: 16-bit mono samples at the source rate
+
+        Returns:
+            16-bit mono samples at the target rate
+        """
+        num_out = self.output_length(len(samples))
+        output = np.empty(num_out, dtype=np.int16)
+        if not num_out:
+            return output
+
+        up, down, taps = self._up, self._down, self._taps
+        num_blocks = -(-num_out // up)
+        padded = np.zeros(
+            taps
+            - 1
+            + max(len(samples), (num_blocks - 1) * down + self._offset + self._span),
+            dtype=np.float32,
+        )
+        padded[taps - 1 : taps - 1 + len(samples)] = samples
+        # Input window of each output block, overlapping, without copying
+        windows = np.lib.stride_tricks.sliding_window_view(padded, self._span)
+        windows = windows[self._offset :: down][:num_blocks]
+
+        filtered = (windows @ self._block_filter).reshape(-1)[:num_out]
+        np.rint(filtered, out=filtered)
+        np.clip(filtered, -32768, 32767, out=filtered)
+        output[:] = filtered
+        return output
+
+    @property
+    def ratio(self) -> tuple[int, int]:
+        """Get the (up, down) factors."""
+        return self._up, self._down
+
+
+@lru_cache(maxsize=8)
+def get_resampler(source_rate: int, target_rate: int) -> PolyphaseResampler:
+    """Get a shared resampler for a rate pair (filter design is cached)."""
+    return PolyphaseResampler(source_rate, target_rate)
@@ -0,0 +1,330 @@
+"""Streaming MP3 encoding through an ffmpeg pipe."""
+
+import logging
+import os
+import shutil
+import subprocess
+import threading
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+
+from audio_generation.audio.buffer import AudioBuffer
+from audio_generation.domain.constants import (
+    ENCODER_CHUNK_SAMPLES,
+    ENCODER_READ_BYTES,
+    FFMPEG_BINARY,
+    ID3V1_TAG_BYTES,
+)
+from audio_generation.domain.models import EncodedMP3
+from audio_generation.verification.mp3_verifier import FrameWalker
+
+ID3V2_HEADER_BYTES = 10
+
+
+class ID3Stripper:
+    """Removes ID3 tags from an MP3 byte stream as it passes through.
+
+    ID3v2 tags (possibly several) are dropped from the start of the stream
+    and an ID3v1 tag from its end. Only the last 128 bytes are held back
+    until the stream ends, to see whether they are an ID3v1 tag.
+    """
+
+    def __init__(self):
+        """Initialize stripper at the start of a stream."""
+        self._header = bytearray()  # Undecided bytes at the start
+        self._in_header = True
+        self._skip = 0  # Bytes of the current ID3v2 tag still to drop
+        self._held = bytearray()  # Possible ID3v1 tag at the end
+
+    @classmethod
+    def strip(cls, mp3_data: bytes) -> bytes:
+        """Remove ID3 tags from complete MP3 data.
+
+        Args:
+            mp3_data: MP3 file bytes
+
+        Returns:
+            MP3 data with all ID3 tags removed
+        """
+        stripper = cls()
+        return stripper.feed(mp3_data) + stripper.finish()
+
+    def feed(self, chunk: bytes) -> bytes:
+        """Pass the next chunk of the stream through.
+
+        Args:
+            chunk: Next bytes of the stream
+
+        Returns:
+            Bytes that are certainly not part of a tag
+        """
+        if self._skip:
+            dropped = min(self._skip, len(chunk))
+            self._skip -= dropped
+            chunk = chunk[dropped:]
+
+        if self._in_header:
+            self._header += chunk
+            chunk = self._consume_header()
+            if self._in_header:
+                return b""
+
+        self._held += chunk
+        emit = bytes(self._held[:-ID3V1_TAG_BYTES])
+        del self._held[:-ID3V1_TAG_BYTES]
+        return emit
+
+    def finish(self) -> bytes:
+        """End the stream.
+
+        Returns:
+            Remaining bytes, without a trailing ID3v1 tag
+        """
+        if self._in_header:
+            # Stream ended while undecided: e.g. a lone partial ID3v2 header
+            self._held += self._header
+            self._header.clear()
+            self._in_header = False
+
+        held, self._held = bytes(self._held), bytearray()
+        if len(held) == ID3V1_TAG_BYTES and held[:3] == b"TAG":
+            logging.debug("Stripping ID3v1 tag: 128 bytes")
+            return b""
+        return held
+
+    def _consume_header(self) -> bytes:
+        """Drop ID3v2 tags from the buffered start of the stream.
+
+        Returns:
+            Bytes after the tags, once the start is decided (else empty)
+        """
+        while True:
+            header = self._header
+            if len(header) < 3:
+                if b"ID3".startswith(bytes(header)):
+                    return b""  # Could still be a tag
+                break
+            if header[:3] != b"ID3":
+                break
+            if len(header) < ID3V2_HEADER_BYTES:
+                return b""
+
+            # Size is stored as syncsafe integer (7 bits per byte)
+            size = (
+                (header[6] & 0x7F) << 21
+                | (header[7] & 0x7F) << 14
+                | (header[8] & 0x7F) << 7
+                | (header[9] & 0x7F)
+            )
+            total_size = ID3V2_HEADER_BYTES + size
+            logging.debug(f"Stripping ID3v2 tag: {total_size} bytes")
+            if len(header) < total_size:
+                self._skip = total_size - len(header)
+                header.clear()
+                return b""
+            del header[:total_size]
+
+        self._in_header = False
+        rest = bytes(self._header)
+        self._header.clear()
+        return rest
+
+
+class StreamingMP3Encoder:
+    """Encodes audio by streaming PCM through one ffmpeg process.
+
+    PCM is written to ffmpeg's stdin in fixed-size chunks by a feeder
+    thread, while MP3 is read from its stdout, stripped of ID3 tags,
+    walked frame by frame (see FrameWalker) and written to the output file
+    as it arrives, so the file is verified without being read back.
+    Memory use is bounded by the chunk sizes, whatever the chapter length,
+    and no temporary files are created besides the partial output, which
+    replaces the target only after ffmpeg succeeds.
+
+    Each file gets its own ffmpeg process: an MP3 stream starts and ends
+    with encoder state (bit reservoir, padding frames) that can't be cut
+    cleanly out of one long-running stream. Starting ffmpeg takes tens
+    of milliseconds, next to seconds for encoding a chapter, and EncoderPool keeps
+    several files encoding at once.
+    """
+
+    def __init__(
+        self,
+        ffmpeg_path: str = FFMPEG_BINARY,
+        chunk_samples: int = ENCODER_CHUNK_SAMPLES,
+        read_bytes: int = ENCODER_READ_BYTES,
+    ):
+        """Initialize encoder.
+
+        Args:
+            ffmpeg_path: ffmpeg executable name or path
+            chunk_samples: PCM samples written per chunk
+            read_bytes: MP3 bytes read per chunk
+        """
+        self._ffmpeg_path = ffmpeg_path
+        self._chunk_samples = chunk_samples
+        self._read_bytes = read_bytes
+
+    def command(self, sample_rate: int) -> list[str]:
+        """Build the ffmpeg command line for raw mono 16-bit PCM input.
+
+        Args:
+            sample_rate: Input sample rate
+
+        Returns:
+            Command arguments
+        """
+        return [
+            self._ffmpeg_path,
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-f",
+            "s16le",
+            "-ar",
+            str(sample_rate),
+            "-ac",
+            "1",
+            "-i",
+            "pipe:0",
+            "-codec:a",
+            "libmp3lame",
+            "-id3v2_version",
+            "0",
+            "-write_id3v1",
+            "0",
+            "-f",
+            "mp3",
+            "pipe:1",
+        ]
+
+    def encode(self, audio: AudioBuffer, output_path: Path) -> EncodedMP3:
+        """Encode audio to an MP3 file without ID3 tags.
+
+        Args:
+            audio: Audio to encode (already at the output sample rate)
+            output_path: Output file path
+
+        Returns:
+            Summary of the written file
+
+        Raises:
+            RuntimeError: If ffmpeg is missing or fails
+        """
+        samples = np.ascontiguousarray(audio.samples, dtype="<i2")
+        chunks = (
+            samples[start : start + self._chunk_samples]
+            for start in range(0, len(samples), self._chunk_samples)
+        )
+        return self.encode_stream(chunks, audio.sample_rate, output_path)
+
+    def encode_stream(
+        self, chunks: Iterable[np.ndarray], sample_rate: int, output_path: Path
+    ) -> EncodedMP3:
+        """Encode 16-bit mono sample chunks to an MP3 file without ID3 tags.
+
+        Chunks are pulled by the feeder thread as ffmpeg consumes them, so
+        a lazy iterable (e.g. audio being mixed) is produced concurrently
+        with encoding and never held in memory as a whole.
+
+        Args:
+            chunks: Sample chunks in playback order
+            sample_rate: Sample rate of the chunks
+            output_path: Output file path
+
+        Returns:
+            Summary of the written file, with its format verification
+
+        Raises:
+            RuntimeError: If ffmpeg is missing or fails
+            Exception: Whatever producing the chunks or writing the file
+                raised (no file is written then)
+        """
+        if shutil.which(self._ffmpeg_path) is None:
+            raise RuntimeError(f"MP3 encoder not found: {self._ffmpeg_path}")
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        partial_path = output_path.with_name(output_path.name + ".part")
+        process = subprocess.Popen(
+            self.command(sample_rate),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        errors: list[bytes] = []
+        fed: list[int] = []  # Samples written per chunk
+        failures: list[BaseException] = []  # Raised while producing chunks
+        feeder = threading.Thread(
+            target=self._feed, args=(process, chunks, fed, failures)
+        )
+        drainer = threading.Thread(target=lambda: errors.append(process.stderr.read()))
+        feeder.start()
+        drainer.start()
+
+        stripper = ID3Stripper()
+        walker = FrameWalker()
+        size = 0
+        try:
+            with open(partial_path, "wb") as f:
+                while chunk := process.stdout.read(self._read_bytes):
+                    data = stripper.feed(chunk)
+                    walker.feed(data)
+                    size += f.write(data)
+                data = stripper.finish()
+                walker.feed(data)
+                size += f.write(data)
+        except BaseException:
+            process.kill()
+            partial_path.unlink(missing_ok=True)
+            raise
+        finally:
+            process.stdout.close()
+            returncode = process.wait()
+            feeder.join()
+            drainer.join()
+
+        if failures:
+            partial_path.unlink(missing_ok=True)
+            raise failures[0]
+        if returncode != 0:
+            partial_path.unlink(missing_ok=True)
+            message = b"".join(errors).decode("utf-8", "replace").strip()
+            raise RuntimeError(f"ffmpeg exited with code {returncode}: {message}")
+
+        os.replace(partial_path, output_path)
+        duration_ms = sum(fed) * 1000 // sample_rate
+        logging.info(f"Exported audio to: {output_path}")
+        logging.info(f"Total duration: {duration_ms}ms, File size: {size:,} bytes")
+        return EncodedMP3(
+            output_path=output_path, size_bytes=size, verification=walker.finish()
+        )
+
+    def _feed(
+        self,
+        process: subprocess.Popen,
+        chunks: Iterable[np.ndarray],
+        fed: list[int],
+        failures: list[BaseException],
+    ) -> None:
+        """Write sample chunks to ffmpeg's stdin, then close it.
+
+        If producing a chunk fails, ffmpeg is killed so the partial output
+        is never mistaken for a complete file.
+        """
+        try:
+            for chunk in chunks:
+                chunk = np.ascontiguousarray(chunk, dtype="<i2")
+                process.stdin.write(memoryview(chunk).cast("B"))
+                fed.append(len(chunk))
+        except BrokenPipeError:
+            pass  # ffmpeg exited early; its exit code reports the failure
+        except BaseException as e:
+            failures.append(e)
+            process.kill()
+        finally:
+            try:
+                process.stdin.close()
+            except BrokenPipeError:
+                pass
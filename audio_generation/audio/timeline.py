@@ -0,0 +1,155 @@
+"""Single-pass timeline mixer for crossfaded audio."""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from audio_generation.audio.buffer import AudioBuffer
+from audio_generation.audio.effects import AudioEffects
+from audio_generation.domain.constants import CROSSFADE_MS, TARGET_SAMPLE_RATE
+
+MIN_CROSSFADE_MS = 10  # Shorter overlaps are joined without a crossfade
+
+
+@dataclass
+class TimelineClip:
+    """A clip placed on the timeline.
+
+    Attributes:
+        samples: 16-bit mono samples of the clip
+        start: Offset of the clip's first sample in the output
+        overlap: Samples at the clip's start crossfaded with what precedes it
+    """
+
+    samples: np.ndarray
+    start: int
+    overlap: int
+
+
+class Timeline:
+    """Places clips end to end with crossfades, then mixes them in one pass.
+
+    Appending a clip only computes where it goes: it starts ``overlap``
+    samples before the current end of the timeline, where the overlap is
+    the crossfade length capped by both sides' lengths. Rendering allocates
+    the output once and walks the clips in order, copying each clip and
+    blending its overlap with the samples already written. This matches
+    joining the clips one by one with AudioEffects.apply_crossfade, without
+    re-copying the accumulated audio on every join.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = TARGET_SAMPLE_RATE,
+        crossfade_ms: int = CROSSFADE_MS,
+        curve_type: str = "logarithmic",
+    ):
+        """Initialize an empty timeline.
+
+        Args:
+            sample_rate: Sample rate of the output (clips are converted to it)
+            crossfade_ms: Crossfade duration between consecutive clips
+            curve_type: Crossfade curve (see AudioEffects.apply_crossfade)
+        """
+        self._sample_rate = sample_rate
+        self._crossfade = int(sample_rate * crossfade_ms / 1000)
+        self._min_crossfade = int(sample_rate * MIN_CROSSFADE_MS / 1000)
+        self._curve_type = curve_type
+        self._clips: list[TimelineClip] = []
+        self._length = 0
+
+    def append(self, samples: np.ndarray) -> TimelineClip:
+        """Place 16-bit mono samples after the current end, crossfaded.
+
+        Args:
+            samples: Samples at the timeline's sample rate
+
+        Returns:
+            The placed clip
+        """
+        overlap = min(self._crossfade, self._length, len(samples))
+        if overlap < self._min_crossfade:
+            overlap = 0
+
+        clip = TimelineClip(
+            samples=samples, start=self._length - overlap, overlap=overlap
+        )
+        self._clips.append(clip)
+        self._length = clip.start + len(samples)
+        return clip
+
+    def append_buffer(self, audio: AudioBuffer) -> TimelineClip:
+        """Place an AudioBuffer, resampling it to the timeline rate.
+
+        Args:
+            audio: Audio to place
+
+        Returns:
+            The placed clip
+        """
+        return self.append(audio.resample(self._sample_rate).samples)
+
+    def append_silence(self, duration_ms: int) -> TimelineClip:
+        """Place digital silence.
+
+        Args:
+            duration_ms: Duration in milliseconds
+
+        Returns:
+            The placed clip
+        """
+        num_samples = int(self._sample_rate * duration_ms / 1000)
+        return self.append(np.zeros(num_samples, dtype=np.int16))
+
+    def render(self) -> np.ndarray:
+        """Mix every clip into one preallocated buffer.
+
+        Returns:
+            16-bit mono samples of the whole timeline
+        """
+        output = np.empty(self._length, dtype=np.int16)
+        for clip in self._clips:
+            start, overlap = clip.start, clip.overlap
+            if overlap:
+                region = output[start : start + overlap]
+                AudioEffects.mix_crossfade(
+                    region, clip.samples[:overlap], region, self._curve_type
+                )
+            output[start + overlap : start + len(clip.samples)] = clip.samples[overlap:]
+        return output
+
+    def flush(self) -> np.ndarray:
+        """Mix and remove the samples no later clip can overlap.
+
+        The next clip overlaps at most one crossfade before the current
+        end, so everything before that is final. Only that last crossfade
+        of mixed audio is kept, which bounds memory when clips are
+        appended and flushed one at a time; the concatenated flushes plus
+        a final render equal rendering everything at once.
+
+        Returns:
+            16-bit mono samples that are final
+        """
+        output = self.render()
+        ready = max(0, len(output) - self._crossfade)
+        tail = output[ready:].copy()
+        self._clips = [TimelineClip(samples=tail, start=0, overlap=0)]
+        self._length = len(tail)
+        return output[:ready]
+
+    def to_buffer(self) -> AudioBuffer:
+        """Render the timeline as an AudioBuffer.
+
+        Returns:
+            Buffer at the timeline's sample rate
+        """
+        return AudioBuffer(self.render(), self._sample_rate)
+
+    @property
+    def sample_rate(self) -> int:
+        """Get the output sample rate."""
+        return self._sample_rate
+
+    def __len__(self) -> int:
+        """Length of the timeline in samples."""
+        return self._length
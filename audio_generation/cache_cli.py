@@ -0,0 +1,99 @@
+"""Command-line interface for inspecting and maintaining the TTS cache."""
+
+import argparse
+from pathlib import Path
+
+from audio_generation.caching.pcm_codec import PCMCodec
+from audio_generation.caching.tts_cache import TTSResponseCache
+from audio_generation.cli import add_pcm_compression_argument
+from audio_generation.domain.constants import TTS_CACHE_DIR, TTS_CACHE_MAX_BYTES
+from audio_generation.utils.logging import setup_logging
+
+
+def format_size(num_bytes: int) -> str:
+    """Format a byte count for display.
+
+    Args:
+        num_bytes: Size in bytes
+
+    Returns:
+        Human-readable size (e.g. "12.3 MiB")
+    """
+    size = float(num_bytes)
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def main() -> None:
+    """Main entry point for cache CLI."""
+    parser = argparse.ArgumentParser(
+        description="Inspect and maintain the persistent TTS response cache",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python -m audio_generation.cache_cli stats
+  python -m audio_generation.cache_cli prune --max-size-mb 500
+  python -m audio_generation.cache_cli recompress --pcm-compression fast
+  python -m audio_generation.cache_cli clear
+        """,
+    )
+    parser.add_argument(
+        "command",
+        choices=["stats", "prune", "recompress", "clear"],
+        help="stats: show usage; prune: evict LRU entries; recompress: rewrite "
+        "entries at --pcm-compression; clear: remove all",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=Path(TTS_CACHE_DIR).expanduser(),
+        help=f"TTS response cache directory (default: {TTS_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--max-size-mb",
+        type=float,
+        default=TTS_CACHE_MAX_BYTES / 1024**2,
+        help="Size limit for prune, in MiB (default: configured cache limit)",
+    )
+    add_pcm_compression_argument(parser)
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Enable debug logging",
+    )
+
+    args = parser.parse_args()
+    setup_logging(args.debug)
+
+    max_bytes = int(args.max_size_mb * 1024**2)
+    cache = TTSResponseCache(
+        args.cache_dir, max_bytes=max_bytes, codec=PCMCodec(args.pcm_compression)
+    )
+
+    if args.command == "stats":
+        stats = cache.stats()
+        print(f"Cache directory: {cache.cache_dir}")
+        print(f"Entries:         {stats.entries}")
+        print(
+            f"Size:            {format_size(stats.total_bytes)} "
+            f"of {format_size(stats.max_bytes)}"
+        )
+    elif args.command == "prune":
+        removed = cache.prune()
+        print(f"Evicted {removed} entries from {cache.cache_dir}")
+    elif args.command == "recompress":
+        rewritten = cache.recompress()
+        print(
+            f"Rewrote {rewritten} entries as {args.pcm_compression} "
+            f"in {cache.cache_dir}"
+        )
+    else:
+        removed = cache.clear()
+        print(f"Removed {removed} entries from {cache.cache_dir}")
+
+
+if __name__ == "__main__":
+    main()
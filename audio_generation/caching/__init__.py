@@ -0,0 +1,6 @@
+"""TTS response caching module."""
+
+from audio_generation.caching.pcm_codec import PCMCodec
+from audio_generation.caching.tts_cache import TTSResponseCache
+
+__all__ = ["PCMCodec", "TTSResponseCache"]
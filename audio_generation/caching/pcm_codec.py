@@ -0,0 +1,137 @@
+"""Lossless compression of 16-bit PCM for on-disk storage."""
+
+import lzma
+import struct
+import zlib
+
+import numpy as np
+
+from audio_generation.domain.constants import PCM_COMPRESSION_LEVEL
+
+# Magic, method and decoded length in front of every compressed payload
+HEADER = struct.Struct("<4sBQ")
+MAGIC = b"PCMz"
+
+METHOD_ZLIB = 1
+METHOD_LZMA = 2
+
+# Level name to (method, method setting); "none" stores PCM as is
+LEVELS: dict[str, tuple[int, int] | None] = {
+    "none": None,
+    "fast": (METHOD_ZLIB, 1),
+    "small": (METHOD_LZMA, 6),
+}
+
+
+class PCMCodec:
+    """Compresses speech PCM with a delta filter and a stdlib compressor.
+
+    Consecutive speech samples are close, so each sample is replaced by
+    its difference from the previous one (wrapping at 16 bits, hence
+    exactly reversible). The low and high bytes of the differences are
+    then stored as two planes: the high plane is mostly 0x00 and 0xFF and
+    compresses very well. "fast" runs zlib at level 1 over the planes,
+    "small" runs LZMA for a better ratio at a much slower encode.
+
+    Compressed data starts with a short header; data without it is
+    returned as is by decode, so entries written before compression (or
+    with level "none") stay readable.
+    """
+
+    def __init__(self, level: str = PCM_COMPRESSION_LEVEL):
+        """Initialize codec.
+
+        Args:
+            level: Compression level name (one of LEVELS)
+
+        Raises:
+            ValueError: If the level is unknown
+        """
+        if level not in LEVELS:
+            raise ValueError(
+                f"Unknown PCM compression level: {level} "
+                f"(expected one of {', '.join(LEVELS)})"
+            )
+        self._level = level
+
+    @property
+    def level(self) -> str:
+        """Get the compression level name."""
+        return self._level
+
+    def encode(self, pcm_data: bytes) -> bytes:
+        """Compress PCM for storage.
+
+        Args:
+            pcm_data: Raw PCM audio (16-bit signed little-endian, mono)
+
+        Returns:
+            Compressed data, or pcm_data unchanged for level "none" and
+            for data that is not whole samples
+        """
+        setting = LEVELS[self._level]
+        if setting is None or len(pcm_data) % 2:
+            return pcm_data
+
+        method, value = setting
+        planes = _delta_planes(pcm_data)
+        if method == METHOD_ZLIB:
+            payload = zlib.compress(planes, value)
+        else:
+            payload = lzma.compress(planes, preset=value)
+        return HEADER.pack(MAGIC, method, len(pcm_data)) + payload
+
+    @staticmethod
+    def decode(data: bytes | memoryview) -> bytes | memoryview:
+        """Restore PCM stored by encode (any level).
+
+        Args:
+            data: Stored data
+
+        Returns:
+            Raw PCM audio (data itself when it was stored uncompressed)
+
+        Raises:
+            ValueError: If compressed data is corrupt
+        """
+        if len(data) < HEADER.size or bytes(data[:4]) != MAGIC:
+            return data
+
+        _, method, length = HEADER.unpack_from(data)
+        payload = data[HEADER.size :]
+        try:
+            if method == METHOD_ZLIB:
+                planes = zlib.decompress(payload)
+            elif method == METHOD_LZMA:
+                planes = lzma.decompress(payload)
+            else:
+                raise ValueError(f"Unknown PCM compression method: {method}")
+        except (zlib.error, lzma.LZMAError) as e:
+            raise ValueError(f"Corrupt compressed PCM: {e}") from e
+
+        if len(planes) != length:
+            raise ValueError(
+                f"Corrupt compressed PCM: {len(planes)} bytes, expected {length}"
+            )
+        return _undo_delta_planes(planes)
+
+
+def _delta_planes(pcm_data: bytes) -> bytes:
+    """Delta-filter samples and split them into low and high byte planes."""
+    samples = np.frombuffer(pcm_data, dtype="<u2")
+    deltas = np.empty_like(samples)
+    deltas[:1] = samples[:1]
+    np.subtract(samples[1:], samples[:-1], out=deltas[1:])  # Wraps at 16 bits
+    return deltas.view(np.uint8).reshape(-1, 2).T.tobytes()
+
+
+def _undo_delta_planes(planes: bytes) -> bytes:
+    """Interleave byte planes and integrate the deltas back into samples."""
+    plane_bytes = np.frombuffer(planes, dtype=np.uint8)
+    count = len(plane_bytes) // 2
+    samples = np.empty(count, dtype="<u2")
+    interleaved = samples.view(np.uint8)
+    interleaved[0::2] = plane_bytes[:count]
+    interleaved[1::2] = plane_bytes[count:]
+    np.cumsum(samples, dtype=np.uint16, out=samples)
+    return samples.tobytes()
@@ -0,0 +1,264 @@
+"""Content-addressed on-disk cache of TTS responses."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from google.genai import types
+
+from audio_generation.caching.pcm_codec import PCMCodec
+from audio_generation.domain.constants import TTS_CACHE_DIR, TTS_CACHE_MAX_BYTES
+from audio_generation.domain.models import CacheStats
+
+CACHE_FILE_SUFFIX = ".pcm"
+
+
+class TTSResponseCache:
+    """Persistent cache of synthesized PCM keyed by request content.
+
+    The key is a SHA-256 of everything that determines the audio: model,
+    system instruction, prompt and speech config. Anything downstream of
+    synthesis (pauses, crossfades, export settings) is not part of the key,
+    so re-rendering with different audio post-processing costs no API calls.
+
+    Entries are stored one file per response under a two-level fan-out
+    directory, compressed by a PCMCodec (sizes are on-disk sizes). Reads
+    refresh the file's mtime, and writes evict the least recently used
+    entries once the cache exceeds ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        max_bytes: int = TTS_CACHE_MAX_BYTES,
+        codec: PCMCodec | None = None,
+    ):
+        """Initialize cache.
+
+        Args:
+            cache_dir: Cache directory (defaults to TTS_CACHE_DIR)
+            max_bytes: Total size above which old entries are evicted
+            codec: Compression of stored entries (defaults to PCMCodec())
+        """
+        self._cache_dir = cache_dir or Path(TTS_CACHE_DIR).expanduser()
+        self._max_bytes = max_bytes
+        self._codec = codec or PCMCodec()
+        self._lock = threading.Lock()
+        self._total_bytes: int | None = None  # Computed lazily on first write
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def make_key(
+        model: str,
+        system_instruction: str,
+        prompt: str,
+        speech_config: types.SpeechConfig,
+    ) -> str:
+        """Build the content hash identifying a TTS request.
+
+        Args:
+            model: TTS model name
+            system_instruction: System instruction sent with the request
+            prompt: Prompt from TTSPromptBuilder.build
+            speech_config: Voice settings from SpeechConfigBuilder.build_for_batch
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        payload = {
+            "model": model,
+            "system_instruction": system_instruction,
+            "prompt": prompt,
+            "speech_config": speech_config.model_dump(mode="json", exclude_none=True),
+        }
+        encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> bytes | None:
+        """Look up cached audio.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            Raw PCM audio data, or None on a miss
+        """
+        path = self._path_for(key)
+        try:
+            data = self._codec.decode(path.read_bytes())
+        except FileNotFoundError:
+            with self._lock:
+                self._misses += 1
+            return None
+        except ValueError as e:
+            logging.warning(f"Dropping unreadable TTS cache entry {key[:12]}: {e}")
+            path.unlink(missing_ok=True)
+            with self._lock:
+                self._misses += 1
+            return None
+
+        # Refresh recency for LRU eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        with self._lock:
+            self._hits += 1
+        logging.debug(f"TTS cache hit: {key[:12]} ({len(data):,} bytes)")
+        return data
+
+    def put(self, key: str, audio_data: bytes) -> None:
+        """Store audio for a request, evicting old entries if over the limit.
+
+        Args:
+            key: Key from make_key
+            audio_data: Raw PCM audio data
+        """
+        path = self._path_for(key)
+        if path.exists():
+            return  # Content-addressed: an existing entry is already correct
+        path.parent.mkdir(parents=True, exist_ok=True)
+        stored = self._codec.encode(audio_data)
+        self._write(path, stored)
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_total_bytes()
+            else:
+                self._total_bytes += len(stored)
+            over_limit = self._total_bytes > self._max_bytes
+
+        if over_limit:
+            self.prune()
+
+    def prune(self, max_bytes: int | None = None) -> int:
+        """Evict least recently used entries until the cache fits.
+
+        Args:
+            max_bytes: Size to shrink to (defaults to the configured limit)
+
+        Returns:
+            Number of entries removed
+        """
+        limit = self._max_bytes if max_bytes is None else max_bytes
+        entries = sorted(self._scan_entries(), key=lambda e: e[1])
+        total = sum(size for _, _, size in entries)
+
+        removed = 0
+        for path, _, size in entries:
+            if total <= limit:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            total -= size
+            removed += 1
+
+        with self._lock:
+            self._total_bytes = total
+
+        if removed:
+            logging.debug(f"TTS cache evicted {removed} entries ({total:,} bytes left)")
+        return removed
+
+    def recompress(self) -> int:
+        """Rewrite every entry stored at another compression level.
+
+        Entries keep their recency, so eviction order is unchanged.
+        Unreadable entries are removed.
+
+        Returns:
+            Number of entries rewritten
+        """
+        rewritten = 0
+        for path, mtime, _ in self._scan_entries():
+            try:
+                stored = path.read_bytes()
+                audio_data = bytes(self._codec.decode(stored))
+            except FileNotFoundError:
+                continue
+            except ValueError as e:
+                logging.warning(f"Dropping unreadable TTS cache entry {path.name}: {e}")
+                path.unlink(missing_ok=True)
+                continue
+
+            encoded = self._codec.encode(audio_data)
+            if encoded == stored:
+                continue
+            self._write(path, encoded)
+            os.utime(path, (mtime, mtime))
+            rewritten += 1
+
+        with self._lock:
+            self._total_bytes = None  # Rescanned on the next write
+        return rewritten
+
+    def clear(self) -> int:
+        """Remove every cached response.
+
+        Returns:
+            Number of entries removed
+        """
+        return self.prune(max_bytes=0)
+
+    def stats(self) -> CacheStats:
+        """Report on-disk usage and this process's hit/miss counts.
+
+        Returns:
+            CacheStats snapshot
+        """
+        entries = self._scan_entries()
+        with self._lock:
+            return CacheStats(
+                entries=len(entries),
+                total_bytes=sum(size for _, _, size in entries),
+                max_bytes=self._max_bytes,
+                hits=self._hits,
+                misses=self._misses,
+            )
+
+    @property
+    def cache_dir(self) -> Path:
+        """Get the cache directory."""
+        return self._cache_dir
+
+    def _path_for(self, key: str) -> Path:
+        """Map a key to its file path (two-level fan-out)."""
+        return self._cache_dir / key[:2] / f"{key}{CACHE_FILE_SUFFIX}"
+
+    @staticmethod
+    def _write(path: Path, stored: bytes) -> None:
+        """Write an entry atomically, so concurrent readers never see it partial."""
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(stored)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _scan_entries(self) -> list[tuple[Path, float, int]]:
+        """List cached files as (path, mtime, size) tuples."""
+        if not self._cache_dir.exists():
+            return []
+
+        entries = []
+        for path in self._cache_dir.glob(f"*/*{CACHE_FILE_SUFFIX}"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((path, st.st_mtime, st.st_size))
+        return entries
+
+    def _scan_total_bytes(self) -> int:
+        """Sum the size of all cached files."""
+        return sum(size for _, _, size in self._scan_entries())
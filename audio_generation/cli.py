@@ -6,9 +6,29 @@ import os
 import sys
 from pathlib import Path
 
-from audio_generation.domain.constants import AVAILABLE_VOICES
+from audio_generation.caching.pcm_codec import LEVELS, PCMCodec
+from audio_generation.caching.tts_cache import TTSResponseCache
+from audio_generation.domain.constants import (
+    ADAPTIVE_MAX_RPM,
+    AVAILABLE_VOICES,
+    DEFAULT_REQUESTS_PER_MINUTE,
+    MAX_CONCURRENT_REQUESTS,
+    PCM_COMPRESSION_LEVEL,
+    RATE_STATE_FILE,
+    TTS_CACHE_DIR,
+)
 from audio_generation.orchestrator import AudioGenerationPipeline
+from audio_generation.parsing.parse_cache import ParseCache
+from audio_generation.parsing.script_parser import AudioScriptParser
 from audio_generation.progress.progress_manager import ProgressManager
+from audio_generation.scheduling.rate_limiter import (
+    AdaptiveRateLimiter,
+    AIMDPolicy,
+    RateLimiter,
+    TokenBucketRateLimiter,
+)
+from audio_generation.scheduling.rate_state import RateStateStore
+from audio_generation.scheduling.shared_limiter import SharedRateLimiter
 from audio_generation.tts.client import TTSClient
 from audio_generation.utils.logging import setup_logging
 
@@ -52,6 +72,156 @@ def print_progress(current: int, total: int) -> None:
         print()  # Newline at completion
 
 
+def add_scheduling_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the concurrency, rate limit and cache options shared by CLIs.
+
+    Args:
+        parser: Parser to extend
+    """
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=MAX_CONCURRENT_REQUESTS,
+        help=(
+            "Maximum TTS requests in flight at once "
+            f"(default: {MAX_CONCURRENT_REQUESTS})"
+        ),
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=Path(TTS_CACHE_DIR).expanduser(),
+        help=f"TTS response cache directory (default: {TTS_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the TTS API, ignoring cached responses",
+    )
+    add_pcm_compression_argument(parser)
+    parser.add_argument(
+        "--rpm",
+        type=float,
+        help=(
+            "Starting TTS requests per minute (default: rate learned for this "
+            f"project/region/model, else {DEFAULT_REQUESTS_PER_MINUTE})"
+        ),
+    )
+    parser.add_argument(
+        "--max-rpm",
+        type=float,
+        default=ADAPTIVE_MAX_RPM,
+        help=f"Upper bound for the adaptive rate (default: {ADAPTIVE_MAX_RPM:g})",
+    )
+    parser.add_argument(
+        "--fixed-rpm",
+        action="store_true",
+        help="Keep the request rate fixed instead of adapting to quota errors",
+    )
+    parser.add_argument(
+        "--no-shared-quota",
+        action="store_true",
+        help="Rate-limit this process alone instead of sharing the quota "
+        "with other running generations",
+    )
+    parser.add_argument(
+        "--rate-state",
+        type=Path,
+        default=Path(RATE_STATE_FILE).expanduser(),
+        help=f"File storing learned request rates (default: {RATE_STATE_FILE})",
+    )
+
+
+def add_pcm_compression_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the option selecting how cached and saved batch PCM is stored.
+
+    Args:
+        parser: Parser to extend
+    """
+    parser.add_argument(
+        "--pcm-compression",
+        choices=list(LEVELS),
+        default=PCM_COMPRESSION_LEVEL,
+        help="Lossless compression of cached and saved batch audio: none "
+        "(fastest resume), fast (zlib, about half the disk) or small (LZMA, "
+        f"slowest) (default: {PCM_COMPRESSION_LEVEL})",
+    )
+
+
+def validate_scheduling_arguments(args: argparse.Namespace) -> None:
+    """Exit with an error if scheduling options are out of range.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Raises:
+        SystemExit: If an option is invalid
+    """
+    if args.concurrency < 1:
+        logging.error("--concurrency must be at least 1")
+        sys.exit(1)
+    if args.rpm is not None and args.rpm <= 0:
+        logging.error("--rpm must be positive")
+        sys.exit(1)
+    if args.max_rpm <= 0:
+        logging.error("--max-rpm must be positive")
+        sys.exit(1)
+
+
+def build_rate_limiter(
+    args: argparse.Namespace, project: str, location: str, model: str
+) -> RateLimiter:
+    """Create the rate limiter selected by the command-line options.
+
+    By default the limiter is shared with every other process generating
+    against the same project/region/model, through a coordination file, so
+    parallel CLI runs split one quota. The adaptive limiters start from
+    ``--rpm`` when given, otherwise from the rate learned on previous runs.
+
+    Args:
+        args: Parsed command-line arguments
+        project: Google Cloud project ID
+        location: Google Cloud region
+        model: TTS model name
+
+    Returns:
+        Configured rate limiter
+    """
+    state = RateStateStore(args.rate_state)
+    state_key = state.make_key(project, location, model)
+    rpm = args.rpm
+    if rpm is None and not args.fixed_rpm:
+        rpm = state.load(state_key)
+        if rpm is not None:
+            logging.info(f"Starting from learned rate: {rpm:.1f} rpm")
+    if rpm is None:
+        rpm = DEFAULT_REQUESTS_PER_MINUTE
+
+    if not args.no_shared_quota:
+        limiter = SharedRateLimiter(
+            SharedRateLimiter.path_for(state_key),
+            requests_per_minute=rpm,
+            policy=(
+                None if args.fixed_rpm else AIMDPolicy(max_rpm=max(args.max_rpm, rpm))
+            ),
+            state=None if args.fixed_rpm else state,
+            state_key=state_key,
+        )
+        if args.rpm is not None:
+            limiter.set_rate(args.rpm)
+        logging.info(f"Sharing TTS quota through {limiter.path}")
+        return limiter
+
+    if args.fixed_rpm:
+        return TokenBucketRateLimiter(requests_per_minute=rpm)
+    return AdaptiveRateLimiter(
+        requests_per_minute=rpm,
+        max_rpm=max(args.max_rpm, rpm),
+        state=state,
+        state_key=state_key,
+    )
+
+
 def main() -> None:
     """Main entry point for CLI."""
     parser = argparse.ArgumentParser(
@@ -63,6 +233,8 @@ Examples:
   python -m audio_generation.cli script.md -o output.mp3 --voice Puck
   python -m audio_generation.cli script.md -o output.mp3 --debug --no-verify
   python -m audio_generation.cli script.md -o output.mp3 --resume
+  python -m audio_generation.cli script.md -o output.mp3 --concurrency 8 --rpm 30
+  python -m audio_generation.cli script.md -o output.mp3 --fixed-rpm --rpm 10
 
 Prerequisites:
    1. Google Cloud project with Vertex AI API enabled
@@ -117,6 +289,13 @@ Output Format:
         action="store_true",
         help="Resume from saved progress (use after rate limit or other failure)",
     )
+    parser.add_argument(
+        "--low-memory",
+        action="store_true",
+        help="Keep batch audio on disk and mix it straight into the encoder "
+        "(memory bounded by one batch, for long scripts on small machines)",
+    )
+    add_scheduling_arguments(parser)
 
     args = parser.parse_args()
 
@@ -128,6 +307,8 @@ Output Format:
         logging.error(f"Input file not found: {args.input}")
         sys.exit(1)
 
+    validate_scheduling_arguments(args)
+
     # Ensure output has .mp3 extension
     output_path: Path = args.output
     if output_path.suffix.lower() != ".mp3":
@@ -142,10 +323,14 @@ Output Format:
         )
 
         # Create pipeline with dependencies
-        pipeline = AudioGenerationPipeline()
+        pipeline = AudioGenerationPipeline(
+            parser=AudioScriptParser(cache=ParseCache()),
+            low_memory=args.low_memory,
+        )
 
-        # Parse script first to get model
-        script = pipeline.parse_script(args.input)
+        # Parse and batch once, to get the model and apply overrides
+        prepared = pipeline.prepare(args.input)
+        script = prepared.script
 
         # Override voice if specified
         if args.voice:
@@ -157,29 +342,45 @@ Output Format:
                 cfg.voice = args.voice
             logging.info(f"Voice override: {args.voice}")
 
-        # Configure TTS client
+        # Configure TTS client with a shared requests-per-minute budget
+        rate_limiter = build_rate_limiter(args, project, location, script.tts_model)
+        codec = PCMCodec(args.pcm_compression)
+        cache = None if args.no_cache else TTSResponseCache(args.cache_dir, codec=codec)
         tts_client = TTSClient(
-            project=project, location=location, model=script.tts_model
+            project=project,
+            location=location,
+            model=script.tts_model,
+            rate_limiter=rate_limiter,
+            cache=cache,
         )
         pipeline.set_tts_client(tts_client)
 
         # Configure progress manager
-        progress_manager = ProgressManager(output_path.parent)
+        progress_manager = ProgressManager(output_path.parent, codec=codec)
         pipeline.set_progress_manager(progress_manager)
 
         # Execute pipeline
         progress_callback = None if args.no_progress else print_progress
 
-        mp3_data = pipeline.execute(
+        encoded = pipeline.execute(
             input_file=args.input,
             output_path=output_path,
             resume=args.resume,
             verify=not args.no_verify,
             progress_callback=progress_callback,
+            max_concurrency=args.concurrency,
+            prepared=prepared,
         )
 
         logging.info(f"Audio saved to: {output_path}")
-        logging.info(f"File size: {len(mp3_data):,} bytes")
+        logging.info(f"File size: {encoded.size_bytes:,} bytes")
+        if cache is not None:
+            stats = cache.stats()
+            logging.info(f"TTS cache: {stats.hits} hits, {stats.misses} API calls")
+        if not args.fixed_rpm:
+            logging.info(
+                f"TTS request rate: {rate_limiter.requests_per_minute:.1f} rpm"
+            )
 
     except Exception as e:
         logging.error(f"Failed to generate audio: {e}")
@@ -11,9 +11,15 @@ class CharacterLoader:
     """Loads character profiles from story character JSON files.
 
     Discovers character JSON files by walking upward from the audio-script
-    path to find the nearest ``src/characters/`` directory.
+    path to find the nearest ``src/characters/`` directory. Profiles are
+    loaded once per directory and reused for every script that shares it,
+    so one loader can serve a whole story pack.
     """
 
+    def __init__(self):
+        """Initialize loader with an empty per-directory cache."""
+        self._cache: dict[Path, dict[str, CharacterProfile]] = {}
+
     def load_for_script(self, script_path: Path) -> dict[str, CharacterProfile]:
         """Discover and load character profiles relative to an audio-script.
 
@@ -40,7 +46,9 @@ class CharacterLoader:
             logging.debug(f"No characters directory found for script: {script_path}")
             return {}
 
-        return self._load_from_directory(characters_dir)
+        if characters_dir not in self._cache:
+            self._cache[characters_dir] = self._load_from_directory(characters_dir)
+        return dict(self._cache[characters_dir])
 
     def _find_characters_dir(self, script_path: Path) -> Path | None:
         """Walk upward from script path to find src/characters/ directory.
@@ -6,6 +6,9 @@
 
 GEMINI_TTS_SAMPLE_RATE = 24000  # Gemini TTS outputs 24kHz
 TARGET_SAMPLE_RATE = 44100  # Required output sample rate
+RESAMPLER_TAPS_PER_PHASE = 48  # Filter taps per polyphase branch (flat to ~9.5 kHz)
+RESAMPLER_KAISER_BETA = 8.6  # Kaiser window shape (~90 dB stopband)
+RESAMPLER_CUTOFF = 0.9  # Passband edge as a fraction of the lower Nyquist
 TARGET_CHANNELS = 1  # Mono
 
 # =============================================================================
@@ -24,6 +27,31 @@ INTER_SEGMENT_PAUSE_MS = 500  # Default pause between segments (fallback)
 API_CALL_DELAY_SEC = 6  # 6 seconds between calls (10 RPM limit)
 MAX_RETRIES = 3  # Retry count per segment
 
+# =============================================================================
+# Request Scheduling
+# =============================================================================
+
+DEFAULT_REQUESTS_PER_MINUTE = 10  # Vertex AI TTS quota (same as API_CALL_DELAY_SEC)
+MAX_CONCURRENT_REQUESTS = 4  # TTS requests kept in flight by the CLI
+TTS_REQUEST_TIMEOUT_SEC = 120  # Per-attempt timeout for async TTS requests
+STAGE_QUEUE_SIZE = 2  # Chapters buffered between pipeline stages (backpressure)
+FETCH_STAGE_WORKERS = 4  # Chapters synthesizing at once in a staged build
+RETRY_BACKOFF_BASE_SEC = 1.0  # First retry delay for non-quota errors (doubles)
+RETRY_BACKOFF_MAX_SEC = 60.0  # Upper bound on a single retry delay
+MAX_THROTTLE_RETRIES = 8  # Quota rejections tolerated per request
+
+# =============================================================================
+# Adaptive Rate Control (AIMD)
+# =============================================================================
+
+ADAPTIVE_MIN_RPM = 1.0  # Never throttle below one request per minute
+ADAPTIVE_MAX_RPM = 120.0  # Upper bound while probing for more capacity
+AIMD_INCREASE_RPM = 1.0  # Rate gained per minute of successful requests
+AIMD_DECREASE_FACTOR = 0.5  # Rate multiplier applied on a quota error
+AIMD_DECREASE_COOLDOWN_SEC = 10.0  # Quota errors within this window count once
+RATE_STATE_FILE = "~/.cache/ai-studio-story/rate-limits.json"  # Learned rates
+SHARED_QUOTA_DIR = "~/.cache/ai-studio-story/quota"  # Cross-process slot files
+
 # =============================================================================
 # Advanced Pause Configuration
 # =============================================================================
@@ -31,6 +59,7 @@ MAX_RETRIES = 3  # Retry count per segment
 FILE_LEADING_SILENCE_MS = 500  # Silence at start of audio file
 FILE_TRAILING_SILENCE_MS = 1500  # Silence at end of audio file
 CROSSFADE_MS = 75  # Crossfade duration (increased from 25ms for smoother transitions)
+CROSSFADE_CURVE_CACHE_SIZE = 64  # Fade curve tables kept per (length, curve type)
 
 # =============================================================================
 # Audio Smoothing Constants
@@ -38,8 +67,15 @@ CROSSFADE_MS = 75  # Crossfade duration (increased from 25ms for smoother transi
 
 SEGMENT_FADE_IN_MS = 15  # Fade in at segment start to prevent clicks
 SEGMENT_FADE_OUT_MS = 25  # Fade out at segment end (slightly longer for natural decay)
+SILENCE_SCAN_BLOCK_CHUNKS = 32  # 10ms chunks in the first block of a silence scan
 COMFORT_NOISE_LEVEL_DB = -55.0  # Target noise floor for comfort noise
 NOISE_FADE_MS = 10  # Micro-fade on noise edges to prevent clicks
+NOISE_BANK_DURATION_SEC = 20.0  # Length of each precomputed comfort noise loop
+NOISE_BANK_LOOP_MS = 50  # Crossfade joining the end of a noise loop to its start
+NOISE_BANK_CALIBRATION_MS = 500  # Slices this long keep the requested peak level
+NOISE_BANK_LEVEL_STEP_DB = 0.5  # Levels are rounded down to this step
+NOISE_BANK_MAX_LEVELS = 8  # Noise loops kept in memory (LRU)
+NOISE_BANK_SEED = 1337  # Seed for reproducible comfort noise
 
 # =============================================================================
 # Context-Aware Pause Durations (milliseconds)
@@ -111,8 +147,37 @@ AVAILABLE_VOICES = {
     "Sadaltager",
 }
 
+# =============================================================================
+# TTS Response Cache
+# =============================================================================
+
+TTS_CACHE_DIR = "~/.cache/ai-studio-story/tts"  # Shared across runs and stories
+TTS_CACHE_MAX_BYTES = 2 * 1024**3  # LRU eviction above 2 GiB of cached PCM
+PCM_COMPRESSION_LEVEL = "none"  # Cached and saved batch PCM: "none", "fast", "small"
+
+# =============================================================================
+# Script Parse Cache
+# =============================================================================
+
+PARSE_CACHE_DIR = "~/.cache/ai-studio-story/scripts"  # Parsed scripts by content
+
 # =============================================================================
 # Progress File Management
 # =============================================================================
 
 PROGRESS_FILE_NAME = ".progress.json"
+PROGRESS_JOURNAL_NAME = ".progress.journal"  # Batches completed since the snapshot
+BATCH_STORE_DATA_NAME = "audio.pack"  # Saved batch PCM, appended back to back
+BATCH_STORE_INDEX_NAME = "audio.idx"  # Offset, length and CRC-32 of each batch
+PACK_PROGRESS_DIR = ".progress"  # Per-output progress dirs inside a pack's assets/
+
+# =============================================================================
+# MP3 Encoding
+# =============================================================================
+
+FFMPEG_BINARY = "ffmpeg"  # Encoder executable (looked up on PATH)
+ENCODER_CHUNK_SAMPLES = 44100  # PCM samples written to the encoder per chunk (1s)
+ENCODER_READ_BYTES = 64 * 1024  # MP3 bytes read from the encoder per chunk
+ID3V1_TAG_BYTES = 128  # Fixed size of an ID3v1 tag at the end of a file
+VERIFY_CHUNK_BYTES = 1024 * 1024  # MP3 bytes walked per chunk when verifying a file
+FRAME_INDEX_CACHE_DIR = "~/.cache/ai-studio-story/frames"  # MP3 frame indexes by dir
@@ -1,6 +1,7 @@
 """Domain models for audio generation pipeline."""
 
 from dataclasses import dataclass, field
+from pathlib import Path
 
 from audio_generation.domain.constants import (
     COMFORT_NOISE_LEVEL_DB,
@@ -122,11 +123,15 @@ class GenerationProgress:
     Enables resuming audio generation after failures (e.g., API rate limits)
     by tracking which batches have been successfully completed.
 
+    Progress is keyed by a fingerprint of each batch's content, so editing
+    a script only invalidates the batches that actually changed.
+
     Attributes:
-        input_file_hash: MD5 hash of input file for invalidation detection
+        input_file_hash: MD5 hash of input file (informational)
         total_batches: Total number of batches to process
-        completed_batches: Indices of completed batches (0-based)
+        completed_batches: Set of completed batch indices (0-based)
         audio_files: Mapping of batch_index to saved audio filename
+        batch_fingerprints: Content fingerprint of each batch, by index
         last_error: Error message if processing stopped due to error
         last_error_batch: Which batch failed
         last_error_time: ISO timestamp of error
@@ -136,8 +141,9 @@ class GenerationProgress:
 
     input_file_hash: str
     total_batches: int
-    completed_batches: list[int] = field(default_factory=list)
+    completed_batches: set[int] = field(default_factory=set)
     audio_files: dict[int, str] = field(default_factory=dict)
+    batch_fingerprints: list[str] = field(default_factory=list)
     last_error: str | None = None
     last_error_batch: int | None = None
     last_error_time: str | None = None
@@ -169,7 +175,8 @@ class PauseConfig:
         crossfade_ms: Crossfade duration between segments
         use_comfort_noise: Use pink noise instead of digital silence
         comfort_noise_db: Target noise level in dBFS
-        crossfade_curve: Curve type (linear, logarithmic, exponential, s_curve)
+        crossfade_curve: Curve type (linear, logarithmic, exponential, s_curve,
+            equal_power)
         segment_fade_in_ms: Fade in duration at segment start
         segment_fade_out_ms: Fade out duration at segment end
     """
@@ -201,7 +208,151 @@ class VerificationResult:
     Attributes:
         passed: Whether all checks passed
         issues: List of issues found (empty if passed)
+        frame_count: Number of MP3 frames in the file
+        duration_sec: Playing time of those frames in seconds
     """
 
     passed: bool
     issues: list[str] = field(default_factory=list)
+    frame_count: int = 0
+    duration_sec: float = 0.0
+
+
+@dataclass
+class EncodedMP3:
+    """Summary of an MP3 file written by the exporter.
+
+    The encoded data itself is not kept in memory. The streaming encoder
+    verifies the frames as it writes them; otherwise verification reads
+    the file (see MP3Verifier.verify_encoded).
+
+    Attributes:
+        output_path: Path of the written file
+        size_bytes: File size in bytes
+        verification: Format check made while writing, if any
+    """
+
+    output_path: Path
+    size_bytes: int
+    verification: VerificationResult | None = None
+
+
+@dataclass
+class FrameIndex:
+    """Frame-level index of an MP3 file, built from frame headers alone.
+
+    Attributes:
+        frame_count: Number of MP3 frames
+        duration_sec: Playing time in seconds
+        seek_table: Byte offset of the frame playing at each whole second
+    """
+
+    frame_count: int
+    duration_sec: float
+    seek_table: list[int] = field(default_factory=list)
+
+
+@dataclass
+class EncodeResult:
+    """Outcome of one file exported by an encoder pool.
+
+    Attributes:
+        output_path: Path of the written file
+        encoded: Summary of the written file
+        verification: Format verification result (None if not verified)
+    """
+
+    output_path: Path
+    encoded: EncodedMP3
+    verification: VerificationResult | None = None
+
+
+@dataclass
+class CacheStats:
+    """Snapshot of TTS response cache usage.
+
+    Attributes:
+        entries: Number of cached responses on disk
+        total_bytes: Total size of cached audio in bytes
+        max_bytes: Size limit enforced by LRU eviction
+        hits: Cache hits served by this process
+        misses: Cache misses seen by this process
+    """
+
+    entries: int
+    total_bytes: int
+    max_bytes: int
+    hits: int = 0
+    misses: int = 0
+
+
+@dataclass
+class PackScript:
+    """An audio script of a story pack and the asset it renders to.
+
+    Attributes:
+        source: Audio-script markdown file
+        output: MP3 file the script is rendered to
+    """
+
+    source: Path
+    output: Path
+
+    @property
+    def name(self) -> str:
+        """Output filename, used to identify the script in logs."""
+        return self.output.name
+
+
+@dataclass
+class PackBuildResult:
+    """Outcome of building every audio script of a story pack.
+
+    Attributes:
+        built: Scripts rendered to their output assets
+        skipped: Scripts left alone because their asset already existed
+        failed: Output filename to error message for scripts that failed
+        stage_metrics: Per-stage statistics of the build pipeline
+    """
+
+    built: list[PackScript] = field(default_factory=list)
+    skipped: list[PackScript] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+    stage_metrics: list["StageMetrics"] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        """Whether every script was built or skipped."""
+        return not self.failed
+
+
+@dataclass
+class StageMetrics:
+    """Timing and queueing statistics of one staged-pipeline stage.
+
+    Attributes:
+        name: Stage name
+        workers: Number of concurrent workers
+        items: Items the stage completed
+        failures: Items whose handler raised
+        busy_sec: Total time workers spent in the handler
+        idle_sec: Total time workers waited for input (starved)
+        blocked_sec: Total time workers waited for room downstream
+            (backpressure)
+        max_queue_depth: Deepest the stage's input queue got
+    """
+
+    name: str
+    workers: int
+    items: int = 0
+    failures: int = 0
+    busy_sec: float = 0.0
+    idle_sec: float = 0.0
+    blocked_sec: float = 0.0
+    max_queue_depth: int = 0
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of worker time spent doing work."""
+        total = self.busy_sec + self.idle_sec + self.blocked_sec
+        return self.busy_sec / total if total > 0 else 0.0
@@ -1,23 +1,35 @@
 """Audio generation pipeline orchestrator."""
 
+import asyncio
 import logging
 import time
-from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable
 
 from google.genai import errors as genai_errors
 
-from audio_generation.audio.concatenator import SegmentConcatenator
-from audio_generation.audio.effects import AudioEffects
+from audio_generation.audio.buffer import AudioBuffer
+from audio_generation.audio.concatenator import NormalizedSegments, SegmentConcatenator
+from audio_generation.audio.effects import AudioEffects, ComfortNoiseBank
 from audio_generation.audio.exporter import MP3Exporter
 from audio_generation.audio.processor import AudioProcessor
 from audio_generation.batching.segment_batcher import SegmentBatcher
 from audio_generation.domain.character_loader import CharacterLoader
-from audio_generation.domain.constants import API_CALL_DELAY_SEC, TTS_SYSTEM_INSTRUCTION
+from audio_generation.domain.constants import (
+    API_CALL_DELAY_SEC,
+    MAX_CONCURRENT_REQUESTS,
+    TARGET_SAMPLE_RATE,
+    TTS_REQUEST_TIMEOUT_SEC,
+    TTS_SYSTEM_INSTRUCTION,
+)
 from audio_generation.domain.models import (
     AudioScript,
     CharacterProfile,
+    EncodedMP3,
+    EncodeResult,
+    GenerationProgress,
     PauseConfig,
     Segment,
     SegmentBatch,
@@ -31,6 +43,31 @@ from audio_generation.tts.config_builder import SpeechConfigBuilder
 from audio_generation.tts.prompt_builder import TTSPromptBuilder
 from audio_generation.verification.mp3_verifier import MP3Verifier
 
+# Batch PCM, or in low-memory mode the progress store key it was saved under
+BatchAudio = bytes | str
+
+
+@dataclass
+class PreparedScript:
+    """A parsed and batched script, ready for TTS generation.
+
+    Attributes:
+        script: Parsed audio script
+        batches: Segment batches in playback order
+        speaker_configs_map: Speaker name to voice config mapping
+        character_profiles: Speaker name to character profile mapping
+    """
+
+    script: AudioScript
+    batches: list[SegmentBatch]
+    speaker_configs_map: dict[str, SpeakerConfig]
+    character_profiles: dict[str, CharacterProfile]
+
+    @property
+    def batch_metadata(self) -> list[Segment]:
+        """Last segment of each batch, used for context-aware pausing."""
+        return [batch.segments[-1] for batch in self.batches if batch.segments]
+
 
 class AudioGenerationPipeline:
     """Domain-oriented orchestrator for audio generation.
@@ -51,6 +88,9 @@ class AudioGenerationPipeline:
         verifier: MP3Verifier | None = None,
         progress_manager: ProgressManager | None = None,
         pause_config: PauseConfig | None = None,
+        character_loader: CharacterLoader | None = None,
+        noise_bank: ComfortNoiseBank | None = None,
+        low_memory: bool = False,
     ):
         """Initialize pipeline with optional dependency injection.
 
@@ -68,15 +108,23 @@ class AudioGenerationPipeline:
             verifier: MP3 verifier instance
             progress_manager: Progress manager instance
             pause_config: Pause configuration
+            character_loader: Character profile loader (share one between
+                pipelines to load each pack's profiles only once)
+            noise_bank: Comfort noise source (share one between pipelines to
+                generate each noise loop only once)
+            low_memory: If True, execute keeps batch audio on disk and mixes
+                it one batch at a time straight into the encoder, so memory
+                stays bounded by one batch whatever the script length
         """
         self._parser = parser or AudioScriptParser()
+        self._character_loader = character_loader or CharacterLoader()
         self._batcher = batcher or SegmentBatcher()
         self._tts_client = tts_client  # Must be set before execute()
         self._config_builder = config_builder or SpeechConfigBuilder()
         self._prompt_builder = prompt_builder or TTSPromptBuilder()
 
         # Audio processing chain
-        effects = AudioEffects()
+        effects = AudioEffects(noise_bank)
         processor = AudioProcessor(effects)
         self._pause_config = pause_config or PauseConfig()
         self._concatenator = concatenator or SegmentConcatenator(
@@ -85,6 +133,7 @@ class AudioGenerationPipeline:
         self._exporter = exporter or MP3Exporter()
         self._verifier = verifier or MP3Verifier()
         self._progress_manager = progress_manager
+        self._low_memory = low_memory
 
     def set_tts_client(self, client: TTSClient) -> None:
         """Set TTS client (required before execute).
@@ -110,14 +159,17 @@ class AudioGenerationPipeline:
         verify: bool = True,
         progress_callback: Callable[[int, int], None] | None = None,
         delay_seconds: float = API_CALL_DELAY_SEC,
-    ) -> bytes:
+        max_concurrency: int = 1,
+        prepared: PreparedScript | None = None,
+    ) -> EncodedMP3:
         """Execute the full audio generation pipeline.
 
         Pipeline stages:
         1. Parse script from markdown file
         2. Batch segments for TTS API
         3. Load/initialize progress tracking
-        4. Generate audio for each batch (with resume support)
+        4. Generate audio for each batch (with resume support, optionally
+           several batches concurrently)
         5. Concatenate segments with context-aware pauses
         6. Export to MP3 format
         7. Verify output format
@@ -129,10 +181,16 @@ class AudioGenerationPipeline:
             resume: If True, attempt to resume from saved progress
             verify: If True, verify output format after generation
             progress_callback: Optional callback for progress updates (current, total)
-            delay_seconds: Delay between API calls (default: 6s for <10 RPM)
+            delay_seconds: Delay between API calls (default: 6s for <10 RPM),
+                used only when the TTS client has no rate limiter
+            max_concurrency: Maximum number of TTS requests in flight. Values
+                above 1 require a TTS client with a rate limiter.
+            prepared: Result of ``prepare(input_file)`` if already computed
+                (e.g. to inspect or adjust the script before generating)
 
         Returns:
-            Final MP3 data bytes
+            Summary of the exported MP3 file (the data itself is only
+            written to output_path, not returned)
 
         Raises:
             ValueError: If TTS client not configured
@@ -145,6 +203,162 @@ class AudioGenerationPipeline:
         if self._progress_manager is None:
             self._progress_manager = ProgressManager(output_path.parent)
 
+        # Stages 1-2: Parse, load character profiles, batch
+        if prepared is None:
+            prepared = self.prepare(input_file)
+
+        # Stages 3-4: Handle progress/resume and generate audio for all batches
+        audio_segments = self._generate_batches(
+            batches=prepared.batches,
+            speaker_configs_map=prepared.speaker_configs_map,
+            character_profiles=prepared.character_profiles,
+            input_file=input_file,
+            output_dir=output_path.parent,
+            resume=resume,
+            progress_callback=progress_callback,
+            delay_seconds=delay_seconds,
+            max_concurrency=max_concurrency,
+        )
+
+        # Stages 5-8: Concatenate, export, verify, clean up
+        return self._finalize(prepared, audio_segments, output_path, verify)
+
+    async def execute_async(
+        self,
+        input_file: Path,
+        output_path: Path,
+        resume: bool = False,
+        verify: bool = True,
+        progress_callback: Callable[[int, int], None] | None = None,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+        request_timeout: float | None = TTS_REQUEST_TIMEOUT_SEC,
+        prepared: PreparedScript | None = None,
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> EncodedMP3:
+        """Execute the full pipeline on the running event loop.
+
+        Same stages as ``execute``, but batches are synthesized as asyncio
+        tasks through ``TTSClient.agenerate``, so many chapters can share
+        one event loop without a thread per request. Concatenation and
+        export run in a worker thread to keep the loop responsive.
+        Cancelling the calling task cancels all outstanding requests;
+        completed batches stay saved for resume.
+
+        Args:
+            input_file: Path to input markdown file
+            output_path: Output MP3 file path
+            resume: If True, attempt to resume from saved progress
+            verify: If True, verify output format after generation
+            progress_callback: Optional callback for progress updates (current, total)
+            max_concurrency: Maximum number of TTS requests in flight
+                (ignored when ``semaphore`` is given)
+            request_timeout: Per-attempt TTS request timeout in seconds
+            prepared: Result of ``prepare(input_file)`` if already computed
+            semaphore: Semaphore bounding requests in flight, shared with
+                other scripts generated on the same loop
+
+        Returns:
+            Summary of the exported MP3 file
+
+        Raises:
+            ValueError: If TTS client not configured or has no rate limiter
+            RuntimeError: If generation fails
+        """
+        if self._tts_client is None:
+            raise ValueError("TTS client must be configured before execute()")
+        if self._tts_client.rate_limiter is None:
+            raise ValueError(
+                "Async generation requires a TTS client with a rate limiter"
+            )
+
+        if self._progress_manager is None:
+            self._progress_manager = ProgressManager(output_path.parent)
+
+        if prepared is None:
+            prepared = self.prepare(input_file)
+
+        audio_segments = await self.synthesize_async(
+            prepared,
+            input_file,
+            resume=resume,
+            progress_callback=progress_callback,
+            max_concurrency=max_concurrency,
+            request_timeout=request_timeout,
+            semaphore=semaphore,
+        )
+
+        return await asyncio.to_thread(
+            self._finalize, prepared, audio_segments, output_path, verify
+        )
+
+    async def synthesize_async(
+        self,
+        prepared: PreparedScript,
+        input_file: Path,
+        resume: bool = False,
+        progress_callback: Callable[[int, int], None] | None = None,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+        request_timeout: float | None = TTS_REQUEST_TIMEOUT_SEC,
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> list[BatchAudio]:
+        """Restore progress and synthesize every pending batch (stages 3-4).
+
+        The TTS fetch stage of ``execute_async`` on its own, for callers
+        that schedule the audio stages themselves.
+
+        Args:
+            prepared: Result of ``prepare(input_file)``
+            input_file: Path to input markdown file
+            resume: If True, attempt to resume from saved progress
+            progress_callback: Optional callback for progress updates (current, total)
+            max_concurrency: Maximum number of TTS requests in flight
+                (ignored when ``semaphore`` is given)
+            request_timeout: Per-attempt TTS request timeout in seconds
+            semaphore: Semaphore bounding requests in flight, shared with
+                other scripts generated on the same loop
+
+        Returns:
+            Raw PCM audio data in batch order
+
+        Raises:
+            ValueError: If TTS client not configured or has no rate limiter
+            RuntimeError: If generation fails
+        """
+        if self._tts_client is None:
+            raise ValueError("TTS client must be configured before execute()")
+        if self._tts_client.rate_limiter is None:
+            raise ValueError(
+                "Async generation requires a TTS client with a rate limiter"
+            )
+
+        progress, results = self._restore_progress(
+            prepared.batches,
+            prepared.speaker_configs_map,
+            prepared.character_profiles,
+            input_file,
+            resume,
+            progress_callback,
+        )
+        await self._agenerate_batches(
+            prepared=prepared,
+            progress=progress,
+            results=results,
+            progress_callback=progress_callback,
+            max_concurrency=max_concurrency,
+            request_timeout=request_timeout,
+            semaphore=semaphore,
+        )
+        return [r for r in results if r is not None]
+
+    def prepare(self, input_file: Path) -> PreparedScript:
+        """Parse a script, load its character profiles and batch its segments.
+
+        Args:
+            input_file: Path to input markdown file
+
+        Returns:
+            PreparedScript ready for generation
+        """
         # Stage 1: Parse script
         logging.info(f"Parsing audio script: {input_file}")
         script = self._parser.parse(input_file)
@@ -153,8 +367,7 @@ class AudioGenerationPipeline:
         logging.info(f"Segments: {len(script.segments)}")
 
         # Stage 1b: Load character profiles
-        character_loader = CharacterLoader()
-        character_profiles = character_loader.load_for_script(input_file)
+        character_profiles = self._character_loader.load_for_script(input_file)
         if character_profiles:
             logging.info(
                 f"Character profiles loaded: {list(character_profiles.keys())}"
@@ -166,48 +379,166 @@ class AudioGenerationPipeline:
             f"Processing {len(script.segments)} segments in {len(batches)} batches"
         )
 
-        # Stage 3: Handle progress/resume
-        speaker_configs_map = {cfg.name: cfg for cfg in script.speaker_configs}
-
-        # Stage 4: Generate audio for all batches
-        audio_segments = self._generate_batches(
+        return PreparedScript(
+            script=script,
             batches=batches,
-            speaker_configs_map=speaker_configs_map,
+            speaker_configs_map={cfg.name: cfg for cfg in script.speaker_configs},
             character_profiles=character_profiles,
-            input_file=input_file,
-            output_dir=output_path.parent,
-            resume=resume,
-            progress_callback=progress_callback,
-            delay_seconds=delay_seconds,
         )
 
-        # Stage 5: Create batch metadata for context-aware pausing
-        batch_metadata: list[Segment] = []
-        for batch in batches:
-            if batch.segments:
-                batch_metadata.append(batch.segments[-1])
+    def _finalize(
+        self,
+        prepared: PreparedScript,
+        audio_segments: list[BatchAudio],
+        output_path: Path,
+        verify: bool,
+    ) -> EncodedMP3:
+        """Concatenate generated audio, export, verify and clean up progress.
+
+        In low-memory mode, batches are loaded, normalized and mixed one at
+        a time while the mix is being encoded, instead of building the
+        whole chapter in memory first.
+
+        Args:
+            prepared: The prepared script the audio was generated for
+            audio_segments: Raw PCM audio data (or progress store keys) in
+                batch order
+            output_path: Output MP3 file path
+            verify: If True, verify output format after export
+
+        Returns:
+            Summary of the exported MP3 file
+
+        Raises:
+            RuntimeError: If verification fails
+        """
+        if self._low_memory:
+            # Stages 5-6: Mix one batch at a time straight into the encoder
+            chunks = self._concatenator.stream(
+                len(audio_segments),
+                lambda i: self._load_batch(audio_segments[i]),
+                prepared.batch_metadata,
+            )
+            encoded = self._exporter.export_stream(
+                chunks, TARGET_SAMPLE_RATE, output_path
+            )
+            return self._complete_encoded(encoded, output_path, verify)
+
+        # Stage 5: Concatenate with context-aware pauses
+        combined = self.mix_audio(prepared, self.normalize_audio(audio_segments))
+
+        # Stages 6-8: Export, verify, clean up progress
+        return self.export_audio(combined, output_path, verify)
+
+    def _load_batch(self, audio: BatchAudio) -> bytes:
+        """Get a batch's PCM, loading it from the progress store if saved there.
+
+        Args:
+            audio: Batch PCM or progress store key
+
+        Returns:
+            Raw PCM audio data
+        """
+        if isinstance(audio, str):
+            return self._progress_manager.load_batch_audio(audio)
+        return audio
+
+    def normalize_audio(self, audio_segments: list[bytes]) -> NormalizedSegments:
+        """Decode batch PCM and normalize each segment's edges.
+
+        Args:
+            audio_segments: Raw PCM audio data in batch order
+
+        Returns:
+            NormalizedSegments ready for mix_audio
+        """
+        return self._concatenator.normalize(audio_segments)
+
+    def mix_audio(
+        self, prepared: PreparedScript, normalized: NormalizedSegments
+    ) -> AudioBuffer:
+        """Join normalized segments with context-aware pauses.
+
+        Args:
+            prepared: The prepared script the audio was generated for
+            normalized: Result of normalize_audio
 
-        # Concatenate with context-aware pauses
-        combined = self._concatenator.concatenate(audio_segments, batch_metadata)
+        Returns:
+            Combined audio of the whole script
+        """
+        return self._concatenator.mix(normalized, prepared.batch_metadata)
 
+    def export_audio(
+        self, combined: AudioBuffer, output_path: Path, verify: bool
+    ) -> EncodedMP3:
+        """Export to MP3, verify the format and clear saved progress.
+
+        Args:
+            combined: Combined audio from mix_audio
+            output_path: Output MP3 file path
+            verify: If True, verify output format after export
+
+        Returns:
+            Summary of the exported MP3 file
+
+        Raises:
+            RuntimeError: If verification fails
+        """
         # Stage 6: Export to MP3
-        mp3_data = self._exporter.export(combined, output_path)
+        encoded = self._exporter.export(combined, output_path)
+        return self._complete_encoded(encoded, output_path, verify)
+
+    def _complete_encoded(
+        self, encoded: EncodedMP3, output_path: Path, verify: bool
+    ) -> EncodedMP3:
+        """Verify a file exported in this process and clear saved progress.
+
+        Args:
+            encoded: Summary of the exported file
+            output_path: Output MP3 file path
+            verify: If True, verify output format
+
+        Returns:
+            Summary of the exported MP3 file
+
+        Raises:
+            RuntimeError: If verification fails
+        """
+        verification = self._verifier.verify_encoded(encoded) if verify else None
+        return self.complete_export(
+            EncodeResult(
+                output_path=output_path, encoded=encoded, verification=verification
+            )
+        )
+
+    def complete_export(self, result: EncodeResult) -> EncodedMP3:
+        """Check an exported file's verification and clear saved progress.
+
+        Used directly when the file was encoded elsewhere (e.g. by an
+        EncoderPool).
 
+        Args:
+            result: Export and verification outcome
+
+        Returns:
+            Summary of the exported MP3 file
+
+        Raises:
+            RuntimeError: If verification fails
+        """
         # Stage 7: Verify format
-        if verify:
-            result = self._verifier.verify(mp3_data)
-            if not result.passed:
-                logging.error("Output does not meet format requirements:")
-                for issue in result.issues:
-                    logging.error(f"  - {issue}")
-                raise RuntimeError(
-                    f"MP3 verification failed: {', '.join(result.issues)}"
-                )
+        if result.verification is not None and not result.verification.passed:
+            issues = result.verification.issues
+            logging.error("Output does not meet format requirements:")
+            for issue in issues:
+                logging.error(f"  - {issue}")
+            raise RuntimeError(f"MP3 verification failed: {', '.join(issues)}")
 
         # Stage 8: Clean up progress files
-        self._progress_manager.clear()
+        if self._progress_manager:
+            self._progress_manager.clear()
 
-        return mp3_data
+        return result.encoded
 
     def _generate_batches(
         self,
@@ -219,7 +550,8 @@ class AudioGenerationPipeline:
         resume: bool,
         progress_callback: Callable[[int, int], None] | None,
         delay_seconds: float,
-    ) -> list[bytes]:
+        max_concurrency: int = 1,
+    ) -> list[BatchAudio]:
         """Generate audio for all batches with resume capability.
 
         Args:
@@ -230,10 +562,13 @@ class AudioGenerationPipeline:
             output_dir: Directory for progress files
             resume: Whether to resume from saved progress
             progress_callback: Optional progress callback
-            delay_seconds: Delay between API calls
+            delay_seconds: Delay between API calls (sequential mode without
+                a client rate limiter only)
+            max_concurrency: Maximum number of TTS requests in flight
 
         Returns:
-            List of raw PCM audio data in batch order
+            List of raw PCM audio data in batch order (progress store keys
+            in low-memory mode)
 
         Raises:
             RuntimeError: If generation fails
@@ -241,143 +576,472 @@ class AudioGenerationPipeline:
         if self._tts_client is None:
             raise ValueError("TTS client not configured")
 
+        progress, results = self._restore_progress(
+            batches,
+            speaker_configs_map,
+            character_profiles,
+            input_file,
+            resume,
+            progress_callback,
+        )
+        pending = [i for i, r in enumerate(results) if r is None]
+
+        if max_concurrency > 1 and len(pending) > 1:
+            self._generate_concurrently(
+                pending=pending,
+                batches=batches,
+                speaker_configs_map=speaker_configs_map,
+                character_profiles=character_profiles,
+                progress=progress,
+                results=results,
+                progress_callback=progress_callback,
+                max_concurrency=max_concurrency,
+            )
+        else:
+            self._generate_sequentially(
+                pending=pending,
+                batches=batches,
+                speaker_configs_map=speaker_configs_map,
+                character_profiles=character_profiles,
+                progress=progress,
+                results=results,
+                progress_callback=progress_callback,
+                delay_seconds=delay_seconds,
+            )
+
+        # All batches complete - return results
+        return [r for r in results if r is not None]
+
+    def _restore_progress(
+        self,
+        batches: list[SegmentBatch],
+        speaker_configs_map: dict[str, SpeakerConfig],
+        character_profiles: dict[str, CharacterProfile],
+        input_file: Path,
+        resume: bool,
+        progress_callback: Callable[[int, int], None] | None,
+    ) -> tuple[GenerationProgress | None, list[BatchAudio | None]]:
+        """Load or initialize progress and reload already-completed batches.
+
+        When resuming, saved batches are matched to the current ones by
+        content fingerprint, so only new or edited batches are regenerated.
+
+        Args:
+            batches: List of segment batches
+            speaker_configs_map: Speaker name to config mapping
+            character_profiles: Speaker name to character profile mapping
+            input_file: Input file (hash recorded for reference)
+            resume: Whether to resume from saved progress
+            progress_callback: Optional progress callback
+
+        Returns:
+            Tuple of (progress state, batch-ordered result slots with
+            completed batches filled in)
+        """
         total_batches = len(batches)
+        results: list[BatchAudio | None] = [None] * total_batches
 
-        # Try to load existing progress if resuming
-        progress = None
-        if resume and self._progress_manager:
-            progress = self._progress_manager.load()
-            if progress and self._progress_manager.validate(
-                progress, input_file, total_batches
-            ):
-                logging.info(
-                    f"Resuming: {len(progress.completed_batches)}/{total_batches} "
-                    "batches already complete"
-                )
-                if progress.last_error:
-                    logging.info(
-                        f"Previous error on batch {(progress.last_error_batch or 0) + 1}: "
-                        f"{progress.last_error}"
-                    )
-            else:
-                progress = None
-                logging.info("Starting fresh (no valid progress found)")
-
-        # Initialize new progress if needed
-        if progress is None and self._progress_manager:
-            progress = self._progress_manager.create_initial_progress(
-                input_file, total_batches
+        if self._progress_manager is None:
+            return None, results
+
+        fingerprints = [
+            ProgressManager.fingerprint_batch(
+                batch, speaker_configs_map, character_profiles
             )
-            self._progress_manager.save(progress)
+            for batch in batches
+        ]
 
-        results: list[bytes | None] = [None] * total_batches
+        # Try to load existing progress if resuming
+        previous = self._progress_manager.load() if resume else None
+        if resume and previous is None:
+            logging.info("Starting fresh (no saved progress found)")
+
+        # Without previous progress this also empties the batch store, so
+        # audio of an earlier run is neither reused nor left on disk
+        progress = self._progress_manager.reconcile(previous, input_file, fingerprints)
+        self._progress_manager.save(progress)
+
+        if progress.completed_batches:
+            logging.info(
+                f"Resuming: {len(progress.completed_batches)}/{total_batches} "
+                "batches already complete"
+            )
+            if progress.last_error:
+                logging.info(f"Previous error: {progress.last_error}")
 
         # Load already-completed batches from disk
-        if progress and self._progress_manager:
-            for batch_idx in progress.completed_batches:
-                filename = progress.audio_files.get(batch_idx)
-                if filename:
-                    results[batch_idx] = self._progress_manager.load_batch_audio(
-                        filename
-                    )
-                    logging.debug(f"Loaded cached batch {batch_idx + 1}")
+        for batch_idx in progress.completed_batches:
+            filename = progress.audio_files.get(batch_idx)
+            if filename and self._low_memory:
+                results[batch_idx] = filename  # Loaded again when mixing
+            elif filename:
+                results[batch_idx] = self._progress_manager.load_batch_audio(filename)
+                logging.debug(f"Loaded cached batch {batch_idx + 1}")
 
         # Report initial progress for resumed batches
-        if progress and progress.completed_batches and progress_callback:
+        if progress.completed_batches and progress_callback:
             progress_callback(len(progress.completed_batches), total_batches)
 
+        return progress, results
+
+    def _generate_sequentially(
+        self,
+        pending: list[int],
+        batches: list[SegmentBatch],
+        speaker_configs_map: dict[str, SpeakerConfig],
+        character_profiles: dict[str, CharacterProfile],
+        progress: GenerationProgress | None,
+        results: list[BatchAudio | None],
+        progress_callback: Callable[[int, int], None] | None,
+        delay_seconds: float,
+    ) -> None:
+        """Generate pending batches one at a time.
+
+        Without a client rate limiter, a fixed delay separates API calls.
+
+        Args:
+            pending: Indices of batches still to generate
+            batches: List of segment batches
+            speaker_configs_map: Speaker name to config mapping
+            character_profiles: Speaker name to character profile mapping
+            progress: Progress state (None if progress tracking disabled)
+            results: Batch-ordered result slots, filled in place
+            progress_callback: Optional progress callback
+            delay_seconds: Delay between API calls
+
+        Raises:
+            RuntimeError: If a batch fails
+        """
+        assert self._tts_client is not None
+        use_fixed_delay = self._tts_client.rate_limiter is None
+
         # Track if we need delay
         need_delay = bool(progress and progress.completed_batches)
 
-        # Process remaining batches
-        for i, batch in enumerate(batches):
-            if progress and i in progress.completed_batches:
-                continue  # Skip already completed
-
+        for i in pending:
             # Rate limiting delay
-            if need_delay:
+            if need_delay and use_fixed_delay:
                 logging.debug(f"Rate limit delay: {delay_seconds}s")
                 time.sleep(delay_seconds)
             need_delay = True
 
-            batch_num = i + 1
-
             try:
-                # Build prompt and config
+                audio_data = self._synthesize_batch(
+                    batches[i], i + 1, speaker_configs_map, character_profiles
+                )
+            except Exception as e:
+                raise self._record_batch_failure(progress, i, e, len(batches)) from e
+
+            self._record_batch_success(
+                progress, i, audio_data, results, progress_callback
+            )
+
+    def _generate_concurrently(
+        self,
+        pending: list[int],
+        batches: list[SegmentBatch],
+        speaker_configs_map: dict[str, SpeakerConfig],
+        character_profiles: dict[str, CharacterProfile],
+        progress: GenerationProgress | None,
+        results: list[BatchAudio | None],
+        progress_callback: Callable[[int, int], None] | None,
+        max_concurrency: int,
+    ) -> None:
+        """Generate pending batches with several TTS requests in flight.
+
+        Pacing comes from the TTS client's shared rate limiter rather than
+        a fixed delay. Finished batches are recorded from this thread as
+        they complete; on the first failure, queued batches are cancelled,
+        in-flight ones are allowed to finish and are kept for resume.
+
+        Args:
+            pending: Indices of batches still to generate
+            batches: List of segment batches
+            speaker_configs_map: Speaker name to config mapping
+            character_profiles: Speaker name to character profile mapping
+            progress: Progress state (None if progress tracking disabled)
+            results: Batch-ordered result slots, filled in place
+            progress_callback: Optional progress callback
+            max_concurrency: Maximum number of TTS requests in flight
+
+        Raises:
+            ValueError: If the TTS client has no rate limiter
+            RuntimeError: If a batch fails
+        """
+        assert self._tts_client is not None
+        if self._tts_client.rate_limiter is None:
+            raise ValueError(
+                "Concurrent generation requires a TTS client with a rate limiter"
+            )
+
+        logging.info(
+            f"Generating {len(pending)} batches with up to "
+            f"{max_concurrency} concurrent requests"
+        )
+
+        failure: tuple[int, Exception] | None = None
+
+        with ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="tts"
+        ) as executor:
+            futures: dict[Future[bytes], int] = {
+                executor.submit(
+                    self._synthesize_batch,
+                    batches[i],
+                    i + 1,
+                    speaker_configs_map,
+                    character_profiles,
+                ): i
+                for i in pending
+            }
+
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+
+                i = futures[future]
+                try:
+                    audio_data = future.result()
+                except Exception as e:
+                    if failure is None:
+                        failure = (i, e)
+                        for other in futures:
+                            other.cancel()
+                    else:
+                        logging.error(f"Batch {i + 1} also failed: {e}")
+                    continue
+
+                self._record_batch_success(
+                    progress, i, audio_data, results, progress_callback
+                )
+
+        if failure is not None:
+            i, error = failure
+            raise self._record_batch_failure(
+                progress, i, error, len(batches)
+            ) from error
+
+    async def _agenerate_batches(
+        self,
+        prepared: PreparedScript,
+        progress: GenerationProgress | None,
+        results: list[BatchAudio | None],
+        progress_callback: Callable[[int, int], None] | None,
+        max_concurrency: int,
+        request_timeout: float | None,
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> None:
+        """Generate pending batches as asyncio tasks.
+
+        A semaphore bounds the number of requests in flight and the TTS
+        client's rate limiter paces them. On the first failure, or if the
+        caller is cancelled, every outstanding task of this script is
+        cancelled.
+
+        Args:
+            prepared: The prepared script being generated
+            progress: Progress state (None if progress tracking disabled)
+            results: Batch-ordered result slots, filled in place
+            progress_callback: Optional progress callback
+            max_concurrency: Maximum number of TTS requests in flight
+            request_timeout: Per-attempt TTS request timeout in seconds
+            semaphore: Shared semaphore to use instead of a private one
+
+        Raises:
+            RuntimeError: If a batch fails
+        """
+        assert self._tts_client is not None
+        tts_client = self._tts_client
+        batches = prepared.batches
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def synthesize(i: int) -> tuple[int, bytes | Exception]:
+            async with semaphore:
                 prompt = self._prompt_builder.build(
-                    batch, speaker_configs_map, character_profiles
+                    batches[i],
+                    prepared.speaker_configs_map,
+                    prepared.character_profiles,
                 )
                 speech_config = self._config_builder.build_for_batch(
-                    batch, speaker_configs_map
+                    batches[i], prepared.speaker_configs_map
                 )
+                try:
+                    audio_data = await tts_client.agenerate(
+                        prompt,
+                        speech_config,
+                        system_instruction=TTS_SYSTEM_INSTRUCTION,
+                        batch_num=i + 1,
+                        timeout=request_timeout,
+                    )
+                except Exception as e:
+                    return i, e
+                return i, audio_data
 
-                # Generate audio
-                audio_data = self._tts_client.generate(
-                    prompt,
-                    speech_config,
-                    system_instruction=TTS_SYSTEM_INSTRUCTION,
-                    batch_num=batch_num,
-                )
+        pending = [i for i, r in enumerate(results) if r is None]
+        tasks = [
+            asyncio.create_task(synthesize(i), name=f"tts-batch-{i + 1}")
+            for i in pending
+        ]
 
-                # Save immediately to disk
-                if self._progress_manager and progress:
-                    filename = self._progress_manager.save_batch_audio(i, audio_data)
-                    results[i] = audio_data
-
-                    # Update progress
-                    progress.completed_batches.append(i)
-                    progress.audio_files[i] = filename
-                    progress.last_error = None
-                    progress.last_error_batch = None
-                    progress.last_error_time = None
-                    self._progress_manager.save(progress)
-                else:
-                    results[i] = audio_data
-
-                if progress_callback:
-                    completed = (
-                        len(progress.completed_batches) if progress else batch_num
-                    )
-                    progress_callback(completed, total_batches)
-
-            except genai_errors.APIError as e:
-                # Save error state and exit
-                if self._progress_manager and progress:
-                    progress.last_error = f"API Error {e.code}: {e.message}"
-                    progress.last_error_batch = i
-                    progress.last_error_time = datetime.now().isoformat()
-                    self._progress_manager.save(progress)
-
-                logging.error(
-                    f"Batch {batch_num} failed with API error: {e.code} - {e.message}"
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                i, outcome = await next_done
+                if isinstance(outcome, Exception):
+                    raise self._record_batch_failure(
+                        progress, i, outcome, len(batches)
+                    ) from outcome
+                # Compressing, checksumming and fsyncing the batch would
+                # stall every request in flight on this loop
+                stored = await asyncio.to_thread(
+                    self._persist_batch, progress, i, outcome
                 )
-                logging.error("Progress saved. Resume with --resume flag.")
-                completed = len(progress.completed_batches) if progress else 0
-                raise RuntimeError(
-                    f"Batch {batch_num} failed: API Error {e.code}. "
-                    f"Progress saved ({completed}/{total_batches} complete). "
-                    "Resume with --resume flag."
-                ) from e
+                self._fill_batch_result(i, stored, results, progress_callback)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
-            except Exception as e:
-                # Save error state for any other exception
-                if self._progress_manager and progress:
-                    progress.last_error = str(e)
-                    progress.last_error_batch = i
-                    progress.last_error_time = datetime.now().isoformat()
-                    self._progress_manager.save(progress)
-
-                logging.error(f"Batch {batch_num} failed: {e}")
-                logging.error("Progress saved. Resume with --resume flag.")
-                completed = len(progress.completed_batches) if progress else 0
-                raise RuntimeError(
-                    f"Batch {batch_num} failed: {e}. "
-                    f"Progress saved ({completed}/{total_batches} complete). "
-                    "Resume with --resume flag."
-                ) from e
+    def _synthesize_batch(
+        self,
+        batch: SegmentBatch,
+        batch_num: int,
+        speaker_configs_map: dict[str, SpeakerConfig],
+        character_profiles: dict[str, CharacterProfile],
+    ) -> bytes:
+        """Build prompt and speech config for a batch and synthesize it.
 
-        # All batches complete - return results
-        return [r for r in results if r is not None]
+        Args:
+            batch: The segment batch
+            batch_num: Batch number for logging (1-indexed)
+            speaker_configs_map: Speaker name to config mapping
+            character_profiles: Speaker name to character profile mapping
+
+        Returns:
+            Raw PCM audio data
+        """
+        assert self._tts_client is not None
+
+        prompt = self._prompt_builder.build(
+            batch, speaker_configs_map, character_profiles
+        )
+        speech_config = self._config_builder.build_for_batch(batch, speaker_configs_map)
+
+        return self._tts_client.generate(
+            prompt,
+            speech_config,
+            system_instruction=TTS_SYSTEM_INSTRUCTION,
+            batch_num=batch_num,
+        )
+
+    def _record_batch_success(
+        self,
+        progress: GenerationProgress | None,
+        batch_index: int,
+        audio_data: bytes,
+        results: list[BatchAudio | None],
+        progress_callback: Callable[[int, int], None] | None,
+    ) -> None:
+        """Store a finished batch and persist progress immediately.
+
+        Args:
+            progress: Progress state (None if progress tracking disabled)
+            batch_index: Index of the finished batch (0-based)
+            audio_data: Raw PCM audio data
+            results: Batch-ordered result slots
+            progress_callback: Optional progress callback
+        """
+        stored = self._persist_batch(progress, batch_index, audio_data)
+        self._fill_batch_result(batch_index, stored, results, progress_callback)
+
+    def _persist_batch(
+        self,
+        progress: GenerationProgress | None,
+        batch_index: int,
+        audio_data: bytes,
+    ) -> BatchAudio:
+        """Save a finished batch's audio and journal it.
+
+        Args:
+            progress: Progress state (None if progress tracking disabled)
+            batch_index: Index of the finished batch (0-based)
+            audio_data: Raw PCM audio data
+
+        Returns:
+            What the batch's result slot holds: the store key in low-memory
+            mode (releasing the PCM), otherwise the PCM itself
+        """
+        if not (self._progress_manager and progress):
+            return audio_data
+
+        filename = self._progress_manager.save_batch_audio(
+            progress.batch_fingerprints[batch_index], audio_data
+        )
+        self._progress_manager.record_batch(progress, batch_index, filename)
+        return filename if self._low_memory else audio_data
+
+    @staticmethod
+    def _fill_batch_result(
+        batch_index: int,
+        stored: BatchAudio,
+        results: list[BatchAudio | None],
+        progress_callback: Callable[[int, int], None] | None,
+    ) -> None:
+        """Fill a batch's result slot and report progress.
+
+        Args:
+            batch_index: Index of the finished batch (0-based)
+            stored: PCM or store key of the batch
+            results: Batch-ordered result slots
+            progress_callback: Optional progress callback
+        """
+        results[batch_index] = stored
+        if progress_callback:
+            completed = sum(1 for r in results if r is not None)
+            progress_callback(completed, len(results))
+
+    def _record_batch_failure(
+        self,
+        progress: GenerationProgress | None,
+        batch_index: int,
+        error: Exception,
+        total_batches: int,
+    ) -> RuntimeError:
+        """Save error state for a failed batch and build the error to raise.
+
+        Args:
+            progress: Progress state (None if progress tracking disabled)
+            batch_index: Index of the failed batch (0-based)
+            error: Exception raised while generating the batch
+            total_batches: Total number of batches
+
+        Returns:
+            RuntimeError describing the failure and how to resume
+        """
+        batch_num = batch_index + 1
+
+        if isinstance(error, genai_errors.APIError):
+            error_text = f"API Error {error.code}: {error.message}"
+            logging.error(
+                f"Batch {batch_num} failed with API error: "
+                f"{error.code} - {error.message}"
+            )
+            summary = f"API Error {error.code}"
+        else:
+            error_text = str(error)
+            logging.error(f"Batch {batch_num} failed: {error}")
+            summary = str(error)
+
+        if self._progress_manager and progress:
+            self._progress_manager.record_error(progress, batch_index, error_text)
+
+        logging.error("Progress saved. Resume with --resume flag.")
+        completed = len(progress.completed_batches) if progress else 0
+        return RuntimeError(
+            f"Batch {batch_num} failed: {summary}. "
+            f"Progress saved ({completed}/{total_batches} complete). "
+            "Resume with --resume flag."
+        )
 
     def parse_script(self, file_path: Path) -> AudioScript:
         """Parse script without executing full pipeline.
@@ -0,0 +1,6 @@
+"""Story pack discovery and build module."""
+
+from audio_generation.pack.builder import PackBuilder
+from audio_generation.pack.discovery import PackDiscovery
+
+__all__ = ["PackBuilder", "PackDiscovery"]
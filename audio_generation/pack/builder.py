@@ -0,0 +1,333 @@
+"""Build every audio asset of a story pack in one scheduled run."""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from audio_generation.audio.effects import ComfortNoiseBank
+from audio_generation.audio.encoder_pool import EncoderPool
+from audio_generation.audio.exporter import MP3Exporter
+from audio_generation.caching.pcm_codec import PCMCodec
+from audio_generation.domain.character_loader import CharacterLoader
+from audio_generation.domain.constants import (
+    FETCH_STAGE_WORKERS,
+    MAX_CONCURRENT_REQUESTS,
+    PACK_PROGRESS_DIR,
+    STAGE_QUEUE_SIZE,
+    TTS_REQUEST_TIMEOUT_SEC,
+)
+from audio_generation.domain.models import PackBuildResult, PackScript, PauseConfig
+from audio_generation.orchestrator import AudioGenerationPipeline, PreparedScript
+from audio_generation.pack.discovery import PackDiscovery
+from audio_generation.parsing.script_parser import AudioScriptParser
+from audio_generation.progress.progress_manager import ProgressManager
+from audio_generation.scheduling.rate_limiter import RateLimiter
+from audio_generation.scheduling.staged_pipeline import Stage, StagedPipeline
+from audio_generation.tts.client import TTSClient
+
+
+@dataclass
+class _BuildJob:
+    """A pack script travelling through the build stages.
+
+    Attributes:
+        script: Pack script being built
+        pipeline: Pipeline configured for the script
+        prepared: Parsed and batched script
+        audio: Output of the last completed stage
+    """
+
+    script: PackScript
+    pipeline: AudioGenerationPipeline
+    prepared: PreparedScript
+    audio: Any = None
+
+
+class PackBuilder:
+    """Synthesizes all scripts of a story pack through one global scheduler.
+
+    Every script is parsed and batched up front, then flows through a
+    staged pipeline: fetch (TTS), decode (PCM decode and normalize), mix
+    and encode (MP3 export and verification on an EncoderPool sized to the
+    CPU count). Stages run concurrently across scripts and are joined by
+    bounded queues, so the CPU work of one chapter overlaps the network
+    waits of the next, and fetching pauses when the audio stages fall
+    behind.
+
+    All fetches share one semaphore and the TTS client's rate limiter, so
+    the pack takes about as long as its total request count allows under
+    the quota rather than the sum of per-file runs.
+
+    Scripts using another TTS model get a client derived with
+    ``TTSClient.with_model``, sharing the same Vertex AI connection.
+    """
+
+    def __init__(
+        self,
+        tts_client: TTSClient,
+        discovery: PackDiscovery | None = None,
+        parser: AudioScriptParser | None = None,
+        character_loader: CharacterLoader | None = None,
+        exporter: MP3Exporter | None = None,
+        pause_config: PauseConfig | None = None,
+        rate_limiter_factory: Callable[[str], RateLimiter] | None = None,
+        encoder_workers: int | None = None,
+        codec: PCMCodec | None = None,
+    ):
+        """Initialize pack builder.
+
+        Args:
+            tts_client: TTS client (with a rate limiter) shared by all scripts
+            discovery: Pack script discovery instance
+            parser: Script parser shared by all scripts
+            character_loader: Character loader shared by all scripts
+            exporter: MP3 exporter shared by all scripts
+            pause_config: Pause configuration for every script
+            rate_limiter_factory: Creates the limiter for a model other than
+                the client's own (quotas are per model); None shares the
+                client's limiter
+            encoder_workers: Concurrent MP3 encodes (default: CPU count)
+            codec: Compression of saved batch audio (defaults to PCMCodec())
+
+        Raises:
+            ValueError: If the TTS client has no rate limiter
+        """
+        if tts_client.rate_limiter is None:
+            raise ValueError("Pack builds require a TTS client with a rate limiter")
+
+        self._tts_client = tts_client
+        self._discovery = discovery or PackDiscovery()
+        self._parser = parser or AudioScriptParser()
+        self._character_loader = character_loader or CharacterLoader()
+        self._noise_bank = ComfortNoiseBank()
+        self._exporter = exporter or MP3Exporter()
+        self._encoder_workers = encoder_workers
+        self._codec = codec
+        self._pause_config = pause_config
+        self._rate_limiter_factory = rate_limiter_factory
+        self._clients: dict[str, TTSClient] = {tts_client.model: tts_client}
+
+    def discover(self, pack_dir: Path) -> list[PackScript]:
+        """List the pack's audio scripts and their output assets.
+
+        Args:
+            pack_dir: Pack directory
+
+        Returns:
+            Scripts in build order
+        """
+        return self._discovery.discover(pack_dir)
+
+    def build(
+        self,
+        pack_dir: Path,
+        resume: bool = False,
+        verify: bool = True,
+        skip_existing: bool = False,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+        request_timeout: float | None = TTS_REQUEST_TIMEOUT_SEC,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> PackBuildResult:
+        """Build every audio asset of a pack.
+
+        Args:
+            pack_dir: Pack directory
+            resume: If True, reuse saved progress of each script
+            verify: If True, verify each MP3 after export
+            skip_existing: If True, leave scripts whose asset exists alone
+            max_concurrency: Maximum TTS requests in flight across the pack
+            request_timeout: Per-attempt TTS request timeout in seconds
+            progress_callback: Optional callback for pack-wide batch
+                progress (current, total)
+
+        Returns:
+            PackBuildResult listing built, skipped and failed scripts
+        """
+        return asyncio.run(
+            self.abuild(
+                pack_dir,
+                resume=resume,
+                verify=verify,
+                skip_existing=skip_existing,
+                max_concurrency=max_concurrency,
+                request_timeout=request_timeout,
+                progress_callback=progress_callback,
+            )
+        )
+
+    async def abuild(
+        self,
+        pack_dir: Path,
+        resume: bool = False,
+        verify: bool = True,
+        skip_existing: bool = False,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+        request_timeout: float | None = TTS_REQUEST_TIMEOUT_SEC,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> PackBuildResult:
+        """Build every audio asset of a pack on the running event loop.
+
+        Same as ``build``; see there for arguments.
+        """
+        result = PackBuildResult()
+        scripts = self.discover(pack_dir)
+        logging.info(f"Found {len(scripts)} audio scripts in {pack_dir}")
+
+        # Parse and batch everything before the first API call
+        jobs: list[tuple[PackScript, AudioGenerationPipeline, PreparedScript]] = []
+        for script in scripts:
+            if skip_existing and script.output.exists():
+                logging.info(f"Skipping {script.name} (already exists)")
+                result.skipped.append(script)
+                continue
+            try:
+                pipeline = self._create_pipeline()
+                prepared = pipeline.prepare(script.source)
+                pipeline.set_tts_client(self._client_for(prepared.script.tts_model))
+                pipeline.set_progress_manager(self._progress_manager_for(script))
+            except Exception as e:
+                logging.error(f"Could not prepare {script.source}: {e}")
+                result.failed[script.name] = str(e)
+                continue
+            jobs.append((script, pipeline, prepared))
+
+        total_batches = sum(len(prepared.batches) for _, _, prepared in jobs)
+        logging.info(
+            f"Synthesizing {total_batches} batches from {len(jobs)} scripts "
+            f"with up to {max_concurrency} concurrent requests"
+        )
+
+        completed: dict[str, int] = {}
+
+        def track(script: PackScript) -> Callable[[int, int], None] | None:
+            if progress_callback is None:
+                return None
+
+            def report(current: int, total: int) -> None:
+                completed[script.name] = current
+                progress_callback(sum(completed.values()), total_batches)
+
+            return report
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def fetch(job: _BuildJob) -> _BuildJob:
+            job.audio = await job.pipeline.synthesize_async(
+                job.prepared,
+                job.script.source,
+                resume=resume,
+                progress_callback=track(job.script),
+                request_timeout=request_timeout,
+                semaphore=semaphore,
+            )
+            return job
+
+        def decode(job: _BuildJob) -> _BuildJob:
+            job.audio = job.pipeline.normalize_audio(job.audio)
+            return job
+
+        def mix(job: _BuildJob) -> _BuildJob:
+            job.audio = job.pipeline.mix_audio(job.prepared, job.audio)
+            return job
+
+        # Encodes run on the pool's workers, one ffmpeg process each
+        encoder_pool = EncoderPool(self._exporter, workers=self._encoder_workers)
+
+        async def encode(job: _BuildJob) -> _BuildJob:
+            future = encoder_pool.submit(job.audio, job.script.output, verify)
+            job.audio = job.pipeline.complete_export(await asyncio.wrap_future(future))
+            logging.info(f"Built {job.script.name}")
+            return job
+
+        stages = StagedPipeline(
+            [
+                Stage("fetch", fetch, workers=FETCH_STAGE_WORKERS),
+                Stage.in_thread("decode", decode),
+                Stage.in_thread("mix", mix),
+                Stage("encode", encode, workers=encoder_pool.workers),
+            ],
+            queue_size=STAGE_QUEUE_SIZE,
+        )
+
+        started = time.monotonic()
+        try:
+            outcomes = await stages.run([_BuildJob(*job) for job in jobs])
+        finally:
+            encoder_pool.close()
+
+        for (script, _, _), outcome in zip(jobs, outcomes):
+            if isinstance(outcome, BaseException):
+                logging.error(f"Failed to build {script.name}: {outcome}")
+                result.failed[script.name] = str(outcome)
+            else:
+                result.built.append(script)
+                self._remove_progress_dir(script)
+
+        result.stage_metrics = stages.metrics
+        stages.log_metrics()
+        logging.info(
+            f"Pack build finished in {time.monotonic() - started:.0f}s: "
+            f"{len(result.built)} built, {len(result.skipped)} skipped, "
+            f"{len(result.failed)} failed"
+        )
+        return result
+
+    def _create_pipeline(self) -> AudioGenerationPipeline:
+        """Create a pipeline sharing this builder's parser and profiles."""
+        return AudioGenerationPipeline(
+            parser=self._parser,
+            exporter=self._exporter,
+            pause_config=self._pause_config,
+            character_loader=self._character_loader,
+            noise_bank=self._noise_bank,
+        )
+
+    def _client_for(self, model: str) -> TTSClient:
+        """Get the TTS client for a model, deriving it on first use.
+
+        Args:
+            model: TTS model declared by a script
+
+        Returns:
+            TTS client bound to ``model``
+        """
+        if model not in self._clients:
+            limiter = (
+                self._rate_limiter_factory(model)
+                if self._rate_limiter_factory
+                else None
+            )
+            self._clients[model] = self._tts_client.with_model(model, limiter)
+        return self._clients[model]
+
+    def _progress_dir_for(self, script: PackScript) -> Path:
+        """Get the directory holding a script's resume progress."""
+        return script.output.parent / PACK_PROGRESS_DIR / script.output.stem
+
+    def _progress_manager_for(self, script: PackScript) -> ProgressManager:
+        """Create the progress manager of one script.
+
+        Each output gets its own directory, since the pack's assets share
+        one folder and progress files would otherwise collide.
+
+        Args:
+            script: Pack script
+
+        Returns:
+            ProgressManager for the script
+        """
+        progress_dir = self._progress_dir_for(script)
+        progress_dir.mkdir(parents=True, exist_ok=True)
+        return ProgressManager(progress_dir, codec=self._codec)
+
+    def _remove_progress_dir(self, script: PackScript) -> None:
+        """Remove a built script's (now empty) progress directories."""
+        progress_dir = self._progress_dir_for(script)
+        for directory in (progress_dir, progress_dir.parent):
+            try:
+                directory.rmdir()
+            except OSError:
+                break  # Missing, or still used by another script
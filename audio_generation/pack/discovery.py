@@ -0,0 +1,115 @@
+"""Discovery of a story pack's audio scripts and their output assets."""
+
+import json
+import logging
+import re
+from pathlib import Path
+
+from audio_generation.domain.models import PackScript
+
+# Hub scripts whose asset name differs from the script name
+HUB_OUTPUT_NAMES = {
+    "menu": "hub-menu.mp3",
+    "welcome-back": "hub-welcome-back.mp3",
+}
+
+
+class PackDiscovery:
+    """Finds every audio script of a story pack and maps it to its asset.
+
+    Follows the pack export convention::
+
+        src/hub/menu.md                    -> assets/hub-menu.mp3
+        src/hub/welcome-back.md            -> assets/hub-welcome-back.mp3
+        src/hub/{name}.md                  -> assets/{name}.mp3
+        src/stories/{nn}-{id}/audio-script.md -> assets/story-{nn}-{short}.mp3
+
+    Story asset names are taken from the ``audio`` fields of ``story.json``,
+    which is the only place the short name is recorded.
+    """
+
+    def discover(self, pack_dir: Path) -> list[PackScript]:
+        """List the pack's audio scripts, hub first, then stories in order.
+
+        Args:
+            pack_dir: Pack directory (e.g. stories/explorateur-croyances)
+
+        Returns:
+            Scripts with their output paths under ``pack_dir/assets``
+
+        Raises:
+            FileNotFoundError: If the pack has no audio scripts
+        """
+        src_dir = pack_dir / "src"
+        if not src_dir.is_dir():
+            src_dir = pack_dir
+        assets_dir = pack_dir / "assets"
+        story_audio = self._story_audio_names(pack_dir / "story.json")
+
+        scripts: list[PackScript] = []
+
+        hub_dir = src_dir / "hub"
+        if hub_dir.is_dir():
+            for script in sorted(hub_dir.glob("*.md")):
+                output_name = HUB_OUTPUT_NAMES.get(script.stem, f"{script.stem}.mp3")
+                scripts.append(PackScript(script, assets_dir / output_name))
+
+        stories_dir = src_dir / "stories"
+        if stories_dir.is_dir():
+            for story_dir in sorted(p for p in stories_dir.iterdir() if p.is_dir()):
+                script = story_dir / "audio-script.md"
+                if not script.exists():
+                    logging.warning(f"No audio-script.md in {story_dir}, skipping")
+                    continue
+                output_name = self._story_output_name(story_dir.name, story_audio)
+                scripts.append(PackScript(script, assets_dir / output_name))
+
+        if not scripts:
+            raise FileNotFoundError(f"No audio scripts found in pack: {pack_dir}")
+        return scripts
+
+    def _story_audio_names(self, story_json: Path) -> list[str]:
+        """Read the story-* audio filenames referenced by story.json.
+
+        Args:
+            story_json: Path to story.json
+
+        Returns:
+            Audio filenames starting with "story-" (empty if unavailable)
+        """
+        if not story_json.exists():
+            return []
+        try:
+            data = json.loads(story_json.read_text(encoding="utf-8"))
+        except json.JSONDecodeError as e:
+            logging.warning(f"Could not read {story_json}: {e}")
+            return []
+
+        return [
+            node["audio"]
+            for node in data.get("stageNodes", [])
+            if isinstance(node.get("audio"), str) and node["audio"].startswith("story-")
+        ]
+
+    def _story_output_name(self, story_id: str, story_audio: list[str]) -> str:
+        """Map a story directory name to its asset filename.
+
+        Args:
+            story_id: Story directory name (e.g. "01-dieux-olympe")
+            story_audio: story-* filenames referenced by story.json
+
+        Returns:
+            Asset filename (e.g. "story-01-olympe.mp3")
+        """
+        match = re.match(r"(\d+)-", story_id)
+        if match:
+            prefix = f"story-{match.group(1)}-"
+            for name in story_audio:
+                if name.startswith(prefix):
+                    return name
+
+        fallback = f"story-{story_id}.mp3"
+        logging.warning(
+            f"No story.json audio entry for story {story_id}, using {fallback}"
+        )
+        return fallback
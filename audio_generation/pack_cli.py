@@ -0,0 +1,188 @@
+"""Command-line interface for building all audio of a story pack."""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+from audio_generation.caching.pcm_codec import PCMCodec
+from audio_generation.caching.tts_cache import TTSResponseCache
+from audio_generation.cli import (
+    add_scheduling_arguments,
+    build_rate_limiter,
+    get_vertex_config,
+    print_progress,
+    validate_scheduling_arguments,
+)
+from audio_generation.domain.constants import DEFAULT_TTS_MODEL
+from audio_generation.pack.builder import PackBuilder
+from audio_generation.pack.discovery import PackDiscovery
+from audio_generation.parsing.parse_cache import ParseCache
+from audio_generation.parsing.script_parser import AudioScriptParser
+from audio_generation.tts.client import TTSClient
+from audio_generation.utils.logging import setup_logging
+from audio_generation.verification.frame_index import FrameIndexer
+
+
+def main() -> None:
+    """Main entry point for pack CLI."""
+    parser = argparse.ArgumentParser(
+        description="Generate every audio asset of a story pack in one run",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python -m audio_generation.pack_cli stories/explorateur-croyances --dry-run
+  python -m audio_generation.pack_cli stories/explorateur-croyances
+  python -m audio_generation.pack_cli stories/explorateur-croyances --resume
+  python -m audio_generation.pack_cli stories/explorateur-croyances --skip-existing
+
+Scripts and outputs:
+  src/hub/menu.md                 -> assets/hub-menu.mp3
+  src/hub/welcome-back.md         -> assets/hub-welcome-back.mp3
+  src/hub/{name}.md               -> assets/{name}.mp3
+  src/stories/{id}/audio-script.md -> assets/story-{nn}-{short}.mp3 (from story.json)
+
+All batches of all scripts share one request scheduler and rate limiter;
+finished scripts are exported while the others are still synthesizing.
+        """,
+    )
+
+    parser.add_argument(
+        "pack",
+        type=Path,
+        help="Pack directory (e.g. stories/explorateur-croyances)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Check every script and list it with its segment count, output "
+        "file and existing duration",
+    )
+    parser.add_argument(
+        "--skip-existing",
+        action="store_true",
+        help="Leave scripts whose output MP3 already exists alone",
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Enable debug logging",
+    )
+    parser.add_argument(
+        "--no-verify",
+        action="store_true",
+        help="Skip output format verification",
+    )
+    parser.add_argument(
+        "--no-progress",
+        action="store_true",
+        help="Disable progress bar output",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume each script from saved progress",
+    )
+    parser.add_argument(
+        "--encoders",
+        type=int,
+        default=None,
+        help="MP3 files encoded in parallel (default: CPU count)",
+    )
+    add_scheduling_arguments(parser)
+
+    args = parser.parse_args()
+    setup_logging(args.debug)
+
+    if not args.pack.is_dir():
+        logging.error(f"Pack directory not found: {args.pack}")
+        sys.exit(1)
+    validate_scheduling_arguments(args)
+    if args.encoders is not None and args.encoders < 1:
+        logging.error("--encoders must be at least 1")
+        sys.exit(1)
+
+    # Unchanged scripts are not parsed again, across runs
+    script_parser = AudioScriptParser(cache=ParseCache())
+
+    if args.dry_run:
+        try:
+            scripts = PackDiscovery().discover(args.pack)
+        except FileNotFoundError as e:
+            logging.error(str(e))
+            sys.exit(1)
+        # Durations of existing assets come from cached frame indexes
+        built = [s.output for s in scripts if s.output.exists()]
+        indexes = FrameIndexer().index_files(built)
+        invalid = 0
+        for script in scripts:
+            line = f"{script.source.relative_to(args.pack)} -> {script.output}"
+            try:
+                segments = len(script_parser.parse(script.source).segments)
+                line += f" [{segments} segments]"
+            except Exception as e:
+                line += f" [invalid: {e}]"
+                invalid += 1
+            if script.output in indexes:
+                line += f" ({indexes[script.output].duration_sec:.1f}s)"
+            print(line)
+        if invalid:
+            logging.error(f"{invalid} scripts could not be parsed")
+            sys.exit(1)
+        return
+
+    try:
+        project, location = get_vertex_config()
+        logging.info(
+            f"Connecting to Vertex AI (project={project}, location={location})"
+        )
+
+        codec = PCMCodec(args.pcm_compression)
+        cache = None if args.no_cache else TTSResponseCache(args.cache_dir, codec=codec)
+        tts_client = TTSClient(
+            project=project,
+            location=location,
+            model=DEFAULT_TTS_MODEL,
+            rate_limiter=build_rate_limiter(args, project, location, DEFAULT_TTS_MODEL),
+            cache=cache,
+        )
+        builder = PackBuilder(
+            tts_client,
+            parser=script_parser,
+            rate_limiter_factory=lambda model: build_rate_limiter(
+                args, project, location, model
+            ),
+            encoder_workers=args.encoders,
+            codec=codec,
+        )
+
+        result = builder.build(
+            args.pack,
+            resume=args.resume,
+            verify=not args.no_verify,
+            skip_existing=args.skip_existing,
+            max_concurrency=args.concurrency,
+            progress_callback=None if args.no_progress else print_progress,
+        )
+
+        if cache is not None:
+            stats = cache.stats()
+            logging.info(f"TTS cache: {stats.hits} hits, {stats.misses} API calls")
+
+    except Exception as e:
+        logging.error(f"Failed to build pack: {e}")
+        if args.debug:
+            import traceback
+
+            traceback.print_exc()
+        sys.exit(1)
+
+    if not result.passed:
+        for name, error in result.failed.items():
+            logging.error(f"  - {name}: {error}")
+        logging.error("Some scripts failed. Re-run with --resume to continue.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
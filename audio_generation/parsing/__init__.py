@@ -1,5 +1,6 @@
 """Audio script parsing module."""
 
+from audio_generation.parsing.parse_cache import ParseCache
 from audio_generation.parsing.script_parser import AudioScriptParser
 
-__all__ = ["AudioScriptParser"]
+__all__ = ["AudioScriptParser", "ParseCache"]
@@ -0,0 +1,172 @@
+"""Cache of parsed audio scripts, in memory and on disk."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from audio_generation.domain.constants import (
+    DEFAULT_TTS_MODEL,
+    DEFAULT_VOICE,
+    PARSE_CACHE_DIR,
+)
+from audio_generation.domain.models import AudioScript, Segment, SpeakerConfig
+
+# Bump when the parser's output for the same content changes
+CACHE_FORMAT_VERSION = 1
+
+
+class ParseCache:
+    """Parsed AudioScripts keyed by file content.
+
+    Entries are compact JSON (speakers and segments as arrays) named after
+    a SHA-256 of the file content, the format version and the parser
+    defaults, under a two-level fan-out directory. Each instance also
+    remembers the parse of every path it saw, valid while the file's size
+    and mtime are unchanged, so parsing a file again in the same process
+    (e.g. inspecting a script, then generating it) costs one stat.
+
+    Every lookup returns new objects, so callers may modify the script
+    (e.g. override voices) without affecting later lookups.
+    """
+
+    def __init__(self, cache_dir: Path | None = None):
+        """Initialize cache.
+
+        Args:
+            cache_dir: Cache directory (defaults to PARSE_CACHE_DIR)
+        """
+        self._cache_dir = cache_dir or Path(PARSE_CACHE_DIR).expanduser()
+        self._lock = threading.Lock()
+        # Resolved path to (size, mtime_ns, serialized script)
+        self._recent: dict[Path, tuple[int, int, dict]] = {}
+
+    @staticmethod
+    def make_key(content: bytes) -> str:
+        """Build the key of a script's content.
+
+        Args:
+            content: Raw file content
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        digest = hashlib.sha256(
+            f"{CACHE_FORMAT_VERSION}\0{DEFAULT_VOICE}\0{DEFAULT_TTS_MODEL}\0".encode()
+        )
+        digest.update(content)
+        return digest.hexdigest()
+
+    def get(self, file_path: Path) -> AudioScript | None:
+        """Look up the parse of a file's current content.
+
+        Args:
+            file_path: Script file path
+
+        Returns:
+            Parsed script, or None on a miss
+        """
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None  # The parser reports unreadable files
+
+        path = file_path.resolve()
+        with self._lock:
+            recent = self._recent.get(path)
+        if recent and recent[:2] == (stat.st_size, stat.st_mtime_ns):
+            return _from_record(recent[2])
+
+        try:
+            content = file_path.read_bytes()
+            record = json.loads(self._path_for(self.make_key(content)).read_text())
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logging.warning(f"Ignoring unreadable parse cache entry: {e}")
+            return None
+
+        try:
+            script = _from_record(record)
+        except (KeyError, TypeError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable parse cache entry: {e}")
+            return None
+        self._remember(path, stat, content, record)
+        return script
+
+    def put(self, file_path: Path, content: bytes, script: AudioScript) -> None:
+        """Store the parse of a file (best effort).
+
+        Args:
+            file_path: Script file path
+            content: Raw file content the script was parsed from
+            script: Parsed script
+        """
+        record = _to_record(script)
+        entry_path = self._path_for(self.make_key(content))
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(record, f, ensure_ascii=False, separators=(",", ":"))
+                os.replace(tmp_name, entry_path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            # TypeError: frontmatter values JSON cannot hold (e.g. dates)
+            logging.warning(f"Could not save parse cache entry for {file_path}: {e}")
+            return
+
+        try:
+            self._remember(file_path.resolve(), file_path.stat(), content, record)
+        except OSError:
+            pass
+
+    @property
+    def cache_dir(self) -> Path:
+        """Get the cache directory."""
+        return self._cache_dir
+
+    def _remember(
+        self, path: Path, stat: os.stat_result, content: bytes, record: dict
+    ) -> None:
+        """Remember a path's parse while its size and mtime are unchanged."""
+        if stat.st_size != len(content):
+            return  # Changed since it was read
+        with self._lock:
+            self._recent[path] = (stat.st_size, stat.st_mtime_ns, record)
+
+    def _path_for(self, key: str) -> Path:
+        """Map a key to its entry path (two-level fan-out)."""
+        return self._cache_dir / key[:2] / f"{key}.json"
+
+
+def _to_record(script: AudioScript) -> dict:
+    """Serialize a script compactly (lists instead of objects)."""
+    return {
+        "stage_uuid": script.stage_uuid,
+        "chapter_ref": script.chapter_ref,
+        "locale": script.locale,
+        "tts_model": script.tts_model,
+        "speakers": [[cfg.name, cfg.voice] for cfg in script.speaker_configs],
+        "segments": [[seg.speaker, seg.text, seg.emotion] for seg in script.segments],
+    }
+
+
+def _from_record(record: dict) -> AudioScript:
+    """Build a new AudioScript from a serialized one."""
+    return AudioScript(
+        stage_uuid=record["stage_uuid"],
+        chapter_ref=record["chapter_ref"],
+        locale=record["locale"],
+        speaker_configs=[
+            SpeakerConfig(name, voice) for name, voice in record["speakers"]
+        ],
+        segments=[Segment(*segment) for segment in record["segments"]],
+        tts_model=record["tts_model"],
+    )
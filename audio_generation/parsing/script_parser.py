@@ -12,6 +12,7 @@ from audio_generation.domain.models import (
     SpeakerConfig,
 )
 from audio_generation.domain.constants import DEFAULT_TTS_MODEL, DEFAULT_VOICE
+from audio_generation.parsing.parse_cache import ParseCache
 
 
 class AudioScriptParser:
@@ -31,8 +32,19 @@ class AudioScriptParser:
 
     **Narrator:** <emotion: warm> Text with emotion marker inline...
     **Emma:** <emotion: curious> Character dialogue...
+
+    With a ParseCache, unchanged files are not parsed again (warnings about
+    undefined speakers are only logged when a file is actually parsed).
     """
 
+    def __init__(self, cache: ParseCache | None = None):
+        """Initialize parser.
+
+        Args:
+            cache: Optional cache of parsed scripts
+        """
+        self._cache = cache
+
     def parse(self, file_path: Path) -> AudioScript:
         """Parse audio-script markdown file into AudioScript dataclass.
 
@@ -45,7 +57,30 @@ class AudioScriptParser:
         Raises:
             ValueError: If file format is invalid
         """
-        content = file_path.read_text(encoding="utf-8")
+        if self._cache is not None:
+            cached = self._cache.get(file_path)
+            if cached is not None:
+                logging.debug(f"Parse cache hit: {file_path}")
+                return cached
+
+        raw = file_path.read_bytes()
+        script = self.parse_text(raw.decode("utf-8"))
+        if self._cache is not None:
+            self._cache.put(file_path, raw, script)
+        return script
+
+    def parse_text(self, content: str) -> AudioScript:
+        """Parse audio-script markdown content into AudioScript dataclass.
+
+        Args:
+            content: Full file content
+
+        Returns:
+            Parsed AudioScript dataclass
+
+        Raises:
+            ValueError: If content format is invalid
+        """
         frontmatter, body = self._split_frontmatter(content)
         speaker_configs = self._parse_speaker_configs(frontmatter)
         segments = self._parse_transcript(body, speaker_configs)
@@ -0,0 +1,216 @@
+"""Packed append-only store of batch audio."""
+
+import json
+import logging
+import mmap
+import os
+import tempfile
+import threading
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator
+
+from audio_generation.domain.constants import (
+    BATCH_STORE_DATA_NAME,
+    BATCH_STORE_INDEX_NAME,
+)
+
+
+class BatchAudioStore:
+    """Keeps every batch's PCM in one data file with an offset index.
+
+    Audio is appended to a single data file and fsync'd, then one JSON
+    line with its key, offset, length and CRC-32 is appended to the index
+    (a torn last line is ignored on load, and data without an index line
+    is simply unreferenced). Reads return zero-copy memoryviews into a
+    read-only memory map of the data file, so resuming a script costs one
+    mmap instead of a file read per batch.
+    """
+
+    def __init__(self, directory: Path):
+        """Initialize store.
+
+        Args:
+            directory: Directory holding the data and index files
+        """
+        self._directory = directory
+        self._data_path = directory / BATCH_STORE_DATA_NAME
+        self._index_path = directory / BATCH_STORE_INDEX_NAME
+        self._entries: dict[str, tuple[int, int, int]] | None = None
+        self._map: mmap.mmap | None = None
+        self._lock = threading.Lock()
+
+    def put(self, key: str, audio_data: bytes) -> None:
+        """Append audio durably under a key (replacing an older entry).
+
+        Args:
+            key: Entry key
+            audio_data: Raw PCM audio data
+        """
+        with self._lock:
+            entries = self._load()
+            self._directory.mkdir(parents=True, exist_ok=True)
+            with open(self._data_path, "ab") as f:
+                offset = f.seek(0, os.SEEK_END)
+                f.write(audio_data)
+                f.flush()
+                os.fsync(f.fileno())
+
+            entry = (offset, len(audio_data), zlib.crc32(audio_data))
+            with open(self._index_path, "a", encoding="utf-8") as f:
+                f.write(_index_line(key, *entry))
+                f.flush()
+                os.fsync(f.fileno())
+            entries[key] = entry
+
+    def get(self, key: str) -> memoryview:
+        """Get stored audio without copying it.
+
+        Args:
+            key: Entry key
+
+        Returns:
+            Read-only view into the memory-mapped data file
+
+        Raises:
+            KeyError: If the key is not stored
+        """
+        with self._lock:
+            offset, length, _ = self._load()[key]
+            data = self._mapped(offset + length)
+        return memoryview(data)[offset : offset + length]
+
+    def verify(self, key: str) -> bool:
+        """Check that an entry exists and its data matches its checksum.
+
+        Args:
+            key: Entry key
+
+        Returns:
+            True if the entry can be used
+        """
+        with self._lock:
+            entry = self._load().get(key)
+            if entry is None:
+                return False
+            offset, length, crc = entry
+            if not self._data_path.exists():
+                return False
+            if self._data_path.stat().st_size < offset + length:
+                return False
+            data = self._mapped(offset + length)
+        return zlib.crc32(memoryview(data)[offset : offset + length]) == crc
+
+    def retain(self, keep: set[str]) -> None:
+        """Drop every entry not in ``keep`` and compact the data file.
+
+        Args:
+            keep: Keys to keep
+        """
+        with self._lock:
+            entries = self._load()
+            if set(entries) <= keep:
+                return
+
+            kept = {k: v for k, v in entries.items() if k in keep}
+            removed = len(entries) - len(kept)
+            data = self._mapped(max((o + n for o, n, _ in kept.values()), default=0))
+
+            new_entries: dict[str, tuple[int, int, int]] = {}
+            with _atomic_write(self._data_path, "wb") as f:
+                for key, (offset, length, crc) in kept.items():
+                    new_entries[key] = (f.tell(), length, crc)
+                    f.write(memoryview(data)[offset : offset + length])
+            # A crash between the two renames leaves offsets that fail
+            # their checksums, so those batches are regenerated
+            with _atomic_write(self._index_path, "w") as f:
+                for key, (offset, length, crc) in new_entries.items():
+                    f.write(_index_line(key, offset, length, crc))
+
+            # Views handed out earlier keep the old map alive
+            self._map = None
+            self._entries = new_entries
+            logging.debug(f"Removed {removed} stale batch audio entries")
+
+    def __contains__(self, key: str) -> bool:
+        """Whether a key is stored."""
+        with self._lock:
+            return key in self._load()
+
+    def __len__(self) -> int:
+        """Number of stored entries."""
+        with self._lock:
+            return len(self._load())
+
+    def _load(self) -> dict[str, tuple[int, int, int]]:
+        """Read the index once (lock held).
+
+        Returns:
+            Key to (offset, length, crc), latest entry per key
+        """
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = {}
+        try:
+            lines = self._index_path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return self._entries
+        for line in lines:
+            try:
+                record = json.loads(line)
+                self._entries[record["key"]] = (
+                    int(record["offset"]),
+                    int(record["length"]),
+                    int(record["crc"]),
+                )
+            except (json.JSONDecodeError, TypeError, KeyError, ValueError) as e:
+                logging.warning(f"Skipping unreadable batch index line: {e}")
+        return self._entries
+
+    def _mapped(self, size: int) -> mmap.mmap | bytes:
+        """Get a map of the data file covering at least ``size`` bytes.
+
+        Args:
+            size: Bytes the caller needs to read
+
+        Returns:
+            Read-only memory map (empty bytes when nothing is stored)
+        """
+        if size == 0:
+            return b""
+        if self._map is None or len(self._map) < size:
+            # Earlier maps stay valid for views handed out from them
+            with open(self._data_path, "rb") as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+
+def _index_line(key: str, offset: int, length: int, crc: int) -> str:
+    """Format one index record as a JSON line."""
+    record = {"key": key, "offset": offset, "length": length, "crc": crc}
+    return json.dumps(record) + "\n"
+
+
+@contextmanager
+def _atomic_write(path: Path, mode: str) -> Iterator[IO]:
+    """Write a temporary file that replaces ``path`` once fsync'd.
+
+    Args:
+        path: File to replace
+        mode: File mode ("w" or "wb")
+
+    Yields:
+        Open temporary file
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
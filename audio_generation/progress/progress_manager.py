@@ -3,13 +3,23 @@
 import hashlib
 import json
 import logging
+import os
 import shutil
+import tempfile
+import threading
 from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
 
-from audio_generation.domain.models import GenerationProgress
-from audio_generation.domain.constants import PROGRESS_FILE_NAME
+from audio_generation.caching.pcm_codec import PCMCodec
+from audio_generation.domain.constants import PROGRESS_FILE_NAME, PROGRESS_JOURNAL_NAME
+from audio_generation.domain.models import (
+    CharacterProfile,
+    GenerationProgress,
+    SegmentBatch,
+    SpeakerConfig,
+)
+from audio_generation.progress.batch_store import BatchAudioStore
 
 
 class ProgressManager:
@@ -17,21 +27,39 @@ class ProgressManager:
 
     Enables resuming audio generation after failures (e.g., API rate limits)
     by persisting progress to disk and tracking which batches are complete.
+    Completed batches are identified by a fingerprint of their content, so a
+    resumed run after editing the script reuses every batch that did not
+    change, even when batches were inserted or removed around it.
+
+    Progress is stored as a snapshot (``.progress.json``, replaced
+    atomically) plus an append-only journal with one fsync'd line per
+    completed or failed batch, so recording a batch costs one small write
+    whatever the script length. Loading replays the journal onto the
+    snapshot, ignoring a line torn by a crash, and compacts both into a
+    new snapshot.
     """
 
-    def __init__(self, output_dir: Path):
+    def __init__(self, output_dir: Path, codec: PCMCodec | None = None):
         """Initialize progress manager.
 
         Args:
             output_dir: Directory to store progress files and batch audio
+            codec: Compression of saved batch audio (defaults to PCMCodec())
         """
         self._output_dir = output_dir
+        self._codec = codec or PCMCodec()
         self._progress_path = output_dir / PROGRESS_FILE_NAME
+        self._journal_path = output_dir / PROGRESS_JOURNAL_NAME
         self._batch_dir = output_dir / "batches"
+        self._batch_store = BatchAudioStore(self._batch_dir)
+        self._lock = threading.Lock()  # Serializes journal appends
 
     def load(self) -> GenerationProgress | None:
         """Load existing progress from disk.
 
+        Replays the journal onto the snapshot and compacts them into a new
+        snapshot.
+
         Returns:
             GenerationProgress if valid progress exists, None otherwise
         """
@@ -40,11 +68,12 @@ class ProgressManager:
 
         try:
             data = json.loads(self._progress_path.read_text())
-            return GenerationProgress(
+            progress = GenerationProgress(
                 input_file_hash=data["input_file_hash"],
                 total_batches=data["total_batches"],
-                completed_batches=data.get("completed_batches", []),
+                completed_batches=set(data.get("completed_batches", [])),
                 audio_files={int(k): v for k, v in data.get("audio_files", {}).items()},
+                batch_fingerprints=data.get("batch_fingerprints", []),
                 last_error=data.get("last_error"),
                 last_error_batch=data.get("last_error_batch"),
                 last_error_time=data.get("last_error_time"),
@@ -55,97 +84,189 @@ class ProgressManager:
             logging.warning(f"Could not load progress file: {e}")
             return None
 
+        if self._replay_journal(progress):
+            self._write_snapshot(progress)
+        return progress
+
     def save(self, progress: GenerationProgress) -> None:
-        """Save progress to disk.
+        """Save a full snapshot of progress and start a new journal.
 
         Args:
             progress: Progress state to persist
         """
         progress.updated_at = datetime.now().isoformat()
-        # Convert audio_files keys to strings for JSON serialization
-        data = asdict(progress)
-        data["audio_files"] = {str(k): v for k, v in progress.audio_files.items()}
-        self._progress_path.write_text(json.dumps(data, indent=2))
+        self._write_snapshot(progress)
+
+    def record_batch(
+        self, progress: GenerationProgress, batch_index: int, filename: str
+    ) -> None:
+        """Mark a batch complete and journal it durably.
+
+        Args:
+            progress: Progress state to update
+            batch_index: Index of the completed batch (0-based)
+            filename: Saved audio key from save_batch_audio
+        """
+        now = datetime.now().isoformat()
+        with self._lock:
+            progress.completed_batches.add(batch_index)
+            progress.audio_files[batch_index] = filename
+            progress.last_error = None
+            progress.last_error_batch = None
+            progress.last_error_time = None
+            progress.updated_at = now
+            self._append(
+                {
+                    "type": "batch",
+                    "batch": batch_index,
+                    "fingerprint": progress.batch_fingerprints[batch_index],
+                    "file": filename,
+                    "time": now,
+                }
+            )
+
+    def record_error(
+        self, progress: GenerationProgress, batch_index: int, error: str
+    ) -> None:
+        """Record a failed batch and journal it durably.
 
-    def save_batch_audio(self, batch_index: int, audio_data: bytes) -> str:
+        Args:
+            progress: Progress state to update
+            batch_index: Index of the failed batch (0-based)
+            error: Error message
+        """
+        now = datetime.now().isoformat()
+        with self._lock:
+            progress.last_error = error
+            progress.last_error_batch = batch_index
+            progress.last_error_time = now
+            progress.updated_at = now
+            self._append(
+                {"type": "error", "batch": batch_index, "error": error, "time": now}
+            )
+
+    def save_batch_audio(self, fingerprint: str, audio_data: bytes) -> str:
         """Save a single batch's audio data to disk immediately.
 
+        Audio is compressed and appended to the packed batch store under a
+        key derived from the batch fingerprint rather than its position, so
+        it stays valid when batches are inserted or removed.
+
         Args:
-            batch_index: Index of the batch (0-based)
+            fingerprint: Batch fingerprint from fingerprint_batch
             audio_data: Raw PCM audio data
 
         Returns:
-            Filename of saved audio file (relative to batches directory)
+            Key of the saved audio in the batch store
         """
-        self._batch_dir.mkdir(parents=True, exist_ok=True)
-        filename = f"batch_{batch_index:04d}.pcm"
-        filepath = self._batch_dir / filename
-        filepath.write_bytes(audio_data)
-        return filename
+        key = f"batch_{fingerprint[:16]}"
+        # Durable before the journal refers to it
+        self._batch_store.put(key, self._codec.encode(audio_data))
+        return key
 
-    def load_batch_audio(self, filename: str) -> bytes:
-        """Load a previously saved batch audio file.
+    def load_batch_audio(self, key: str) -> bytes | memoryview:
+        """Load previously saved batch audio.
 
         Args:
-            filename: Filename from save_batch_audio
+            key: Key from save_batch_audio
 
         Returns:
-            Raw PCM audio data
+            Raw PCM audio data (a view into the memory-mapped store when
+            it was saved uncompressed)
         """
-        filepath = self._batch_dir / filename
-        return filepath.read_bytes()
+        return self._codec.decode(self._batch_store.get(key))
 
     def clear(self) -> None:
         """Remove progress file and batch directory after successful completion."""
         if self._progress_path.exists():
             self._progress_path.unlink()
             logging.debug("Removed progress file")
+        self._journal_path.unlink(missing_ok=True)
 
         if self._batch_dir.exists():
             shutil.rmtree(self._batch_dir)
             logging.debug("Removed batch directory")
+        self._batch_store = BatchAudioStore(self._batch_dir)
 
-    def validate(
-        self, progress: GenerationProgress, input_file: Path, total_batches: int
-    ) -> bool:
-        """Check if saved progress is still valid for current run.
+    def reconcile(
+        self,
+        previous: GenerationProgress | None,
+        input_file: Path,
+        batch_fingerprints: list[str],
+    ) -> GenerationProgress:
+        """Build progress for the current batches, reusing unchanged work.
+
+        Every current batch whose fingerprint matches a completed batch of
+        the previous run is marked complete and points at the saved audio.
+        Saved audio no longer referenced by any current batch is deleted,
+        so a fresh start (no previous progress, e.g. without --resume)
+        empties the batch store instead of leaving an earlier run behind.
 
         Args:
-            progress: Previously loaded progress
+            previous: Previously loaded progress (None to start fresh)
             input_file: Current input file
-            total_batches: Expected batch count
+            batch_fingerprints: Fingerprint of each current batch, in order
 
         Returns:
-            True if progress is valid for resume, False otherwise
+            Progress for the current run
         """
-        current_hash = self.calculate_file_hash(input_file)
-        if progress.input_file_hash != current_hash:
-            logging.warning(
-                "Input file has changed since last run - progress invalidated"
-            )
-            return False
-        if progress.total_batches != total_batches:
-            logging.warning("Batch count changed - progress invalidated")
-            return False
-        return True
+        progress = self.create_initial_progress(input_file, batch_fingerprints)
+        if previous is None:
+            self._remove_unreferenced_audio(set())
+            return progress
+
+        if not previous.batch_fingerprints:
+            logging.warning("Saved progress has no batch fingerprints - starting fresh")
+            self._remove_unreferenced_audio(set())
+            return progress
+
+        reusable: dict[str, str] = {}
+        for batch_idx in previous.completed_batches:
+            filename = previous.audio_files.get(batch_idx)
+            if (
+                filename
+                and batch_idx < len(previous.batch_fingerprints)
+                and self._batch_store.verify(filename)
+            ):
+                reusable[previous.batch_fingerprints[batch_idx]] = filename
+
+        for batch_idx, fingerprint in enumerate(batch_fingerprints):
+            filename = reusable.get(fingerprint)
+            if filename:
+                progress.completed_batches.add(batch_idx)
+                progress.audio_files[batch_idx] = filename
+
+        progress.started_at = previous.started_at or progress.started_at
+        # Batch indices may have shifted, so only the message carries over
+        progress.last_error = previous.last_error
+
+        changed = len(batch_fingerprints) - len(progress.completed_batches)
+        logging.info(
+            f"Reusing {len(progress.completed_batches)}/{len(batch_fingerprints)} "
+            f"batches from saved progress ({changed} new or changed)"
+        )
+
+        self._remove_unreferenced_audio(set(progress.audio_files.values()))
+        return progress
 
     def create_initial_progress(
-        self, input_file: Path, total_batches: int
+        self, input_file: Path, batch_fingerprints: list[str]
     ) -> GenerationProgress:
         """Create a new progress tracking object.
 
         Args:
             input_file: Input markdown file
-            total_batches: Total number of batches
+            batch_fingerprints: Fingerprint of each batch, in order
 
         Returns:
             New GenerationProgress instance
         """
         return GenerationProgress(
             input_file_hash=self.calculate_file_hash(input_file),
-            total_batches=total_batches,
-            completed_batches=[],
+            total_batches=len(batch_fingerprints),
+            completed_batches=set(),
             audio_files={},
+            batch_fingerprints=list(batch_fingerprints),
             last_error=None,
             last_error_batch=None,
             last_error_time=None,
@@ -153,6 +274,147 @@ class ProgressManager:
             updated_at=datetime.now().isoformat(),
         )
 
+    def _write_snapshot(self, progress: GenerationProgress) -> None:
+        """Atomically replace the snapshot and discard the journal.
+
+        Args:
+            progress: Progress state to persist
+        """
+        data = asdict(progress)
+        data["completed_batches"] = sorted(progress.completed_batches)
+        # Convert audio_files keys to strings for JSON serialization
+        data["audio_files"] = {str(k): v for k, v in progress.audio_files.items()}
+
+        with self._lock:
+            self._output_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self._output_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_name, self._progress_path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+            # Everything journaled is now in the snapshot
+            self._journal_path.unlink(missing_ok=True)
+
+    def _append(self, record: dict) -> None:
+        """Append one record to the journal and fsync it (lock held).
+
+        Args:
+            record: JSON-serializable journal record
+        """
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with open(self._journal_path, "a", encoding="utf-8") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _replay_journal(self, progress: GenerationProgress) -> bool:
+        """Apply journaled records to a loaded snapshot.
+
+        Records for batches whose fingerprint does not match the snapshot
+        are skipped, and so is a final line torn by a crash mid-write.
+
+        Args:
+            progress: Snapshot to update in place
+
+        Returns:
+            True if the journal existed (and should be compacted)
+        """
+        try:
+            lines = self._journal_path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return False
+
+        applied = 0
+        for line in lines:
+            try:
+                record = json.loads(line)
+                batch_idx = record["batch"]
+                if record["type"] == "batch":
+                    fingerprints = progress.batch_fingerprints
+                    if not (
+                        0 <= batch_idx < len(fingerprints)
+                        and fingerprints[batch_idx] == record["fingerprint"]
+                    ):
+                        continue
+                    progress.completed_batches.add(batch_idx)
+                    progress.audio_files[batch_idx] = record["file"]
+                    progress.last_error = None
+                    progress.last_error_batch = None
+                    progress.last_error_time = None
+                elif record["type"] == "error":
+                    progress.last_error = record["error"]
+                    progress.last_error_batch = batch_idx
+                    progress.last_error_time = record["time"]
+                progress.updated_at = record["time"]
+                applied += 1
+            except (json.JSONDecodeError, TypeError, KeyError) as e:
+                logging.warning(f"Skipping unreadable progress journal line: {e}")
+
+        logging.debug(f"Replayed {applied} progress journal records")
+        return True
+
+    def _remove_unreferenced_audio(self, keep: set[str]) -> None:
+        """Delete saved batch audio that no current batch refers to.
+
+        Args:
+            keep: Store keys still referenced by progress
+        """
+        self._batch_store.retain(keep)
+
+        # Batch files written before audio was packed into one store
+        if self._batch_dir.exists():
+            for path in self._batch_dir.glob("batch_*.pcm"):
+                path.unlink()
+                logging.debug(f"Removed stale batch audio: {path.name}")
+
+    @staticmethod
+    def fingerprint_batch(
+        batch: SegmentBatch,
+        speaker_configs_map: dict[str, SpeakerConfig],
+        character_profiles: dict[str, CharacterProfile] | None = None,
+    ) -> str:
+        """Fingerprint everything that shapes a batch's synthesized audio.
+
+        Covers speakers, segment texts and emotions, each speaker's voice
+        and the character profile used in the prompt's Audio Profile.
+
+        Args:
+            batch: The segment batch
+            speaker_configs_map: Speaker name to config mapping
+            character_profiles: Speaker name to character profile mapping
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        profiles = character_profiles or {}
+        payload = {
+            "speakers": batch.speakers,
+            "segments": [
+                [segment.speaker, segment.text, segment.emotion]
+                for segment in batch.segments
+            ],
+            "voices": {
+                speaker: (
+                    speaker_configs_map[speaker].voice
+                    if speaker in speaker_configs_map
+                    else None
+                )
+                for speaker in batch.speakers
+            },
+            "profiles": {
+                speaker: asdict(profiles[speaker])
+                for speaker in batch.speakers
+                if speaker in profiles
+            },
+        }
+        encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
     @staticmethod
     def calculate_file_hash(file_path: Path) -> str:
         """Calculate MD5 hash of file for change detection.
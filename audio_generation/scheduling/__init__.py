@@ -0,0 +1,22 @@
+"""Request scheduling and rate limiting module."""
+
+from audio_generation.scheduling.rate_limiter import (
+    AdaptiveRateLimiter,
+    AIMDPolicy,
+    RateLimiter,
+    TokenBucketRateLimiter,
+)
+from audio_generation.scheduling.rate_state import RateStateStore
+from audio_generation.scheduling.shared_limiter import SharedRateLimiter
+from audio_generation.scheduling.staged_pipeline import Stage, StagedPipeline
+
+__all__ = [
+    "AdaptiveRateLimiter",
+    "AIMDPolicy",
+    "RateLimiter",
+    "RateStateStore",
+    "SharedRateLimiter",
+    "Stage",
+    "StagedPipeline",
+    "TokenBucketRateLimiter",
+]
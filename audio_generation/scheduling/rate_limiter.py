@@ -0,0 +1,329 @@
+"""Rate limiters gating TTS API requests."""
+
+import asyncio
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable
+
+from audio_generation.domain.constants import (
+    ADAPTIVE_MAX_RPM,
+    ADAPTIVE_MIN_RPM,
+    AIMD_DECREASE_COOLDOWN_SEC,
+    AIMD_DECREASE_FACTOR,
+    AIMD_INCREASE_RPM,
+    DEFAULT_REQUESTS_PER_MINUTE,
+)
+from audio_generation.scheduling.rate_state import RateStateStore
+
+
+class RateLimiter(ABC):
+    """Base class for request rate limiters.
+
+    Subclasses implement ``reserve()``, which claims the next request slot
+    and returns how long the caller must wait before using it. Waiting is
+    left to the caller so one limiter can be shared by worker threads and
+    asyncio tasks alike.
+    """
+
+    @abstractmethod
+    def reserve(self) -> float:
+        """Claim the next request slot.
+
+        Returns:
+            Seconds the caller must wait before sending its request
+        """
+
+    def acquire(self) -> None:
+        """Block until a request slot is available."""
+        delay = self.reserve()
+        if delay > 0:
+            logging.debug(f"Rate limit delay: {delay:.2f}s")
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a slot is available."""
+        delay = self.reserve()
+        if delay > 0:
+            logging.debug(f"Rate limit delay: {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+    def record_success(self) -> None:
+        """Report that a request completed successfully."""
+
+    def record_throttle(self, retry_after: float | None = None) -> None:
+        """Report that a request was rejected for exceeding quota.
+
+        Args:
+            retry_after: Server-provided retry hint in seconds, if any
+        """
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    """Thread-safe token bucket shared by concurrent TTS requests.
+
+    Tokens refill continuously at ``requests_per_minute / 60`` per second
+    up to ``burst``. A request that finds the bucket empty takes a token on
+    credit and is told to wait until that token would have refilled, so
+    concurrent callers are spaced out evenly instead of all retrying at once.
+
+    A throttle report carrying a retry-after hint pauses the bucket, so no
+    caller sends another request before the server asked to be contacted.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize token bucket.
+
+        Args:
+            requests_per_minute: Sustained request rate allowed by the quota
+            burst: Maximum number of requests that may start back-to-back
+            clock: Monotonic time source (injectable for tests)
+
+        Raises:
+            ValueError: If rate or burst are not positive
+        """
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self._rate = requests_per_minute / 60.0
+        self._burst = float(burst)
+        self._clock = clock
+        self._tokens = float(burst)
+        self._last_refill = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token, returning the wait until it is actually available.
+
+        Returns:
+            Seconds to wait before sending the request (0 if a token was free)
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+
+            self._tokens -= 1.0
+            # Refill resumes at _last_refill, which is in the future while paused
+            delay = max(0.0, self._last_refill - now)
+            if self._tokens < 0:
+                delay += -self._tokens / self._rate
+            return delay
+
+    def record_throttle(self, retry_after: float | None = None) -> None:
+        """Pause all requests for the server's retry-after hint, if any.
+
+        Args:
+            retry_after: Server-provided retry hint in seconds, if any
+        """
+        if retry_after:
+            self.pause(retry_after)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every request for at least ``seconds`` from now.
+
+        Args:
+            seconds: Pause duration
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+            self._last_refill = max(self._last_refill, now + seconds)
+        logging.info(f"Rate limiter paused for {seconds:.1f}s")
+
+    def _refill(self, now: float) -> None:
+        """Add tokens earned since the last refill (caller holds the lock)."""
+        if now <= self._last_refill:
+            return
+        elapsed = now - self._last_refill
+        self._tokens = min(self._burst, self._tokens + elapsed * self._rate)
+        self._last_refill = now
+
+    def _set_rate(self, requests_per_minute: float) -> None:
+        """Change the refill rate (caller holds the lock)."""
+        self._refill(self._clock())
+        self._rate = requests_per_minute / 60.0
+
+    @property
+    def requests_per_minute(self) -> float:
+        """Get the sustained request rate."""
+        return self._rate * 60.0
+
+
+class AIMDPolicy:
+    """Additive-increase / multiplicative-decrease rule for request rates.
+
+    Every successful request adds ``increase_rpm / rate`` to the rate, so
+    sustained success gains about ``increase_rpm`` per minute. A quota error
+    multiplies the rate by ``decrease_factor``. Quota errors arriving within
+    ``decrease_cooldown`` seconds of the last decrease are treated as the
+    same congestion event, so a burst of concurrent 429s cuts the rate once.
+    """
+
+    def __init__(
+        self,
+        min_rpm: float = ADAPTIVE_MIN_RPM,
+        max_rpm: float = ADAPTIVE_MAX_RPM,
+        increase_rpm: float = AIMD_INCREASE_RPM,
+        decrease_factor: float = AIMD_DECREASE_FACTOR,
+        decrease_cooldown: float = AIMD_DECREASE_COOLDOWN_SEC,
+    ):
+        """Initialize policy.
+
+        Args:
+            min_rpm: Lowest rate a quota error can reduce to
+            max_rpm: Highest rate success can raise to
+            increase_rpm: Rate gained per minute of successful requests
+            decrease_factor: Multiplier applied to the rate on a quota error
+            decrease_cooldown: Seconds during which further quota errors
+                do not reduce the rate again
+
+        Raises:
+            ValueError: If the rate bounds or factors are invalid
+        """
+        if not 0 < min_rpm <= max_rpm:
+            raise ValueError("min_rpm must be positive and at most max_rpm")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+
+        self.min_rpm = min_rpm
+        self.max_rpm = max_rpm
+        self.increase_rpm = increase_rpm
+        self.decrease_factor = decrease_factor
+        self.decrease_cooldown = decrease_cooldown
+
+    def clamp(self, requests_per_minute: float) -> float:
+        """Limit a rate to the policy bounds."""
+        return min(max(requests_per_minute, self.min_rpm), self.max_rpm)
+
+    def increased(self, requests_per_minute: float) -> float:
+        """Get the rate after one successful request."""
+        return self.clamp(requests_per_minute + self.increase_rpm / requests_per_minute)
+
+    def decreased(self, requests_per_minute: float) -> float:
+        """Get the rate after a quota error."""
+        return self.clamp(requests_per_minute * self.decrease_factor)
+
+    def in_cooldown(self, now: float, last_decrease: float | None) -> bool:
+        """Check whether a quota error belongs to the last congestion event.
+
+        Args:
+            now: Current time
+            last_decrease: Time of the last rate decrease (None if never)
+
+        Returns:
+            True if the rate should not be decreased again yet
+        """
+        return (
+            last_decrease is not None and now - last_decrease < self.decrease_cooldown
+        )
+
+
+class AdaptiveRateLimiter(TokenBucketRateLimiter):
+    """Token bucket whose rate adapts to quota errors (AIMD).
+
+    The rate follows an AIMDPolicy: it creeps up while requests succeed and
+    is cut sharply on a quota error. Retry-after hints pause the bucket as
+    for the plain token bucket.
+
+    When a state store is given, the learned rate is saved under
+    ``state_key`` so the next run starts from it instead of from scratch.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+        min_rpm: float = ADAPTIVE_MIN_RPM,
+        max_rpm: float = ADAPTIVE_MAX_RPM,
+        increase_rpm: float = AIMD_INCREASE_RPM,
+        decrease_factor: float = AIMD_DECREASE_FACTOR,
+        decrease_cooldown: float = AIMD_DECREASE_COOLDOWN_SEC,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        state: RateStateStore | None = None,
+        state_key: str = "",
+    ):
+        """Initialize adaptive limiter.
+
+        Args:
+            requests_per_minute: Starting request rate
+            min_rpm: Lowest rate a quota error can reduce to
+            max_rpm: Highest rate success can raise to
+            increase_rpm: Rate gained per minute of successful requests
+            decrease_factor: Multiplier applied to the rate on a quota error
+            decrease_cooldown: Seconds during which further quota errors
+                do not reduce the rate again
+            burst: Maximum number of requests that may start back-to-back
+            clock: Monotonic time source (injectable for tests)
+            state: Optional store persisting the learned rate
+            state_key: Key under which the rate is stored
+
+        Raises:
+            ValueError: If the rate bounds or factors are invalid
+        """
+        policy = AIMDPolicy(
+            min_rpm=min_rpm,
+            max_rpm=max_rpm,
+            increase_rpm=increase_rpm,
+            decrease_factor=decrease_factor,
+            decrease_cooldown=decrease_cooldown,
+        )
+        super().__init__(
+            requests_per_minute=policy.clamp(requests_per_minute),
+            burst=burst,
+            clock=clock,
+        )
+        self._policy = policy
+        self._last_decrease: float | None = None
+        self._state = state
+        self._state_key = state_key
+        self._saved_rpm = self.requests_per_minute
+
+    def record_success(self) -> None:
+        """Raise the rate additively after a successful request."""
+        with self._lock:
+            new_rpm = self._policy.increased(self._rate * 60.0)
+            self._set_rate(new_rpm)
+            # Persist in whole-request steps rather than after every call
+            should_save = abs(new_rpm - self._saved_rpm) >= 1.0
+
+        if should_save:
+            self._save(new_rpm)
+
+    def record_throttle(self, retry_after: float | None = None) -> None:
+        """Cut the rate multiplicatively after a quota error.
+
+        Args:
+            retry_after: Server-provided retry hint in seconds, if any
+        """
+        with self._lock:
+            now = self._clock()
+            in_cooldown = self._policy.in_cooldown(now, self._last_decrease)
+            rpm = self._rate * 60.0
+            if not in_cooldown:
+                rpm = self._policy.decreased(rpm)
+                self._set_rate(rpm)
+                self._last_decrease = now
+
+        if not in_cooldown:
+            logging.warning(f"Quota exceeded - reducing TTS rate to {rpm:.1f} rpm")
+            self._save(rpm)
+        super().record_throttle(retry_after)
+
+    def _save(self, requests_per_minute: float) -> None:
+        """Persist the learned rate, if a state store is configured."""
+        self._saved_rpm = requests_per_minute
+        if self._state is None:
+            return
+        try:
+            self._state.save(self._state_key, requests_per_minute)
+        except OSError as e:
+            logging.debug(f"Could not save learned rate: {e}")
@@ -0,0 +1,100 @@
+"""Persistent store of learned request rates."""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from audio_generation.domain.constants import RATE_STATE_FILE
+
+
+class RateStateStore:
+    """Small JSON file remembering the rate learned for each quota.
+
+    Vertex AI quotas are per project, region and model, so rates are keyed
+    by all three. The file maps each key to its last learned requests per
+    minute and is rewritten atomically on every save.
+    """
+
+    def __init__(self, path: Path | None = None):
+        """Initialize store.
+
+        Args:
+            path: State file path (defaults to RATE_STATE_FILE)
+        """
+        self._path = path or Path(RATE_STATE_FILE).expanduser()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(project: str, location: str, model: str) -> str:
+        """Build the key identifying a quota.
+
+        Args:
+            project: Google Cloud project ID
+            location: Google Cloud region
+            model: TTS model name
+
+        Returns:
+            Key string for load and save
+        """
+        return f"{project}/{location}/{model}"
+
+    def load(self, key: str) -> float | None:
+        """Look up the learned rate for a quota.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            Requests per minute, or None if nothing was learned yet
+        """
+        entry = self._read().get(key)
+        if not isinstance(entry, dict):
+            return None
+        rpm = entry.get("requests_per_minute")
+        if not isinstance(rpm, (int, float)) or rpm <= 0:
+            return None
+        return float(rpm)
+
+    def save(self, key: str, requests_per_minute: float) -> None:
+        """Record the learned rate for a quota.
+
+        Args:
+            key: Key from make_key
+            requests_per_minute: Rate to remember
+        """
+        with self._lock:
+            data = self._read()
+            data[key] = {
+                "requests_per_minute": round(requests_per_minute, 2),
+                "updated_at": datetime.now().isoformat(),
+            }
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+
+            fd, tmp_name = tempfile.mkstemp(dir=self._path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data, f, indent=2, sort_keys=True)
+                os.replace(tmp_name, self._path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+
+    @property
+    def path(self) -> Path:
+        """Get the state file path."""
+        return self._path
+
+    def _read(self) -> dict:
+        """Read the whole state file (empty if missing or unreadable)."""
+        try:
+            data = json.loads(self._path.read_text())
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logging.warning(f"Ignoring unreadable rate state file: {e}")
+            return {}
+        return data if isinstance(data, dict) else {}
@@ -0,0 +1,230 @@
+"""Rate limiter shared by every process on the machine."""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+from audio_generation.domain.constants import (
+    DEFAULT_REQUESTS_PER_MINUTE,
+    SHARED_QUOTA_DIR,
+)
+from audio_generation.scheduling.rate_limiter import AIMDPolicy, RateLimiter
+from audio_generation.scheduling.rate_state import RateStateStore
+from audio_generation.utils.file_lock import file_lock
+
+
+class SharedRateLimiter(RateLimiter):
+    """Cross-process rate limiter coordinated through a small state file.
+
+    Every CLI process generating against the same quota opens the same
+    coordination file. Under an exclusive file lock, ``reserve()`` claims
+    the next free request slot and advances it by one interval, so separate
+    processes (and the threads and tasks inside them) are interleaved on a
+    single schedule that uses the whole quota without exceeding it.
+
+    With an AIMDPolicy the shared rate also adapts: any process that
+    succeeds raises it, any process that hits a quota error lowers it for
+    all of them. Without a policy the rate stays fixed.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+        policy: AIMDPolicy | None = None,
+        clock: Callable[[], float] = time.time,
+        state: RateStateStore | None = None,
+        state_key: str = "",
+    ):
+        """Initialize shared limiter.
+
+        The coordination file keeps its current rate if it already exists,
+        so processes joining a running batch pick up what was learned.
+
+        Args:
+            path: Coordination file shared by all processes
+            requests_per_minute: Rate to start from if the file is new
+            policy: Optional AIMD policy adapting the shared rate
+            clock: Wall-clock time source (must agree across processes)
+            state: Optional store persisting the learned rate between runs
+            state_key: Key under which the rate is stored
+
+        Raises:
+            ValueError: If the rate is not positive
+        """
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+
+        self._path = path
+        self._lock_path = path.with_name(path.name + ".lock")
+        self._policy = policy
+        self._clock = clock
+        self._state = state
+        self._state_key = state_key
+
+        initial = policy.clamp(requests_per_minute) if policy else requests_per_minute
+        with file_lock(self._lock_path):
+            data = self._read()
+            self._saved_rpm = initial
+            if data.get("requests_per_minute") is None:
+                data["requests_per_minute"] = initial
+                self._write(data)
+            self._saved_rpm = self._rate_of(data)
+
+    @staticmethod
+    def path_for(key: str, directory: Path | None = None) -> Path:
+        """Map a quota key to its coordination file.
+
+        Args:
+            key: Quota key (see RateStateStore.make_key)
+            directory: Coordination directory (defaults to SHARED_QUOTA_DIR)
+
+        Returns:
+            Coordination file path
+        """
+        directory = directory or Path(SHARED_QUOTA_DIR).expanduser()
+        return directory / (re.sub(r"[^A-Za-z0-9._-]", "_", key) + ".json")
+
+    def reserve(self) -> float:
+        """Claim the next shared request slot.
+
+        Returns:
+            Seconds the caller must wait before sending its request
+        """
+        with file_lock(self._lock_path):
+            data = self._read()
+            now = self._clock()
+            slot = max(now, float(data.get("next_slot", 0.0)))
+            data["next_slot"] = slot + 60.0 / self._rate_of(data)
+            self._write(data)
+        return slot - now
+
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a slot is available.
+
+        Reserving takes the cross-process file lock and rewrites the
+        coordination file, so it runs in a worker thread: other tasks of
+        the loop keep running while another process holds the lock.
+        """
+        delay = await asyncio.to_thread(self.reserve)
+        if delay > 0:
+            logging.debug(f"Rate limit delay: {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+    def record_success(self) -> None:
+        """Raise the shared rate after a successful request (adaptive only)."""
+        if self._policy is None:
+            return
+        with file_lock(self._lock_path):
+            data = self._read()
+            rpm = self._policy.increased(self._rate_of(data))
+            data["requests_per_minute"] = rpm
+            self._write(data)
+
+        # Persist in whole-request steps rather than after every call
+        if abs(rpm - self._saved_rpm) >= 1.0:
+            self._save(rpm)
+
+    def record_throttle(self, retry_after: float | None = None) -> None:
+        """Lower the shared rate and honour the retry-after hint.
+
+        Args:
+            retry_after: Server-provided retry hint in seconds, if any
+        """
+        decreased = False
+        with file_lock(self._lock_path):
+            data = self._read()
+            now = self._clock()
+            rpm = self._rate_of(data)
+            if self._policy is not None and not self._policy.in_cooldown(
+                now, data.get("last_decrease")
+            ):
+                rpm = self._policy.decreased(rpm)
+                data["requests_per_minute"] = rpm
+                data["last_decrease"] = now
+                decreased = True
+            if retry_after:
+                data["next_slot"] = max(
+                    float(data.get("next_slot", 0.0)), now + retry_after
+                )
+            self._write(data)
+
+        if decreased:
+            logging.warning(
+                f"Quota exceeded - reducing shared TTS rate to {rpm:.1f} rpm"
+            )
+            self._save(rpm)
+        if retry_after:
+            logging.info(f"Shared rate limiter paused for {retry_after:.1f}s")
+
+    def set_rate(self, requests_per_minute: float) -> None:
+        """Override the shared rate for every process.
+
+        Args:
+            requests_per_minute: New request rate
+
+        Raises:
+            ValueError: If the rate is not positive
+        """
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        with file_lock(self._lock_path):
+            data = self._read()
+            data["requests_per_minute"] = requests_per_minute
+            self._write(data)
+
+    @property
+    def requests_per_minute(self) -> float:
+        """Get the current shared request rate."""
+        with file_lock(self._lock_path):
+            return self._rate_of(self._read())
+
+    @property
+    def path(self) -> Path:
+        """Get the coordination file path."""
+        return self._path
+
+    def _read(self) -> dict:
+        """Read coordination state (caller holds the file lock)."""
+        try:
+            data = json.loads(self._path.read_text())
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logging.warning(f"Resetting unreadable rate coordination file: {e}")
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _rate_of(self, data: dict) -> float:
+        """Get the rate from coordination state, falling back if it was lost."""
+        rpm = data.get("requests_per_minute")
+        if not isinstance(rpm, (int, float)) or rpm <= 0:
+            return self._saved_rpm
+        return float(rpm)
+
+    def _write(self, data: dict) -> None:
+        """Replace coordination state atomically (caller holds the file lock)."""
+        fd, tmp_name = tempfile.mkstemp(dir=self._path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_name, self._path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _save(self, requests_per_minute: float) -> None:
+        """Persist the learned rate, if a state store is configured."""
+        self._saved_rpm = requests_per_minute
+        if self._state is None:
+            return
+        try:
+            self._state.save(self._state_key, requests_per_minute)
+        except OSError as e:
+            logging.debug(f"Could not save learned rate: {e}")
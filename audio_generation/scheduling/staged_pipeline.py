@@ -0,0 +1,196 @@
+"""Producer/consumer pipeline of bounded asyncio stages."""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+from audio_generation.domain.constants import STAGE_QUEUE_SIZE
+from audio_generation.domain.models import StageMetrics
+
+_DONE = object()  # Sentinel telling a worker its input is exhausted
+
+
+@dataclass
+class Stage:
+    """One step of a staged pipeline.
+
+    Attributes:
+        name: Stage name used in logs and metrics
+        handler: Coroutine function turning an item into the next item
+        workers: Number of items the stage processes at once
+    """
+
+    name: str
+    handler: Callable[[Any], Awaitable[Any]]
+    workers: int = 1
+
+    @classmethod
+    def in_thread(
+        cls, name: str, func: Callable[[Any], Any], workers: int = 1
+    ) -> "Stage":
+        """Create a stage running a blocking (CPU or subprocess) function.
+
+        Args:
+            name: Stage name
+            func: Blocking function run in a worker thread per item
+            workers: Number of items processed at once
+
+        Returns:
+            Stage whose handler offloads ``func`` to a thread
+        """
+
+        async def handler(item: Any) -> Any:
+            return await asyncio.to_thread(func, item)
+
+        return cls(name, handler, workers)
+
+
+class StagedPipeline:
+    """Runs items through a chain of stages connected by bounded queues.
+
+    Every stage has its own workers, so different items occupy different
+    stages at the same time: while one chapter is being encoded, the next
+    is being mixed and later ones are still fetching. Queues between
+    stages hold at most ``queue_size`` items; a stage whose downstream
+    queue is full stops taking new input (backpressure), which bounds how
+    many finished-but-unconsumed chapters sit in memory.
+
+    An item whose handler raises skips the remaining stages; its exception
+    is returned in place of a result and the other items carry on.
+    """
+
+    def __init__(self, stages: list[Stage], queue_size: int = STAGE_QUEUE_SIZE):
+        """Initialize pipeline.
+
+        Args:
+            stages: Stages in processing order
+            queue_size: Capacity of each queue between two stages
+
+        Raises:
+            ValueError: If no stages are given or a stage has no workers
+        """
+        if not stages:
+            raise ValueError("A staged pipeline needs at least one stage")
+        if any(stage.workers < 1 for stage in stages):
+            raise ValueError("Every stage needs at least one worker")
+
+        self._stages = stages
+        self._queue_size = queue_size
+        self._metrics = [StageMetrics(s.name, s.workers) for s in stages]
+
+    async def run(self, items: list[Any]) -> list[Any]:
+        """Push every item through all stages.
+
+        Args:
+            items: Pipeline inputs
+
+        Returns:
+            Final-stage output (or the raised exception) for each item,
+            in input order
+        """
+        self._metrics = [StageMetrics(s.name, s.workers) for s in self._stages]
+
+        # The first queue is unbounded: all inputs are known up front
+        queues: list[asyncio.Queue] = [asyncio.Queue()] + [
+            asyncio.Queue(maxsize=self._queue_size) for _ in self._stages[1:]
+        ]
+        results: list[Any] = [None] * len(items)
+
+        for index, item in enumerate(items):
+            queues[0].put_nowait((index, item))
+        for _ in range(self._stages[0].workers):
+            queues[0].put_nowait(_DONE)
+        self._metrics[0].max_queue_depth = len(items)
+
+        async def run_stage(k: int) -> None:
+            stage = self._stages[k]
+            workers = [
+                asyncio.create_task(self._work(k, queues, results))
+                for _ in range(stage.workers)
+            ]
+            try:
+                await asyncio.gather(*workers)
+            finally:
+                for worker in workers:
+                    worker.cancel()
+            if k + 1 < len(self._stages):
+                for _ in range(self._stages[k + 1].workers):
+                    await queues[k + 1].put(_DONE)
+
+        stage_tasks = [
+            asyncio.create_task(run_stage(k), name=f"stage-{stage.name}")
+            for k, stage in enumerate(self._stages)
+        ]
+        try:
+            await asyncio.gather(*stage_tasks)
+        finally:
+            for task in stage_tasks:
+                task.cancel()
+            await asyncio.gather(*stage_tasks, return_exceptions=True)
+
+        return results
+
+    async def _work(
+        self, k: int, queues: list[asyncio.Queue], results: list[Any]
+    ) -> None:
+        """Worker loop of stage ``k``.
+
+        Args:
+            k: Stage index
+            queues: Input queue of every stage
+            results: Final outputs, filled in place
+        """
+        stage = self._stages[k]
+        metrics = self._metrics[k]
+        is_last = k + 1 == len(self._stages)
+
+        while True:
+            waited = time.monotonic()
+            entry = await queues[k].get()
+            metrics.idle_sec += time.monotonic() - waited
+            if entry is _DONE:
+                return
+
+            index, item = entry
+            if isinstance(item, BaseException):
+                output = item  # Failed upstream: pass through untouched
+            else:
+                started = time.monotonic()
+                try:
+                    output = await stage.handler(item)
+                    metrics.items += 1
+                except Exception as e:
+                    logging.error(f"Stage '{stage.name}' failed: {e}")
+                    metrics.failures += 1
+                    output = e
+                metrics.busy_sec += time.monotonic() - started
+
+            if is_last:
+                results[index] = output
+                continue
+
+            waited = time.monotonic()
+            await queues[k + 1].put((index, output))
+            metrics.blocked_sec += time.monotonic() - waited
+            downstream = self._metrics[k + 1]
+            downstream.max_queue_depth = max(
+                downstream.max_queue_depth, queues[k + 1].qsize()
+            )
+
+    @property
+    def metrics(self) -> list[StageMetrics]:
+        """Get per-stage statistics of the last run."""
+        return self._metrics
+
+    def log_metrics(self) -> None:
+        """Log one line of statistics per stage."""
+        for m in self._metrics:
+            logging.info(
+                f"Stage {m.name:<8} workers={m.workers} items={m.items} "
+                f"failed={m.failures} busy={m.busy_sec:.1f}s "
+                f"starved={m.idle_sec:.1f}s blocked={m.blocked_sec:.1f}s "
+                f"max_queue={m.max_queue_depth} "
+                f"utilization={m.utilization:.0%}"
+            )
@@ -1,19 +1,36 @@
 """TTS client wrapper for Vertex AI with retry logic."""
 
+import asyncio
+import copy
 import logging
+import random
 import time
 
 from google import genai
-from google.genai import types
+from google.genai import errors, types
 
-from audio_generation.domain.constants import MAX_RETRIES
+from audio_generation.caching.tts_cache import TTSResponseCache
+from audio_generation.domain.constants import (
+    MAX_RETRIES,
+    MAX_THROTTLE_RETRIES,
+    RETRY_BACKOFF_BASE_SEC,
+    RETRY_BACKOFF_MAX_SEC,
+    TTS_REQUEST_TIMEOUT_SEC,
+)
+from audio_generation.scheduling.rate_limiter import RateLimiter
 
 
 class TTSClient:
     """Wrapper for Vertex AI TTS API with retry logic.
 
     Handles API calls to Vertex AI Gemini TTS with automatic retry on failure,
-    exponential backoff, and proper error handling.
+    exponential backoff with jitter, and proper error handling. When a rate
+    limiter is configured, every request attempt (including retries) waits
+    for a slot, so one limiter can be shared by concurrent callers. Quota
+    errors (HTTP 429 / RESOURCE_EXHAUSTED) are reported to the limiter along
+    with any retry-after hint, and are retried separately from other errors
+    up to MAX_THROTTLE_RETRIES times. When a response cache is configured,
+    cached audio is returned without calling the API at all.
     """
 
     def __init__(
@@ -22,6 +39,8 @@ class TTSClient:
         location: str,
         model: str,
         max_retries: int = MAX_RETRIES,
+        rate_limiter: RateLimiter | None = None,
+        cache: TTSResponseCache | None = None,
     ):
         """Initialize TTS client using Vertex AI.
 
@@ -30,10 +49,14 @@ class TTSClient:
             location: Google Cloud region (e.g., 'us-central1')
             model: TTS model name
             max_retries: Maximum retry attempts per request
+            rate_limiter: Optional limiter consulted before every request
+            cache: Optional response cache checked before calling the API
         """
         self._client = genai.Client(vertexai=True, project=project, location=location)
         self._model = model
         self._max_retries = max_retries
+        self._rate_limiter = rate_limiter
+        self._cache = cache
 
     def generate(
         self,
@@ -61,25 +84,258 @@ class TTSClient:
             f"Batch {batch_num} prompt ({len(prompt)} chars):\n{prompt[:500]}..."
         )
 
-        for attempt in range(self._max_retries):
+        cache_key = self._cache_key(prompt, speech_config, system_instruction)
+        if cache_key is not None and self._cache is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                logging.debug(f"Batch {batch_num} served from TTS cache")
+                return cached
+
+        failures = throttles = 0
+        while True:
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
             try:
-                return self._make_request(prompt, speech_config, system_instruction)
+                audio_data = self._make_request(
+                    prompt, speech_config, system_instruction
+                )
             except Exception as e:
-                if attempt < self._max_retries - 1:
-                    logging.warning(
-                        f"Batch {batch_num} generation failed "
-                        f"(attempt {attempt + 1}/{self._max_retries}): {e}"
-                    )
-                    time.sleep(1 * (attempt + 1))  # Exponential backoff
+                if self._is_quota_error(e):
+                    throttles += 1
                 else:
-                    logging.error(
-                        f"Batch {batch_num} failed after {self._max_retries} attempts: {e}"
-                    )
-                    raise RuntimeError(
-                        f"Batch {batch_num} failed after {self._max_retries} attempts: {e}"
-                    ) from e
+                    failures += 1
+                time.sleep(self._retry_delay(e, str(e), batch_num, failures, throttles))
+                continue
+
+            self._record_success(cache_key, audio_data)
+            return audio_data
+
+    async def agenerate(
+        self,
+        prompt: str,
+        speech_config: types.SpeechConfig,
+        system_instruction: str = "",
+        batch_num: int = 0,
+        timeout: float | None = TTS_REQUEST_TIMEOUT_SEC,
+    ) -> bytes:
+        """Generate audio asynchronously using the SDK's async client.
+
+        Async counterpart of ``generate``: rate limiting and retry backoff
+        use non-blocking sleeps, and each attempt is bounded by ``timeout``.
+        Cancelling the awaiting task aborts the in-flight request.
+
+        Args:
+            prompt: Text prompt for TTS (structured with sections)
+            speech_config: Speech configuration from SpeechConfigBuilder
+            system_instruction: Optional system instruction for the model
+            batch_num: Batch number for logging (1-indexed)
+            timeout: Per-attempt timeout in seconds (None to wait forever)
+
+        Returns:
+            Raw PCM audio data
+
+        Raises:
+            RuntimeError: If generation fails after all retries
+        """
+        logging.debug(
+            f"Batch {batch_num} prompt ({len(prompt)} chars):\n{prompt[:500]}..."
+        )
+
+        # Cache reads and writes do file I/O and PCM decoding: keep them off
+        # the event loop, which drives every other request in flight
+        cache_key = self._cache_key(prompt, speech_config, system_instruction)
+        if cache_key is not None and self._cache is not None:
+            cached = await asyncio.to_thread(self._cache.get, cache_key)
+            if cached is not None:
+                logging.debug(f"Batch {batch_num} served from TTS cache")
+                return cached
+
+        failures = throttles = 0
+        while True:
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire_async()
+            try:
+                audio_data = await asyncio.wait_for(
+                    self._amake_request(prompt, speech_config, system_instruction),
+                    timeout,
+                )
+            except Exception as e:
+                if self._is_quota_error(e):
+                    throttles += 1
+                else:
+                    failures += 1
+                reason = (
+                    f"request timed out after {timeout}s"
+                    if isinstance(e, TimeoutError)
+                    else str(e)
+                )
+                # Reporting a throttle may update cross-process limiter state
+                delay = await asyncio.to_thread(
+                    self._retry_delay, e, reason, batch_num, failures, throttles
+                )
+                await asyncio.sleep(delay)
+                continue
 
-        raise RuntimeError(f"Batch {batch_num} failed: max retries exceeded")
+            await asyncio.to_thread(self._record_success, cache_key, audio_data)
+            return audio_data
+
+    def _record_success(self, cache_key: str | None, audio_data: bytes) -> None:
+        """Report a successful request to the limiter and cache its audio.
+
+        Args:
+            cache_key: Cache key for the request (None if caching is disabled)
+            audio_data: Raw PCM audio data returned by the API
+        """
+        if self._rate_limiter is not None:
+            self._rate_limiter.record_success()
+        if cache_key is not None and self._cache is not None:
+            self._cache.put(cache_key, audio_data)
+
+    def _retry_delay(
+        self,
+        error: Exception,
+        reason: str,
+        batch_num: int,
+        failures: int,
+        throttles: int,
+    ) -> float:
+        """Decide how long to wait before retrying a failed request.
+
+        Quota errors are reported to the rate limiter, which then delays the
+        next slot itself; without a limiter the retry-after hint (or backoff)
+        is returned instead. Other errors back off exponentially with jitter.
+
+        Args:
+            error: Exception raised by the request
+            reason: Human-readable failure description
+            batch_num: Batch number for logging (1-indexed)
+            failures: Non-quota failures so far, including this one
+            throttles: Quota errors so far, including this one
+
+        Returns:
+            Seconds to sleep before the next attempt
+
+        Raises:
+            RuntimeError: If the retry budget for this kind of error is spent
+        """
+        if self._is_quota_error(error):
+            retry_after = self._retry_after(error)
+            if self._rate_limiter is not None:
+                self._rate_limiter.record_throttle(retry_after)
+            if throttles >= MAX_THROTTLE_RETRIES:
+                logging.error(
+                    f"Batch {batch_num} failed after {throttles} quota errors: {reason}"
+                )
+                raise RuntimeError(
+                    f"Batch {batch_num} failed after {throttles} quota errors: {reason}"
+                ) from error
+            logging.warning(
+                f"Batch {batch_num} hit the quota limit "
+                f"({throttles}/{MAX_THROTTLE_RETRIES}), retrying"
+            )
+            if self._rate_limiter is not None:
+                return 0.0
+            if retry_after is not None:
+                return retry_after
+            return self._backoff_delay(throttles - 1)
+
+        if failures >= self._max_retries:
+            logging.error(
+                f"Batch {batch_num} failed after {self._max_retries} attempts: {reason}"
+            )
+            raise RuntimeError(
+                f"Batch {batch_num} failed after {self._max_retries} attempts: {reason}"
+            ) from error
+        logging.warning(
+            f"Batch {batch_num} generation failed "
+            f"(attempt {failures}/{self._max_retries}): {reason}"
+        )
+        return self._backoff_delay(failures - 1)
+
+    @staticmethod
+    def _backoff_delay(attempt: int) -> float:
+        """Exponential backoff with jitter, so concurrent retries spread out.
+
+        Args:
+            attempt: Zero-based retry number
+
+        Returns:
+            Delay in seconds, between half and all of the capped backoff
+        """
+        delay = min(RETRY_BACKOFF_MAX_SEC, RETRY_BACKOFF_BASE_SEC * 2**attempt)
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    @staticmethod
+    def _is_quota_error(error: Exception) -> bool:
+        """Check whether an error is a quota rejection (429).
+
+        Args:
+            error: Exception raised by the request
+
+        Returns:
+            True for HTTP 429 / RESOURCE_EXHAUSTED responses
+        """
+        return isinstance(error, errors.APIError) and (
+            error.code == 429 or error.status == "RESOURCE_EXHAUSTED"
+        )
+
+    @staticmethod
+    def _retry_after(error: Exception) -> float | None:
+        """Extract the server's retry hint from a quota error.
+
+        Checks the Retry-After header, then the ``retryDelay`` of a
+        google.rpc.RetryInfo entry in the error details.
+
+        Args:
+            error: Exception raised by the request
+
+        Returns:
+            Seconds to wait, or None if the server gave no hint
+        """
+        headers = getattr(getattr(error, "response", None), "headers", None)
+        if headers:
+            try:
+                return max(0.0, float(headers.get("retry-after")))
+            except (TypeError, ValueError):
+                pass  # Missing, or an HTTP date we don't bother parsing
+
+        details = getattr(error, "details", None)
+        if isinstance(details, dict):
+            body = details.get("error", details)
+            for detail in body.get("details", []) or []:
+                if not isinstance(detail, dict):
+                    continue
+                if not str(detail.get("@type", "")).endswith("RetryInfo"):
+                    continue
+                delay = detail.get("retryDelay")
+                if isinstance(delay, str) and delay.endswith("s"):
+                    try:
+                        return max(0.0, float(delay[:-1]))
+                    except ValueError:
+                        pass
+        return None
+
+    def _cache_key(
+        self,
+        prompt: str,
+        speech_config: types.SpeechConfig,
+        system_instruction: str,
+    ) -> str | None:
+        """Compute the response cache key for a request.
+
+        Args:
+            prompt: Text prompt for TTS
+            speech_config: Speech configuration
+            system_instruction: System instruction
+
+        Returns:
+            Cache key, or None if no cache is configured
+        """
+        if self._cache is None:
+            return None
+        return self._cache.make_key(
+            self._model, system_instruction, prompt, speech_config
+        )
 
     def _make_request(
         self,
@@ -100,19 +356,74 @@ class TTSClient:
         Raises:
             RuntimeError: If no audio data in response
         """
+        response = self._client.models.generate_content(
+            model=self._model,
+            contents=prompt,
+            config=self._build_config(speech_config, system_instruction),
+        )
+        return self._extract_audio(response, prompt)
+
+    async def _amake_request(
+        self,
+        prompt: str,
+        speech_config: types.SpeechConfig,
+        system_instruction: str = "",
+    ) -> bytes:
+        """Make a single TTS API request through the async client.
+
+        Args:
+            prompt: Text prompt for TTS
+            speech_config: Speech configuration
+            system_instruction: Optional system instruction
+
+        Returns:
+            Raw PCM audio data
+
+        Raises:
+            RuntimeError: If no audio data in response
+        """
+        response = await self._client.aio.models.generate_content(
+            model=self._model,
+            contents=prompt,
+            config=self._build_config(speech_config, system_instruction),
+        )
+        return self._extract_audio(response, prompt)
+
+    def _build_config(
+        self, speech_config: types.SpeechConfig, system_instruction: str
+    ) -> types.GenerateContentConfig:
+        """Build the request config for an audio-only generation.
+
+        Args:
+            speech_config: Speech configuration
+            system_instruction: Optional system instruction
+
+        Returns:
+            GenerateContentConfig requesting audio output
+        """
         config = types.GenerateContentConfig(
             response_modalities=["AUDIO"],
             speech_config=speech_config,
         )
         if system_instruction:
             config.system_instruction = system_instruction
+        return config
 
-        response = self._client.models.generate_content(
-            model=self._model,
-            contents=prompt,
-            config=config,
-        )
+    def _extract_audio(
+        self, response: types.GenerateContentResponse, prompt: str
+    ) -> bytes:
+        """Extract inline audio data from a TTS response.
+
+        Args:
+            response: The raw API response object
+            prompt: The prompt that was sent (for diagnostics)
 
+        Returns:
+            Raw PCM audio data
+
+        Raises:
+            RuntimeError: If no audio data in response
+        """
         # Extract audio data from response
         if response.candidates and response.candidates[0].content:
             parts = response.candidates[0].content.parts
@@ -195,7 +506,39 @@ class TTSClient:
 
         logging.warning("--- End Diagnostics ---")
 
+    def with_model(
+        self, model: str, rate_limiter: RateLimiter | None = None
+    ) -> "TTSClient":
+        """Create a client for another model sharing this one's connection.
+
+        The Vertex AI client and response cache are shared; the rate
+        limiter is shared too unless another one is given (quotas are
+        per model).
+
+        Args:
+            model: TTS model name
+            rate_limiter: Limiter for the new model's quota
+
+        Returns:
+            New TTSClient bound to ``model``
+        """
+        client = copy.copy(self)
+        client._model = model
+        if rate_limiter is not None:
+            client._rate_limiter = rate_limiter
+        return client
+
     @property
     def model(self) -> str:
         """Get the TTS model name."""
         return self._model
+
+    @property
+    def cache(self) -> TTSResponseCache | None:
+        """Get the response cache (None if caching is disabled)."""
+        return self._cache
+
+    @property
+    def rate_limiter(self) -> RateLimiter | None:
+        """Get the rate limiter gating requests (None if unthrottled)."""
+        return self._rate_limiter
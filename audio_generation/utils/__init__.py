@@ -1,5 +1,6 @@
 """Utility modules."""
 
+from audio_generation.utils.file_lock import file_lock
 from audio_generation.utils.logging import setup_logging
 
-__all__ = ["setup_logging"]
+__all__ = ["file_lock", "setup_logging"]
@@ -1,5 +1,6 @@
 """MP3 verification module."""
 
+from audio_generation.verification.frame_index import FrameIndexer
 from audio_generation.verification.mp3_verifier import MP3Verifier
 
-__all__ = ["MP3Verifier"]
+__all__ = ["FrameIndexer", "MP3Verifier"]
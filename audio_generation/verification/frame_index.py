@@ -0,0 +1,210 @@
+"""MP3 frame index with a per-directory sidecar cache."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from audio_generation.domain.constants import FRAME_INDEX_CACHE_DIR, ID3V1_TAG_BYTES
+from audio_generation.domain.models import FrameIndex
+from audio_generation.verification.mp3_verifier import (
+    find_frame_sync,
+    id3v2_tag_size,
+    is_info_frame,
+    map_file,
+    parse_frame_header,
+)
+
+# Ticks per second dividing every MPEG sample rate, so time adds up exactly
+TICKS_PER_SECOND = 14_112_000
+
+SIDECAR_VERSION = 2  # 2: Xing/Info header frames are no longer counted
+
+
+class FrameIndexer:
+    """Indexes MP3 files from their frame headers, without decoding.
+
+    Walking the headers of a chapter takes milliseconds (see MP3Verifier);
+    indexes are also cached in one JSON sidecar per directory, keyed by
+    file name and valid while the file's size and mtime are unchanged.
+    Checking the durations of a whole pack is then one sidecar read and a
+    stat per file. Sidecars live in a user cache directory, named after a
+    hash of the indexed directory's absolute path, so indexing never
+    writes into a story pack.
+    """
+
+    def __init__(self, cache_dir: Path | None = None):
+        """Initialize indexer.
+
+        Args:
+            cache_dir: Sidecar directory (defaults to FRAME_INDEX_CACHE_DIR)
+        """
+        self._cache_dir = cache_dir or Path(FRAME_INDEX_CACHE_DIR).expanduser()
+
+    @property
+    def cache_dir(self) -> Path:
+        """Get the sidecar directory."""
+        return self._cache_dir
+
+    def sidecar_path(self, directory: Path) -> Path:
+        """Get the sidecar caching the indexes of a directory's files.
+
+        Args:
+            directory: Directory of the indexed files
+
+        Returns:
+            Sidecar path inside the cache directory
+        """
+        digest = hashlib.sha256(str(directory.resolve()).encode()).hexdigest()
+        return self._cache_dir / f"{digest}.json"
+
+    def build(self, path: Path) -> FrameIndex:
+        """Index a file by walking its frame headers (no caching).
+
+        Args:
+            path: MP3 file path
+
+        Returns:
+            Frame count, duration and seek table of the file
+        """
+        with map_file(path) as data:
+            pos = id3v2_tag_size(data)
+            end = len(data)
+            if end - pos >= ID3V1_TAG_BYTES and data[end - 128 : end - 125] == b"TAG":
+                end -= ID3V1_TAG_BYTES
+
+            frame_count = 0
+            ticks = 0
+            seek_table: list[int] = []
+            first_frame = True
+            while pos + 4 <= end:
+                header = parse_frame_header(int.from_bytes(data[pos : pos + 4], "big"))
+                if header is None:
+                    pos = find_frame_sync(data, pos + 1, end)
+                    if pos == -1:
+                        break
+                    continue
+
+                # A leading Xing/Info frame describes the file; it isn't audio
+                if first_frame:
+                    first_frame = False
+                    if is_info_frame(data, pos, header):
+                        pos += header.length
+                        continue
+
+                # This frame plays every whole second it reaches
+                ticks += header.samples * (TICKS_PER_SECOND // header.sample_rate)
+                while len(seek_table) * TICKS_PER_SECOND < ticks:
+                    seek_table.append(pos)
+                frame_count += 1
+                pos += header.length
+
+        return FrameIndex(
+            frame_count=frame_count,
+            duration_sec=ticks / TICKS_PER_SECOND,
+            seek_table=seek_table,
+        )
+
+    def index(self, path: Path) -> FrameIndex:
+        """Get a file's index, from the sidecar when still valid.
+
+        Args:
+            path: MP3 file path
+
+        Returns:
+            Index of the file
+        """
+        return self.index_files([path])[path]
+
+    def index_dir(self, directory: Path) -> dict[str, FrameIndex]:
+        """Index every MP3 file of a directory.
+
+        Args:
+            directory: Directory to scan (not recursive)
+
+        Returns:
+            File name to index, in name order
+        """
+        paths = sorted(directory.glob("*.mp3"))
+        return {path.name: index for path, index in self.index_files(paths).items()}
+
+    def index_files(self, paths: list[Path]) -> dict[Path, FrameIndex]:
+        """Index files, reading and updating each directory's sidecar once.
+
+        Args:
+            paths: MP3 file paths
+
+        Returns:
+            Path to index, in input order
+        """
+        by_directory: dict[Path, list[Path]] = {}
+        for path in paths:
+            by_directory.setdefault(path.parent, []).append(path)
+
+        indexes: dict[Path, FrameIndex] = {}
+        for directory, files in by_directory.items():
+            entries = self._read(directory)
+            changed = False
+            for path in files:
+                stat = path.stat()
+                entry = entries.get(path.name)
+                if (
+                    isinstance(entry, dict)
+                    and entry.get("size") == stat.st_size
+                    and entry.get("mtime_ns") == stat.st_mtime_ns
+                ):
+                    indexes[path] = FrameIndex(
+                        frame_count=entry["frame_count"],
+                        duration_sec=entry["duration_sec"],
+                        seek_table=entry["seek_table"],
+                    )
+                    continue
+
+                logging.debug(f"Indexing frames of {path}")
+                index = self.build(path)
+                entries[path.name] = {
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "frame_count": index.frame_count,
+                    "duration_sec": index.duration_sec,
+                    "seek_table": index.seek_table,
+                }
+                indexes[path] = index
+                changed = True
+            if changed:
+                self._write(directory, entries)
+
+        return {path: indexes[path] for path in paths}
+
+    def _read(self, directory: Path) -> dict:
+        """Read a directory's sidecar entries (empty if missing or stale)."""
+        try:
+            data = json.loads(self.sidecar_path(directory).read_text())
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logging.warning(f"Ignoring unreadable frame index: {e}")
+            return {}
+        if not isinstance(data, dict) or data.get("version") != SIDECAR_VERSION:
+            return {}
+        files = data.get("files")
+        return files if isinstance(files, dict) else {}
+
+    def _write(self, directory: Path, entries: dict) -> None:
+        """Atomically rewrite a directory's sidecar (best effort)."""
+        data = {"version": SIDECAR_VERSION, "files": entries}
+        sidecar = self.sidecar_path(directory)
+        try:
+            sidecar.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=sidecar.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data, f, sort_keys=True)
+                os.replace(tmp_name, sidecar)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            logging.warning(f"Could not save frame index of {directory}: {e}")
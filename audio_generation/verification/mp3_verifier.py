@@ -1,21 +1,399 @@
 """MP3 format verification."""
 
 import logging
-import struct
+import mmap
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import Iterator
 
-from audio_generation.domain.models import VerificationResult
-from audio_generation.domain.constants import TARGET_SAMPLE_RATE
+from audio_generation.domain.constants import (
+    ID3V1_TAG_BYTES,
+    TARGET_SAMPLE_RATE,
+    VERIFY_CHUNK_BYTES,
+)
+from audio_generation.domain.models import EncodedMP3, VerificationResult
+
+# Sample rates by MPEG version bits (11 = MPEG1, 10 = MPEG2, 00 = MPEG2.5)
+SAMPLE_RATES = {
+    0x03: (44100, 48000, 32000),
+    0x02: (22050, 24000, 16000),
+    0x00: (11025, 12000, 8000),
+}
+
+# Bitrates in kbps by (MPEG1?, layer) and bitrate index (0 = free, 15 = bad)
+BITRATES = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+
+CHANNEL_MODES = ("stereo", "joint stereo", "dual channel", "mono")
+
+# Layer III side info bytes by (MPEG1?, mono?)
+SIDE_INFO_BYTES = {
+    (True, False): 32,
+    (True, True): 17,
+    (False, False): 17,
+    (False, True): 9,
+}
+
+# Tags of the LAME/Xing header frame, which carries no audio
+INFO_TAGS = (b"Xing", b"Info")
+
+
+@dataclass(frozen=True)
+class MP3FrameHeader:
+    """Decoded fields of an MPEG audio frame header.
+
+    Attributes:
+        layer: Layer number (1, 2 or 3)
+        layer_bits: Raw layer field (01 = Layer III)
+        sample_rate: Sample rate in Hz
+        channel_mode: Channel mode field (3 = mono)
+        length: Frame length in bytes, header included
+        samples: Samples per channel decoded from the frame
+        tag_offset: Offset of a Xing/Info tag in the frame (after the
+            header, CRC and Layer III side info)
+    """
+
+    layer: int
+    layer_bits: int
+    sample_rate: int
+    channel_mode: int
+    length: int
+    samples: int
+    tag_offset: int
+
+
+@cache
+def parse_frame_header(word: int) -> MP3FrameHeader | None:
+    """Decode a 32-bit frame header.
+
+    Frames repeat a handful of distinct headers, so decoding is cached.
+
+    Args:
+        word: First four bytes of the frame, big-endian
+
+    Returns:
+        Decoded header, or None if the word is not a valid frame header
+    """
+    # Bits 21-31: frame sync (all set)
+    if word >> 21 != 0x7FF:
+        return None
+    # Bits 19-20: MPEG version, bits 17-18: layer (01 = Layer III)
+    version_bits = (word >> 19) & 0x03
+    layer_bits = (word >> 17) & 0x03
+    # Bits 12-15: bitrate index, bits 10-11: sample rate index, bit 9: padding
+    bitrate_index = (word >> 12) & 0x0F
+    sample_rate_index = (word >> 10) & 0x03
+    padding = (word >> 9) & 0x01
+    # Bit 16: protection (0 = a 16-bit CRC follows the header)
+    crc_bytes = 0 if (word >> 16) & 0x01 else 2
+    # Bits 6-7: channel mode (00-10 = stereo variants, 11 = mono)
+    channel_mode = (word >> 6) & 0x03
+
+    if (
+        version_bits not in SAMPLE_RATES
+        or layer_bits == 0
+        or bitrate_index in (0, 15)  # Free-format frames can't be walked
+        or sample_rate_index == 3
+    ):
+        return None
+
+    mpeg1 = version_bits == 0x03
+    layer = 4 - layer_bits
+    bitrate = BITRATES[mpeg1, layer][bitrate_index] * 1000
+    sample_rate = SAMPLE_RATES[version_bits][sample_rate_index]
+
+    if layer == 1:
+        length = (12 * bitrate // sample_rate + padding) * 4
+        samples = 384
+    elif layer == 2 or mpeg1:
+        length = 144 * bitrate // sample_rate + padding
+        samples = 1152
+    else:
+        length = 72 * bitrate // sample_rate + padding
+        samples = 576
+
+    return MP3FrameHeader(
+        layer=layer,
+        layer_bits=layer_bits,
+        sample_rate=sample_rate,
+        channel_mode=channel_mode,
+        length=length,
+        samples=samples,
+        tag_offset=4 + crc_bytes + SIDE_INFO_BYTES[mpeg1, channel_mode == 0x03],
+    )
+
+
+def is_info_frame(data: bytes | mmap.mmap, pos: int, header: MP3FrameHeader) -> bool:
+    """Check whether a frame is a Xing/Info header frame.
+
+    Encoders such as LAME write one as the first frame, to describe the
+    file. It decodes to silence that players skip, so it is not
+    counted as audio.
+
+    Args:
+        data: MP3 data
+        pos: Offset of the frame
+        header: Decoded header of the frame
+
+    Returns:
+        True if the frame carries a Xing or Info tag
+    """
+    start = pos + header.tag_offset
+    return data[start : start + 4] in INFO_TAGS
+
+
+def id3v2_tag_size(data: bytes | mmap.mmap) -> int:
+    """Get the size of the ID3v2 tag at the start of MP3 data.
+
+    Args:
+        data: MP3 data
+
+    Returns:
+        Tag size in bytes, header included (0 if there is no tag)
+    """
+    if data[:3] != b"ID3" or len(data) < 10:
+        return 0
+    # Size is stored as syncsafe integer (7 bits per byte)
+    size = data[6:10]
+    return 10 + (
+        (size[0] & 0x7F) << 21
+        | (size[1] & 0x7F) << 14
+        | (size[2] & 0x7F) << 7
+        | (size[3] & 0x7F)
+    )
+
+
+@contextmanager
+def map_file(path: Path) -> Iterator[bytes | mmap.mmap]:
+    """Memory-map a file for reading.
+
+    Args:
+        path: File path
+
+    Yields:
+        Read-only map of the file (empty bytes for an empty file)
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""  # Empty files can't be mapped
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
+
+
+def find_frame_sync(data: bytes | mmap.mmap, start: int, end: int) -> int:
+    """Find the next valid frame header.
+
+    Args:
+        data: MP3 data
+        start: Offset to search from
+        end: Offset where frame data ends
+
+    Returns:
+        Offset of the header, or -1 if there is none
+    """
+    while True:
+        pos = data.find(b"\xff", start, end - 3)
+        if pos == -1:
+            return -1
+        if parse_frame_header(int.from_bytes(data[pos : pos + 4], "big")):
+            return pos
+        start = pos + 1
+
+
+class FrameWalker:
+    """Walks the frames of an MP3 stream as it arrives, chunk by chunk.
+
+    Each header's bitrate and padding give the next frame's offset, so
+    only the part of a frame header split across two chunks is buffered.
+    Frames are checked for Layer III, the target sample rate and mono,
+    and bytes outside frames are reported as junk. A Xing/Info header
+    frame at the start is skipped: it describes the file and holds no
+    audio. ID3 tags are not recognized here: strip or skip them before
+    feeding the stream.
+    """
+
+    def __init__(self, offset: int = 0, issues: list[str] | None = None):
+        """Initialize walker at the start of the frame data.
+
+        Args:
+            offset: Offset of the first fed byte in the file (for messages)
+            issues: Issues already found, reported before the frame issues
+        """
+        self._issues = list(issues or [])
+        self._buffer = b""
+        self._pos = offset  # File offset of the buffer's first byte
+        self._skip = 0  # Bytes of the current frame not received yet
+        self._junk_start = -1  # Offset where the current lost-sync span began
+        self._first_frame = True  # Next frame may be a Xing/Info frame
+        self._frame_count = 0
+        self._samples_by_rate: dict[int, int] = {}
+        self._mismatches: dict[str, list[int]] = {}  # Issue -> [frames, offset]
+        self._junk_bytes = 0
+        self._junk_spans = 0
+        self._first_junk = -1
+
+    def feed(self, chunk: bytes) -> None:
+        """Walk the next bytes of the stream.
+
+        Args:
+            chunk: Next bytes of the stream
+        """
+        if self._skip:
+            skipped = min(self._skip, len(chunk))
+            self._skip -= skipped
+            self._pos += skipped
+            chunk = chunk[skipped:]
+        self._buffer = self._buffer + bytes(chunk) if self._buffer else bytes(chunk)
+        self._scan()
+
+    def finish(self) -> VerificationResult:
+        """End the stream and report what was found.
+
+        Returns:
+            VerificationResult with passed status, issues and frame stats
+        """
+        self._scan(final=True)
+        end = self._pos + len(self._buffer)
+        if self._junk_start >= 0:
+            # Sync was never found again before the end
+            if self._frame_count:
+                self._add_junk(self._junk_start, end - self._junk_start)
+        elif self._buffer:
+            self._add_junk(self._pos, len(self._buffer))  # Too short for a header
+
+        issues = self._issues
+        if self._frame_count == 0:
+            issues.append("No valid MP3 frame sync found")
+        for problem, (count, offset) in self._mismatches.items():
+            issues.append(
+                f"{problem} ({count} of {self._frame_count} frames, "
+                f"first at byte {offset})"
+            )
+        if self._junk_bytes:
+            issues.append(
+                f"{self._junk_bytes} bytes of junk between frames "
+                f"({self._junk_spans} spans, first at byte {self._first_junk})"
+            )
+
+        return VerificationResult(
+            passed=len(issues) == 0,
+            issues=issues,
+            frame_count=self._frame_count,
+            duration_sec=sum(
+                samples / rate for rate, samples in self._samples_by_rate.items()
+            ),
+        )
+
+    def _scan(self, final: bool = False) -> None:
+        """Walk the complete frame headers in the buffer.
+
+        Args:
+            final: If True, no more data follows (decide the first frame
+                even if it is cut short)
+        """
+        data = self._buffer
+        end = len(data)
+        i = 0
+        while i + 4 <= end:
+            header = parse_frame_header(int.from_bytes(data[i : i + 4], "big"))
+            if header is None:
+                # Lost sync: skip to the next valid frame header
+                if self._junk_start < 0:
+                    self._junk_start = self._pos + i
+                resync = find_frame_sync(data, i + 1, end)
+                if resync == -1:
+                    i = end - 3  # A header may start in the last 3 bytes
+                    break
+                i = resync
+                continue
+
+            if self._first_frame:
+                if i + header.tag_offset + 4 > end and not final:
+                    break  # Wait for the bytes where a Xing/Info tag would be
+                self._first_frame = False
+                if is_info_frame(data, i, header):
+                    if self._junk_start >= 0:
+                        self._end_junk(self._pos + i)
+                    i += header.length
+                    continue
+
+            if self._junk_start >= 0:
+                self._end_junk(self._pos + i)
+            self._check(header, self._pos + i)
+
+            # A truncated last frame still counts: decoders play what is there
+            self._frame_count += 1
+            self._samples_by_rate[header.sample_rate] = (
+                self._samples_by_rate.get(header.sample_rate, 0) + header.samples
+            )
+            i += header.length
+
+        if i > end:
+            self._skip = i - end
+            i = end
+        self._buffer = data[i:]
+        self._pos += i
+
+    def _check(self, header: MP3FrameHeader, offset: int) -> None:
+        """Record how a frame differs from the required format."""
+        if header.layer_bits != 0x01:
+            problem = f"Not MP3 Layer III (layer bits: {header.layer_bits})"
+            self._mismatches.setdefault(problem, [0, offset])[0] += 1
+        if header.sample_rate != TARGET_SAMPLE_RATE:
+            problem = (
+                f"Sample rate is {header.sample_rate}Hz, "
+                f"expected {TARGET_SAMPLE_RATE}Hz"
+            )
+            self._mismatches.setdefault(problem, [0, offset])[0] += 1
+        if header.channel_mode != 0x03:
+            problem = (
+                f"Channel mode is {CHANNEL_MODES[header.channel_mode]}, "
+                "expected mono"
+            )
+            self._mismatches.setdefault(problem, [0, offset])[0] += 1
+
+    def _end_junk(self, resync: int) -> None:
+        """Close the lost-sync span at the frame found at ``resync``."""
+        skipped = resync - self._junk_start
+        if self._frame_count:
+            self._add_junk(self._junk_start, skipped)
+        else:
+            self._issues.append(f"{skipped} bytes of junk before the first frame")
+        self._junk_start = -1
+
+    def _add_junk(self, offset: int, size: int) -> None:
+        """Count a span of bytes outside frames."""
+        self._junk_bytes += size
+        self._junk_spans += 1
+        if self._first_junk < 0:
+            self._first_junk = offset
 
 
 class MP3Verifier:
     """Verifies MP3 format meets requirements.
 
-    Checks that output meets specifications:
+    Walks every frame header, using each header's bitrate and padding to
+    find the next frame, and checks that output meets specifications:
     - Format: MP3 (MPEG Audio Layer III)
     - Channels: Mono (1 channel)
     - Sample Rate: 44100 Hz
     - ID3v1: NOT present
     - ID3v2: NOT present
+    - No junk bytes between frames
+
+    The result also reports the frame count and exact duration of the
+    audio frames (a leading Xing/Info header frame is not counted). Files
+    are memory-mapped, so they are never loaded whole.
     """
 
     def verify(self, mp3_data: bytes) -> VerificationResult:
@@ -27,80 +405,82 @@ class MP3Verifier:
         Returns:
             VerificationResult with passed status and any issues
         """
+        return self._walk(mp3_data)
+
+    def verify_file(self, path: Path) -> VerificationResult:
+        """Verify an MP3 file without reading it into memory.
+
+        Args:
+            path: MP3 file path
+
+        Returns:
+            VerificationResult with passed status and any issues
+        """
+        with map_file(path) as data:
+            return self._walk(data)
+
+    def verify_encoded(self, encoded: EncodedMP3) -> VerificationResult:
+        """Verify a file written by MP3Exporter.
+
+        The check the streaming encoder made while writing the file is
+        used when present, so the file is not read a second time.
+
+        Args:
+            encoded: Summary returned by MP3Exporter.export
+
+        Returns:
+            VerificationResult with passed status and any issues
+        """
+        if encoded.verification is not None:
+            return self._report(encoded.verification)
+        return self.verify_file(encoded.output_path)
+
+    def _walk(self, data: bytes | mmap.mmap) -> VerificationResult:
+        """Check tags and walk every frame of MP3 data.
+
+        Args:
+            data: Whole file contents (bytes or a memory map)
+
+        Returns:
+            VerificationResult with passed status, issues and frame stats
+        """
         issues = []
+        pos = 0
+        end = len(data)
 
-        # Check for ID3v2 tag at start
-        if mp3_data[:3] == b"ID3":
+        # Check for ID3v2 tag at start (walk the frames after it)
+        if data[:3] == b"ID3":
             issues.append("ID3v2 tag present at start of file")
+            pos = id3v2_tag_size(data)
 
-        # Check for ID3v1 tag at end
-        if len(mp3_data) >= 128 and mp3_data[-128:-125] == b"TAG":
+        # Check for ID3v1 tag at end (not part of the last frame)
+        if end >= ID3V1_TAG_BYTES and data[end - 128 : end - 125] == b"TAG":
             issues.append("ID3v1 tag present at end of file")
+            end -= ID3V1_TAG_BYTES
 
-        # Find first MP3 frame to verify format
-        # MP3 frame sync: 11 bits set (0xFF followed by 0xE0 or higher)
-        frame_start = -1
-        for i in range(len(mp3_data) - 4):
-            if mp3_data[i] == 0xFF and (mp3_data[i + 1] & 0xE0) == 0xE0:
-                frame_start = i
-                break
+        walker = FrameWalker(offset=pos, issues=issues)
+        for start in range(pos, end, VERIFY_CHUNK_BYTES):
+            walker.feed(data[start : min(start + VERIFY_CHUNK_BYTES, end)])
+        return self._report(walker.finish())
 
-        if frame_start == -1:
-            issues.append("No valid MP3 frame sync found")
-            return VerificationResult(passed=False, issues=issues)
-
-        # Parse MP3 frame header (4 bytes)
-        header = struct.unpack(">I", mp3_data[frame_start : frame_start + 4])[0]
-
-        # Extract fields from header
-        # Bits 19-20: MPEG version (11 = MPEG1, 10 = MPEG2, 00 = MPEG2.5)
-        version_bits = (header >> 19) & 0x03
-        # Bits 17-18: Layer (01 = Layer III)
-        layer_bits = (header >> 17) & 0x03
-        # Bits 10-11: Sample rate index
-        sample_rate_index = (header >> 10) & 0x03
-        # Bit 6: Channel mode (00-10 = stereo variants, 11 = mono)
-        channel_mode = (header >> 6) & 0x03
-
-        # Verify Layer III
-        if layer_bits != 0x01:
-            issues.append(f"Not MP3 Layer III (layer bits: {layer_bits})")
-
-        # Sample rate lookup table
-        sample_rates = {
-            0x03: {0: 44100, 1: 48000, 2: 32000},  # MPEG1
-            0x02: {0: 22050, 1: 24000, 2: 16000},  # MPEG2
-            0x00: {0: 11025, 1: 12000, 2: 8000},  # MPEG2.5
-        }
-
-        if (
-            version_bits in sample_rates
-            and sample_rate_index in sample_rates[version_bits]
-        ):
-            actual_rate = sample_rates[version_bits][sample_rate_index]
-            if actual_rate != TARGET_SAMPLE_RATE:
-                issues.append(
-                    f"Sample rate is {actual_rate}Hz, expected {TARGET_SAMPLE_RATE}Hz"
-                )
-        else:
-            issues.append(
-                f"Unable to determine sample rate (version: {version_bits}, index: {sample_rate_index})"
-            )
-
-        # Verify mono (channel mode 11 = single channel)
-        if channel_mode != 0x03:
-            mode_names = {0: "stereo", 1: "joint stereo", 2: "dual channel", 3: "mono"}
-            issues.append(
-                f"Channel mode is {mode_names.get(channel_mode, 'unknown')}, expected mono"
-            )
+    def _report(self, result: VerificationResult) -> VerificationResult:
+        """Log the outcome of a verification.
 
-        passed = len(issues) == 0
+        Args:
+            result: Verification result
 
-        if passed:
-            logging.info("MP3 format verification: PASSED")
+        Returns:
+            The same result
+        """
+        if result.passed:
+            logging.info(
+                f"MP3 format verification: PASSED "
+                f"({result.frame_count} frames, {result.duration_sec:.3f}s)"
+            )
         else:
-            logging.warning(f"MP3 format verification: FAILED ({len(issues)} issues)")
-            for issue in issues:
+            logging.warning(
+                f"MP3 format verification: FAILED ({len(result.issues)} issues)"
+            )
+            for issue in result.issues:
                 logging.warning(f"  - {issue}")
-
-        return VerificationResult(passed=passed, issues=issues)
+        return result
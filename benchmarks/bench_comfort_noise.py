@@ -0,0 +1,78 @@
+"""Benchmark comfort noise generation against the per-sample reference loop.
+
+Usage:
+    python benchmarks/bench_comfort_noise.py
+    python benchmarks/bench_comfort_noise.py --repeat 20
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from audio_generation.audio.effects import AudioEffects
+from audio_generation.domain.constants import TARGET_SAMPLE_RATE
+
+# Durations the concatenator asks for: edge buffers, pauses, file buffers
+DURATIONS_MS = [200, 500, 750, 1500, 2000]
+
+
+def reference_pink_filter(white: np.ndarray) -> np.ndarray:
+    """The original per-sample Kellet filter loop."""
+    pink = np.zeros(len(white))
+    b0, b1, b2 = 0.0, 0.0, 0.0
+    for i in range(len(white)):
+        white_sample = white[i]
+        b0 = 0.99886 * b0 + white_sample * 0.0555179
+        b1 = 0.99332 * b1 + white_sample * 0.0750759
+        b2 = 0.96900 * b2 + white_sample * 0.1538520
+        pink[i] = b0 + b1 + b2 + white_sample * 0.5362
+    return pink
+
+
+def best_of(func, repeat: int) -> float:
+    """Best wall time of ``repeat`` calls, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main() -> None:
+    """Print per-call timings and speedup for typical pause durations."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Calls per timing")
+    args = parser.parse_args()
+
+    print(
+        f"{'duration':>9} {'loop ms':>9} {'vector ms':>10} {'speedup':>8} {'max err':>9}"
+    )
+    for duration_ms in DURATIONS_MS:
+        white = np.random.randn(int(TARGET_SAMPLE_RATE * duration_ms / 1000))
+
+        loop_ms = best_of(lambda white=white: reference_pink_filter(white), args.repeat)
+        vector_ms = best_of(
+            lambda white=white: AudioEffects._pink_filter(white), args.repeat
+        )
+        error = np.max(
+            np.abs(reference_pink_filter(white) - AudioEffects._pink_filter(white))
+        )
+
+        print(
+            f"{duration_ms:>7}ms {loop_ms:>9.2f} {vector_ms:>10.3f} "
+            f"{loop_ms / vector_ms:>7.0f}x {error:>9.1e}"
+        )
+
+    effects = AudioEffects()
+    call_ms = best_of(lambda: effects.generate_comfort_noise(750), args.repeat)
+    print(f"\ngenerate_comfort_noise(750ms): {call_ms:.2f} ms per call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark single-pass timeline mixing against iterative crossfades.
+
+Usage:
+    python benchmarks/bench_mix.py
+    python benchmarks/bench_mix.py --repeat 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from audio_generation.audio.buffer import AudioBuffer
+from audio_generation.audio.effects import AudioEffects
+from audio_generation.audio.timeline import Timeline
+from audio_generation.domain.constants import TARGET_SAMPLE_RATE
+
+# Segments per chapter: short scene up to a long hub-and-spoke chapter
+SEGMENT_COUNTS = [10, 50, 100, 200]
+SEGMENT_MS = 4000
+PAUSE_MS = 600
+
+
+def make_clips(num_segments: int) -> list[np.ndarray]:
+    """Alternate speech-like noise and pauses, as the concatenator lays them out."""
+    rng = np.random.default_rng(0)
+    clips = []
+    for i in range(num_segments):
+        if i:
+            clips.append(np.zeros(int(TARGET_SAMPLE_RATE * PAUSE_MS / 1000), np.int16))
+        samples = rng.standard_normal(int(TARGET_SAMPLE_RATE * SEGMENT_MS / 1000))
+        clips.append((samples * 3000).astype(np.int16))
+    return clips
+
+
+def iterative_mix(clips: list[np.ndarray]) -> AudioBuffer:
+    """The original approach: crossfade each clip onto the growing result."""
+    effects = AudioEffects()
+    buffers = [AudioBuffer(c, TARGET_SAMPLE_RATE) for c in clips]
+    combined = buffers[0]
+    for buffer in buffers[1:]:
+        combined = effects.apply_crossfade(combined, buffer)
+    return combined
+
+
+def timeline_mix(clips: list[np.ndarray]) -> np.ndarray:
+    """Lay every clip out, then mix in one pass."""
+    timeline = Timeline(TARGET_SAMPLE_RATE)
+    for clip in clips:
+        timeline.append(clip)
+    return timeline.render()
+
+
+def best_of(func, repeat: int) -> float:
+    """Best wall time of ``repeat`` calls, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main() -> None:
+    """Print mixing time of both approaches per chapter size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per timing")
+    args = parser.parse_args()
+
+    print(f"{'segments':>9} {'iterative ms':>13} {'timeline ms':>12} {'speedup':>8}")
+    for num_segments in SEGMENT_COUNTS:
+        clips = make_clips(num_segments)
+        iterative_ms = best_of(lambda clips=clips: iterative_mix(clips), args.repeat)
+        timeline_ms = best_of(lambda clips=clips: timeline_mix(clips), args.repeat)
+        print(
+            f"{num_segments:>9} {iterative_ms:>13.1f} {timeline_ms:>12.1f} "
+            f"{iterative_ms / timeline_ms:>7.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
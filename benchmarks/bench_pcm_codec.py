@@ -0,0 +1,98 @@
+"""Benchmark PCM compression levels against reading raw PCM from disk.
+
+Usage:
+    python benchmarks/bench_pcm_codec.py
+    python benchmarks/bench_pcm_codec.py --input batch.pcm --disk-mbps 150
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from audio_generation.caching.pcm_codec import LEVELS, PCMCodec
+from audio_generation.domain.constants import GEMINI_TTS_SAMPLE_RATE
+
+SPEECH_SECONDS = 120
+
+
+def make_speech(seconds: int) -> bytes:
+    """Voiced harmonics with syllable envelopes, pauses and a noise floor."""
+    rng = np.random.default_rng(0)
+    t = np.arange(seconds * GEMINI_TTS_SAMPLE_RATE) / GEMINI_TTS_SAMPLE_RATE
+    f0 = 140 + 30 * np.sin(2 * np.pi * 0.7 * t)
+    phase = 2 * np.pi * np.cumsum(f0) / GEMINI_TTS_SAMPLE_RATE
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 12))
+    syllables = np.clip(np.sin(2 * np.pi * 2.5 * t), 0, None) ** 0.5
+    sentences = np.sin(2 * np.pi * 0.25 * t) > -0.6
+    envelope = syllables * sentences
+    samples = (
+        voiced * envelope * 6000
+        + rng.standard_normal(len(t)) * 80 * envelope
+        + rng.standard_normal(len(t)) * 3
+    )
+    return samples.astype(np.int16).tobytes()
+
+
+def best_of(func, repeat: int) -> float:
+    """Best wall time of ``repeat`` calls, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    """Print ratio, codec speed and effective load speed per level."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--input", type=Path, help="Raw PCM file (default: synthetic)")
+    parser.add_argument(
+        "--disk-mbps",
+        type=float,
+        help="Disk read speed to model (default: measured, usually page cache)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per timing")
+    args = parser.parse_args()
+
+    pcm = args.input.read_bytes() if args.input else make_speech(SPEECH_SECONDS)
+    megabytes = len(pcm) / 1e6
+
+    disk_mbps = args.disk_mbps
+    if disk_mbps is None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "batch.pcm"
+            path.write_bytes(pcm)
+            disk_mbps = megabytes / best_of(path.read_bytes, args.repeat)
+    print(f"{megabytes:.1f} MB of PCM, disk read {disk_mbps:,.0f} MB/s\n")
+
+    # Loading reads the compressed bytes, then decodes them
+    print(
+        f"{'level':>6} {'ratio':>6} {'encode MB/s':>12} {'decode MB/s':>12} "
+        f"{'load MB/s':>10} {'vs raw':>7}"
+    )
+    for level in LEVELS:
+        codec = PCMCodec(level)
+        stored = codec.encode(pcm)
+        assert codec.decode(stored) == pcm
+        encode_s = best_of(lambda codec=codec: codec.encode(pcm), args.repeat)
+        decode_s = best_of(
+            lambda codec=codec, stored=stored: codec.decode(stored), args.repeat
+        )
+        load_mbps = megabytes / (len(stored) / 1e6 / disk_mbps + decode_s)
+        print(
+            f"{level:>6} {len(pcm) / len(stored):>6.2f} "
+            f"{megabytes / max(encode_s, 1e-9):>12,.0f} "
+            f"{megabytes / max(decode_s, 1e-9):>12,.0f} "
+            f"{load_mbps:>10,.0f} {load_mbps / disk_mbps:>6.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
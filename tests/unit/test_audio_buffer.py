@@ -0,0 +1,96 @@
+"""Unit tests for AudioBuffer."""
+
+import math
+
+import numpy as np
+import pytest
+from pydub import AudioSegment
+from pydub.silence import detect_leading_silence
+
+from audio_generation.audio.buffer import AudioBuffer
+from audio_generation.audio.processor import AudioProcessor
+
+
+class TestAudioBuffer:
+    """Tests for AudioBuffer class."""
+
+    def test_from_pcm_shares_memory(self):
+        """Test that wrapping PCM does not copy it."""
+        pcm = np.arange(100, dtype=np.int16).tobytes()
+
+        buffer = AudioBuffer.from_pcm(pcm, 24000)
+
+        assert np.shares_memory(buffer.samples, np.frombuffer(pcm, dtype=np.int16))
+        assert buffer.samples[99] == 99
+
+    def test_from_pcm_drops_odd_byte(self):
+        """Test that a truncated trailing byte is ignored."""
+        assert AudioBuffer.from_pcm(b"\x01\x00\x02", 24000).num_samples == 1
+
+    def test_dbfs_matches_pydub(self):
+        """Test that the level matches AudioSegment.dBFS."""
+        samples = (np.random.default_rng(0).standard_normal(4800) * 3000).astype(
+            np.int16
+        )
+        buffer = AudioBuffer(samples, 48000)
+
+        assert math.isclose(buffer.dBFS, buffer.to_segment().dBFS, abs_tol=0.01)
+        assert AudioBuffer.silent(100, 48000).dBFS == -math.inf
+
+    def test_fade_does_not_modify_source(self):
+        """Test that fades return a new buffer, leaving read-only PCM intact."""
+        pcm = np.full(4800, 1000, dtype=np.int16).tobytes()
+        buffer = AudioBuffer.from_pcm(pcm, 48000)
+
+        faded = buffer.fade(10, 10)
+
+        assert faded.samples[0] == 0
+        assert faded.samples[-1] < 1000
+        assert faded.samples[2400] == 1000
+        assert buffer.samples[0] == 1000
+
+    def test_segment_round_trip(self):
+        """Test conversion to and from AudioSegment."""
+        segment = AudioSegment.silent(duration=250, frame_rate=44100)
+
+        buffer = AudioBuffer.from_segment(segment)
+
+        assert buffer.duration_ms == 250
+        assert buffer.to_segment().raw_data == segment.raw_data
+
+
+class TestAudioProcessor:
+    """Tests for AudioProcessor class."""
+
+    def test_normalize_trims_silence_and_adds_buffers(self):
+        """Test that edge silence is replaced by fixed buffers."""
+        samples = np.zeros(24000, dtype=np.int16)
+        samples[4800:19200] = 4000  # 200ms silence, 600ms tone, 200ms silence
+        audio = AudioBuffer(samples, 24000)
+
+        normalized = AudioProcessor().normalize(
+            audio, buffer_ms=50, use_comfort_noise=False
+        )
+
+        assert normalized.duration_ms == 600 + 2 * 50
+        assert normalized.samples[:1200].max() == 0
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_edge_silence_matches_pydub(self, seed: int):
+        """Test trim points equal pydub's detect_leading_silence."""
+        rng = np.random.default_rng(seed)
+        samples = (rng.standard_normal(44100) * 20).astype(np.int16)
+        start, end = sorted(rng.integers(0, 44100, 2))
+        samples[start:end] = (rng.standard_normal(end - start) * 4000).astype(np.int16)
+        audio = AudioBuffer(samples, 44100)
+        segment = audio.to_segment()
+        threshold = audio.dBFS - 16
+
+        leading, trailing = AudioProcessor._edge_silence(audio, threshold)
+
+        assert leading // 441 * 10 == detect_leading_silence(
+            segment, silence_threshold=threshold
+        )
+        assert trailing // 441 * 10 == detect_leading_silence(
+            segment.reverse(), silence_threshold=threshold
+        )
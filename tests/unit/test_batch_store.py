@@ -0,0 +1,77 @@
+"""Unit tests for BatchAudioStore."""
+
+from pathlib import Path
+
+import pytest
+
+from audio_generation.progress.batch_store import BatchAudioStore
+
+
+class TestBatchAudioStore:
+    """Tests for BatchAudioStore class."""
+
+    @pytest.fixture
+    def store(self, tmp_path: Path):
+        """Create store instance."""
+        return BatchAudioStore(tmp_path)
+
+    def test_roundtrip_across_instances(self, store: BatchAudioStore, tmp_path: Path):
+        """Test that entries written by one store are read by another."""
+        store.put("a", b"first")
+        store.put("b", b"second")
+
+        reopened = BatchAudioStore(tmp_path)
+
+        assert len(reopened) == 2
+        assert reopened.get("a") == b"first"
+        assert reopened.get("b") == b"second"
+        assert "c" not in reopened
+
+    def test_get_returns_view(self, store: BatchAudioStore):
+        """Test that reads are read-only views rather than copies."""
+        store.put("a", b"\x01\x02" * 4)
+
+        view = store.get("a")
+
+        assert isinstance(view, memoryview)
+        assert view.readonly
+        assert view.tobytes() == b"\x01\x02" * 4
+
+    def test_torn_index_line_is_ignored(self, store: BatchAudioStore, tmp_path: Path):
+        """Test that a partially written index record is skipped."""
+        store.put("a", b"audio")
+        with open(tmp_path / "audio.idx", "a") as f:
+            f.write('{"key": "b", "off')
+
+        reopened = BatchAudioStore(tmp_path)
+
+        assert "b" not in reopened
+        assert reopened.get("a") == b"audio"
+
+    def test_verify_detects_corruption(self, store: BatchAudioStore, tmp_path: Path):
+        """Test that damaged or missing data fails verification."""
+        store.put("a", b"audio")
+        store.put("b", b"other")
+        data = tmp_path / "audio.pack"
+        data.write_bytes(b"AUDIO" + data.read_bytes()[5:])
+
+        reopened = BatchAudioStore(tmp_path)
+
+        assert not reopened.verify("a")
+        assert reopened.verify("b")
+        assert not reopened.verify("missing")
+
+    def test_retain_compacts(self, store: BatchAudioStore, tmp_path: Path):
+        """Test that dropped entries are removed from the data file."""
+        store.put("a", b"x" * 100)
+        store.put("b", b"kept")
+        view = store.get("a")
+
+        store.retain({"b"})
+
+        assert (tmp_path / "audio.pack").stat().st_size == 4
+        assert "a" not in store
+        assert store.get("b") == b"kept"
+        assert BatchAudioStore(tmp_path).get("b") == b"kept"
+        # Views handed out before compaction stay readable
+        assert view == b"x" * 100
@@ -0,0 +1,166 @@
+"""Unit tests for AudioEffects."""
+
+import numpy as np
+import pytest
+
+from audio_generation.audio.buffer import AudioBuffer
+from audio_generation.audio.effects import AudioEffects, ComfortNoiseBank
+
+
+def reference_pink_filter(white: np.ndarray) -> np.ndarray:
+    """Per-sample Kellet filter the vectorized version must match."""
+    pink = np.zeros(len(white))
+    b0, b1, b2 = 0.0, 0.0, 0.0
+    for i, w in enumerate(white):
+        b0 = 0.99886 * b0 + w * 0.0555179
+        b1 = 0.99332 * b1 + w * 0.0750759
+        b2 = 0.96900 * b2 + w * 0.1538520
+        pink[i] = b0 + b1 + b2 + w * 0.5362
+    return pink
+
+
+def rms_db(samples: np.ndarray) -> float:
+    """RMS level of 16-bit samples in dBFS."""
+    return 20 * np.log10(np.sqrt(np.mean(samples.astype(float) ** 2)) / 32767)
+
+
+class TestAudioEffects:
+    """Tests for AudioEffects class."""
+
+    @pytest.fixture
+    def effects(self):
+        """Create effects instance."""
+        return AudioEffects()
+
+    @pytest.mark.parametrize("num_samples", [1, 255, 256, 257, 8820])
+    def test_pink_filter_matches_reference(self, num_samples: int):
+        """Test that the block filter equals the per-sample recursion."""
+        white = np.random.default_rng(0).standard_normal(num_samples)
+
+        np.testing.assert_allclose(
+            AudioEffects._pink_filter(white),
+            reference_pink_filter(white),
+            atol=1e-9,
+        )
+
+    def test_comfort_noise_length_and_level(self, effects: AudioEffects):
+        """Test duration, sample rate and peak level of comfort noise."""
+        noise = effects.generate_comfort_noise(500, target_db=-50.0, sample_rate=44100)
+
+        samples = noise.samples
+        assert noise.sample_rate == 44100
+        assert len(samples) == 22050
+        assert np.max(np.abs(samples)) <= int(10 ** (-50 / 20) * 32767)
+
+    def test_comfort_noise_level_matches_per_call_noise(self, effects: AudioEffects):
+        """Test that bank slices are as loud as noise scaled to its own peak."""
+        rng = np.random.default_rng(0)
+        amplitude = 10 ** (-55 / 20) * 32767
+        per_call, sliced = [], []
+        for _ in range(20):
+            pink = AudioEffects._pink_filter(rng.standard_normal(33075))
+            per_call.append(rms_db(pink / np.max(np.abs(pink)) * amplitude))
+            noise = effects.generate_comfort_noise(750, target_db=-55.0)
+            sliced.append(rms_db(noise.samples))
+
+        assert np.mean(sliced) == pytest.approx(np.mean(per_call), abs=0.5)
+
+    def test_zero_duration_is_empty(self, effects: AudioEffects):
+        """Test that a zero-length request returns empty audio."""
+        assert effects.generate_comfort_noise(0).num_samples == 0
+
+    def test_noise_floor_matches_window_loop(self, effects: AudioEffects):
+        """Test the vectorized noise floor against a per-window loop."""
+        samples = (np.random.default_rng(1).standard_normal(48000) * 500).astype(
+            np.int16
+        )
+        samples[:4800] = 0  # Digital silence windows are ignored
+        rms = [
+            np.sqrt(np.mean(samples[i : i + 480].astype(np.float64) ** 2))
+            for i in range(0, 48000, 480)
+        ]
+        expected = 20 * np.log10(np.percentile([r for r in rms if r > 0], 10) / 32767)
+
+        assert effects.analyze_noise_floor(AudioBuffer(samples, 48000)) == (
+            pytest.approx(expected)
+        )
+
+    def test_crossfade_curves_cached_read_only(self):
+        """Test that curve tables are shared float32 arrays that cannot change."""
+        fade_out, fade_in = AudioEffects.crossfade_curves(3307, "s_curve")
+
+        assert AudioEffects.crossfade_curves(3307, "s_curve")[0] is fade_out
+        assert fade_in.dtype == np.float32
+        assert not fade_out.flags.writeable
+
+    def test_equal_power_curve(self):
+        """Test that equal-power gains keep summed power constant."""
+        fade_out, fade_in = AudioEffects.crossfade_curves(1000, "equal_power")
+
+        np.testing.assert_allclose(fade_out**2 + fade_in**2, 1.0, rtol=1e-6)
+
+    def test_mix_crossfade_in_place(self):
+        """Test mixing into the array being faded out."""
+        fading_out = np.full(480, 1000, dtype=np.int16)
+        fading_in = np.full(480, -1000, dtype=np.int16)
+
+        AudioEffects.mix_crossfade(fading_out, fading_in, fading_out, "linear")
+
+        assert fading_out[0] == 1000
+        assert fading_out[-1] == -1000
+        assert abs(int(fading_out[240])) <= 3
+
+
+class TestComfortNoiseBank:
+    """Tests for ComfortNoiseBank class."""
+
+    @pytest.fixture
+    def bank(self):
+        """Create a small bank with a short loop."""
+        return ComfortNoiseBank(duration_sec=0.1, max_levels=2)
+
+    def test_slices_depend_only_on_key_and_length(self, bank: ComfortNoiseBank):
+        """Test that a slice is the same whatever other slices were taken."""
+        first = bank.slice(3000, -50.0, 44100, key=4)
+        bank.slice(1234, -50.0, 44100, key=7)
+        again = ComfortNoiseBank(duration_sec=0.1).slice(3000, -50.0, 44100, key=4)
+
+        np.testing.assert_array_equal(bank.slice(3000, -50.0, 44100, key=4), first)
+        np.testing.assert_array_equal(again, first)
+        assert not np.array_equal(bank.slice(3000, -50.0, 44100, key=6), first)
+
+    def test_slices_wrap_around_loop(self, bank: ComfortNoiseBank):
+        """Test that a slice running past the loop's end continues at its start."""
+        samples = bank.slice(8820, -50.0, 44100, key=1)
+
+        np.testing.assert_array_equal(samples[:4410], samples[4410:])
+
+    def test_loop_is_seamless(self, bank: ComfortNoiseBank):
+        """Test that the wrap point is no louder a step than the rest."""
+        loop = bank.slice(4410, -20.0, 44100).astype(np.int32)
+
+        steps = np.abs(np.diff(loop))
+        assert abs(loop[0] - loop[-1]) <= steps.max()
+
+    def test_fades_edges(self, bank: ComfortNoiseBank):
+        """Test that faded slices start at zero."""
+        samples = bank.slice(1000, -20.0, 44100, fade_samples=100)
+
+        assert samples[0] == 0
+        assert np.max(np.abs(samples[:10])) < np.max(np.abs(samples[100:900]))
+
+    def test_levels_share_quantized_loop(self, bank: ComfortNoiseBank):
+        """Test that nearby levels reuse one loop at or below the request."""
+        bank.slice(10, -50.2, 44100)
+        bank.slice(10, -50.4, 44100)
+
+        assert len(bank) == 1
+        assert ComfortNoiseBank.quantize_level(-50.2) == -50.5
+        assert ComfortNoiseBank.quantize_level(-50.0) == -50.0
+
+    def test_evicts_least_recently_used_level(self, bank: ComfortNoiseBank):
+        """Test that the bank keeps at most max_levels loops."""
+        for db in (-40.0, -50.0, -60.0):
+            bank.slice(10, db, 44100)
+
+        assert len(bank) == 2
@@ -0,0 +1,118 @@
+"""Unit tests for FrameIndexer."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from audio_generation.verification.frame_index import FrameIndexer
+
+FRAME = bytes([0xFF, 0xFB, 0x90, 0xC0]) + b"\x00" * 413  # 128 kbps, 44.1 kHz mono
+
+
+def frames(count: int) -> bytes:
+    """Create MPEG1 Layer III frames of 1152 samples (417 bytes each)."""
+    return FRAME * count
+
+
+def lame_info_frame(frame_count: int) -> bytes:
+    """Create the Info header frame LAME writes before CBR mono audio."""
+    info = (
+        b"Info"
+        + (0x0F).to_bytes(4, "big")  # Frames, bytes, TOC and quality follow
+        + frame_count.to_bytes(4, "big")
+        + (417 * (frame_count + 1)).to_bytes(4, "big")
+        + bytes(range(0, 200, 2))  # Seek TOC
+        + (0x64).to_bytes(4, "big")
+        + b"LAME3.100"
+    )
+    # 17 bytes of empty side info come between the header and the tag
+    return (bytes([0xFF, 0xFB, 0x90, 0xC4]) + b"\x00" * 17 + info).ljust(417, b"\x00")
+
+
+class TestFrameIndexer:
+    """Tests for FrameIndexer class."""
+
+    @pytest.fixture
+    def indexer(self, tmp_path: Path):
+        """Create indexer with a temporary cache directory."""
+        return FrameIndexer(cache_dir=tmp_path / "cache")
+
+    def test_build_from_headers(self, indexer: FrameIndexer, tmp_path: Path):
+        """Test frame count, exact duration and seek table."""
+        path = tmp_path / "chapter.mp3"
+        path.write_bytes(b"ID3\x04\x00\x00\x00\x00\x00\x02xx" + frames(1225))
+
+        index = indexer.build(path)
+
+        # 1225 frames of 1152 samples are exactly 32 s at 44.1 kHz
+        assert index.frame_count == 1225
+        assert index.duration_sec == 32.0
+        assert len(index.seek_table) == 32
+        assert index.seek_table[0] == 12
+        # Second 1 starts inside frame 38 (38 * 1152 < 44100 < 39 * 1152)
+        assert index.seek_table[1] == 12 + 38 * 417
+
+    def test_skips_lame_info_frame(self, indexer: FrameIndexer, tmp_path: Path):
+        """Test that the LAME header frame adds no time and is never sought."""
+        path = tmp_path / "chapter.mp3"
+        tag = b"ID3\x04\x00\x00\x00\x00\x00\x02xx"
+        path.write_bytes(tag + lame_info_frame(1225) + frames(1225))
+
+        index = indexer.build(path)
+
+        assert index.frame_count == 1225
+        assert index.duration_sec == 32.0
+        assert index.seek_table[0] == 12 + 417
+        assert index.seek_table[1] == 12 + 417 + 38 * 417
+
+    def test_sidecar_reused_until_file_changes(
+        self, indexer: FrameIndexer, tmp_path: Path, monkeypatch
+    ):
+        """Test that unchanged files are served from the sidecar."""
+        path = tmp_path / "chapter.mp3"
+        path.write_bytes(frames(100))
+        first = indexer.index(path)
+        assert indexer.sidecar_path(tmp_path).exists()
+
+        monkeypatch.setattr(indexer, "build", lambda _: pytest.fail("re-indexed"))
+        assert indexer.index(path) == first
+
+        monkeypatch.undo()
+        path.write_bytes(frames(50))
+        os.utime(path, ns=(0, 0))
+        assert indexer.index(path).frame_count == 50
+
+    def test_index_dir(self, indexer: FrameIndexer, tmp_path: Path):
+        """Test that every MP3 of a directory is indexed by name."""
+        (tmp_path / "b.mp3").write_bytes(frames(10))
+        (tmp_path / "a.mp3").write_bytes(frames(20))
+        (tmp_path / "cover.bmp").write_bytes(b"BM")
+
+        indexes = indexer.index_dir(tmp_path)
+
+        assert list(indexes) == ["a.mp3", "b.mp3"]
+        assert indexes["b.mp3"].frame_count == 10
+
+    def test_unreadable_sidecar_is_rebuilt(self, indexer: FrameIndexer, tmp_path: Path):
+        """Test that a corrupt sidecar is ignored and replaced."""
+        (tmp_path / "chapter.mp3").write_bytes(frames(3))
+        indexer.cache_dir.mkdir()
+        indexer.sidecar_path(tmp_path).write_text("{not json")
+
+        assert indexer.index(tmp_path / "chapter.mp3").frame_count == 3
+        reloaded = FrameIndexer(cache_dir=indexer.cache_dir)
+        assert reloaded.index_dir(tmp_path)["chapter.mp3"].frame_count == 3
+
+    def test_sidecar_kept_out_of_indexed_directory(
+        self, indexer: FrameIndexer, tmp_path: Path
+    ):
+        """Test that indexing a pack's assets writes nothing next to them."""
+        assets = tmp_path / "assets"
+        assets.mkdir()
+        (assets / "chapter.mp3").write_bytes(frames(3))
+
+        indexer.index_dir(assets)
+
+        assert [p.name for p in assets.iterdir()] == ["chapter.mp3"]
+        assert indexer.sidecar_path(assets).parent == indexer.cache_dir
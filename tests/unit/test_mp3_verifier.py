@@ -1,8 +1,31 @@
 """Unit tests for MP3Verifier."""
 
+from pathlib import Path
+
 import pytest
 
-from audio_generation.verification.mp3_verifier import MP3Verifier
+from audio_generation.domain.models import EncodedMP3
+from audio_generation.verification.mp3_verifier import FrameWalker, MP3Verifier
+
+
+def frames(count: int) -> bytes:
+    """Create MPEG1 Layer III, 128 kbps, 44.1 kHz mono frames (417 bytes)."""
+    return (bytes([0xFF, 0xFB, 0x90, 0xC0]) + b"\x00" * 413) * count
+
+
+def lame_info_frame(frame_count: int) -> bytes:
+    """Create the Info header frame LAME writes before CBR mono audio."""
+    info = (
+        b"Info"
+        + (0x0F).to_bytes(4, "big")  # Frames, bytes, TOC and quality follow
+        + frame_count.to_bytes(4, "big")
+        + (417 * (frame_count + 1)).to_bytes(4, "big")
+        + bytes(range(0, 200, 2))  # Seek TOC
+        + (0x64).to_bytes(4, "big")
+        + b"LAME3.100"
+    )
+    # 17 bytes of empty side info come between the header and the tag
+    return (bytes([0xFF, 0xFB, 0x90, 0xC4]) + b"\x00" * 17 + info).ljust(417, b"\x00")
 
 
 class TestMP3Verifier:
@@ -73,3 +96,91 @@ class TestMP3Verifier:
         # Should pass all checks
         assert result.passed
         assert len(result.issues) == 0
+
+    def test_walks_every_frame(self, verifier: MP3Verifier):
+        """Test that the frame count and exact duration are reported."""
+        result = verifier.verify(frames(10))
+
+        assert result.passed
+        assert result.frame_count == 10
+        assert result.duration_sec == pytest.approx(10 * 1152 / 44100)
+
+    def test_padding_sets_frame_length(self, verifier: MP3Verifier):
+        """Test that padded frames are one byte longer."""
+        padded = bytes([0xFF, 0xFB, 0x92, 0xC0]) + b"\x00" * 414
+
+        result = verifier.verify(frames(2) + padded + frames(2))
+
+        assert result.passed
+        assert result.frame_count == 5
+
+    def test_detects_stereo_frame_after_first(self, verifier: MP3Verifier):
+        """Test that every frame header is checked, not only the first."""
+        stereo = bytes([0xFF, 0xFB, 0x90, 0x00]) + b"\x00" * 413
+
+        result = verifier.verify(frames(3) + stereo + frames(3))
+
+        assert not result.passed
+        assert result.frame_count == 7
+        assert result.issues == [
+            "Channel mode is stereo, expected mono (1 of 7 frames, first at byte 1251)"
+        ]
+
+    def test_detects_junk_between_frames(self, verifier: MP3Verifier):
+        """Test that bytes outside frames are reported."""
+        result = verifier.verify(frames(2) + b"\x00" * 30 + frames(2))
+
+        assert not result.passed
+        assert result.frame_count == 4
+        assert any("30 bytes of junk" in issue for issue in result.issues)
+
+    def test_skips_lame_info_frame(self, verifier: MP3Verifier):
+        """Test that the LAME header frame is not counted as audio."""
+        result = verifier.verify(lame_info_frame(10) + frames(10))
+
+        assert result.passed
+        assert result.frame_count == 10
+        assert result.duration_sec == pytest.approx(10 * 1152 / 44100)
+
+    def test_info_tag_only_in_first_frame(self, verifier: MP3Verifier):
+        """Test that a later frame containing the tag bytes is still audio."""
+        result = verifier.verify(frames(2) + lame_info_frame(1))
+
+        assert result.frame_count == 3
+
+    def test_verify_file(self, verifier: MP3Verifier, tmp_path: Path):
+        """Test verification of a file through a memory map."""
+        path = tmp_path / "out.mp3"
+        path.write_bytes(frames(5))
+        (tmp_path / "empty.mp3").write_bytes(b"")
+
+        assert verifier.verify_file(path).frame_count == 5
+        assert verifier.verify_encoded(EncodedMP3(path, size_bytes=5 * 417)).passed
+        assert not verifier.verify_file(tmp_path / "empty.mp3").passed
+
+
+class TestFrameWalker:
+    """Tests for FrameWalker class."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 416, 417, 4096])
+    def test_streamed_matches_whole(self, chunk_size: int):
+        """Test that chunk boundaries never change the result."""
+        stereo = bytes([0xFF, 0xFB, 0x90, 0x00]) + b"\x00" * 413
+        data = b"\x00" * 5 + frames(2) + b"\x00" * 30 + stereo + frames(2)[:-100]
+        walker = FrameWalker()
+
+        for start in range(0, len(data), chunk_size):
+            walker.feed(data[start : start + chunk_size])
+
+        assert walker.finish() == MP3Verifier().verify(data)
+
+    @pytest.mark.parametrize("chunk_size", [1, 20, 417])
+    def test_info_frame_split_across_chunks(self, chunk_size: int):
+        """Test that the Info tag is found whatever the chunk boundaries."""
+        data = lame_info_frame(3) + frames(3)
+        walker = FrameWalker()
+
+        for start in range(0, len(data), chunk_size):
+            walker.feed(data[start : start + chunk_size])
+
+        assert walker.finish().frame_count == 3
@@ -0,0 +1,285 @@
+"""Unit tests for AudioGenerationPipeline batch generation."""
+
+import asyncio
+import random
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from audio_generation.domain.models import (
+    EncodedMP3,
+    Segment,
+    SegmentBatch,
+    SpeakerConfig,
+)
+from audio_generation.orchestrator import AudioGenerationPipeline, PreparedScript
+from audio_generation.progress.batch_store import BatchAudioStore
+from audio_generation.progress.progress_manager import ProgressManager
+from audio_generation.scheduling.rate_limiter import TokenBucketRateLimiter
+
+
+class FakeTTSClient:
+    """TTS client stand-in returning the transcript line as audio bytes."""
+
+    def __init__(self, fail_on: str | None = None):
+        self.rate_limiter = TokenBucketRateLimiter(requests_per_minute=60_000)
+        self.fail_on = fail_on
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def generate(self, prompt, speech_config, system_instruction="", batch_num=0):
+        self.rate_limiter.acquire()
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(random.uniform(0.001, 0.02))
+            text = prompt.rsplit("\n", 1)[-1]
+            if self.fail_on and self.fail_on in text:
+                raise RuntimeError(f"boom on {text}")
+            return text.encode()
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    async def agenerate(
+        self, prompt, speech_config, system_instruction="", batch_num=0, timeout=None
+    ):
+        await self.rate_limiter.acquire_async()
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(random.uniform(0.001, 0.02))
+            text = prompt.rsplit("\n", 1)[-1]
+            if self.fail_on and self.fail_on in text:
+                raise RuntimeError(f"boom on {text}")
+            return text.encode()
+        finally:
+            self.in_flight -= 1
+
+
+class SlowProgressManager(ProgressManager):
+    """ProgressManager whose batch saves block like a slow disk."""
+
+    def save_batch_audio(self, fingerprint: str, audio_data: bytes) -> str:
+        time.sleep(0.05)
+        return super().save_batch_audio(fingerprint, audio_data)
+
+
+class RecordingExporter:
+    """Exporter stand-in that consumes streamed chunks without encoding."""
+
+    def __init__(self):
+        self.chunk_sizes: list[int] = []
+
+    def export_stream(self, chunks, sample_rate, output_path):
+        self.chunk_sizes = [len(chunk) for chunk in chunks]
+        return EncodedMP3(output_path=output_path, size_bytes=0)
+
+
+class TestGenerateBatches:
+    """Tests for sequential and concurrent batch generation."""
+
+    @pytest.fixture
+    def batches(self):
+        """Create single-segment narrator batches."""
+        return [
+            SegmentBatch(
+                segments=[Segment(speaker="Narrator", text=f"line {i}")],
+                speakers=["Narrator"],
+            )
+            for i in range(12)
+        ]
+
+    @pytest.fixture
+    def input_file(self, tmp_path: Path) -> Path:
+        """Create an input file for progress hashing."""
+        path = tmp_path / "script.md"
+        path.write_text("---\n---\n")
+        return path
+
+    def _run(self, client, batches, input_file, tmp_path, max_concurrency, **kwargs):
+        pipeline = AudioGenerationPipeline(
+            tts_client=client, progress_manager=ProgressManager(tmp_path), **kwargs
+        )
+        return pipeline._generate_batches(
+            batches=batches,
+            speaker_configs_map={"Narrator": SpeakerConfig(name="Narrator")},
+            character_profiles={},
+            input_file=input_file,
+            output_dir=tmp_path,
+            resume=False,
+            progress_callback=None,
+            delay_seconds=0,
+            max_concurrency=max_concurrency,
+        )
+
+    def test_concurrent_results_in_batch_order(self, batches, input_file, tmp_path):
+        """Test that concurrent generation returns audio in batch order."""
+        client = FakeTTSClient()
+
+        results = self._run(client, batches, input_file, tmp_path, 4)
+
+        assert results == [f"Narrator: line {i}".encode() for i in range(12)]
+        assert 1 < client.max_in_flight <= 4
+
+    def test_concurrent_records_progress(self, batches, input_file, tmp_path):
+        """Test that every finished batch is recorded through ProgressManager."""
+        self._run(FakeTTSClient(), batches, input_file, tmp_path, 4)
+
+        progress = ProgressManager(tmp_path).load()
+
+        assert progress is not None
+        assert sorted(progress.completed_batches) == list(range(12))
+
+    def test_concurrent_failure_keeps_finished_batches(
+        self, batches, input_file, tmp_path
+    ):
+        """Test that a failure saves error state and keeps completed work."""
+        client = FakeTTSClient(fail_on="line 5")
+
+        with pytest.raises(RuntimeError, match="Batch 6 failed"):
+            self._run(client, batches, input_file, tmp_path, 3)
+
+        progress = ProgressManager(tmp_path).load()
+        assert progress is not None
+        assert progress.last_error_batch == 5
+        assert 5 not in progress.completed_batches
+
+    def test_fresh_run_drops_earlier_batch_audio(self, batches, input_file, tmp_path):
+        """Test that a run without resume doesn't keep a failed run's audio."""
+        with pytest.raises(RuntimeError):
+            self._run(FakeTTSClient(fail_on="line 5"), batches, input_file, tmp_path, 1)
+
+        self._run(FakeTTSClient(), batches[:2], input_file, tmp_path, 1)
+
+        assert len(BatchAudioStore(tmp_path / "batches")) == 2
+
+    def test_sequential_mode_matches_concurrent(self, batches, input_file, tmp_path):
+        """Test that sequential generation produces the same output."""
+        results = self._run(FakeTTSClient(), batches, input_file, tmp_path, 1)
+
+        assert results == [f"Narrator: line {i}".encode() for i in range(12)]
+
+    def test_low_memory_streams_from_disk(self, batches, input_file, tmp_path):
+        """Test that low-memory mode keeps store keys and mixes batch by batch."""
+        exporter = RecordingExporter()
+        pipeline = AudioGenerationPipeline(
+            tts_client=FakeTTSClient(),
+            progress_manager=ProgressManager(tmp_path),
+            exporter=exporter,
+            low_memory=True,
+        )
+        results = self._run(
+            FakeTTSClient(), batches, input_file, tmp_path, 4, low_memory=True
+        )
+        prepared = PreparedScript(
+            script=None,  # type: ignore[arg-type]
+            batches=batches,
+            speaker_configs_map={"Narrator": SpeakerConfig(name="Narrator")},
+            character_profiles={},
+        )
+
+        assert all(isinstance(key, str) for key in results)
+        assert pipeline._load_batch(results[3]) == b"Narrator: line 3"
+
+        pipeline._finalize(prepared, results, tmp_path / "out.mp3", verify=False)
+
+        assert len(exporter.chunk_sizes) == len(batches) + 1
+        assert ProgressManager(tmp_path).load() is None
+
+
+class TestAsyncGenerateBatches:
+    """Tests for asyncio batch generation."""
+
+    @pytest.fixture
+    def prepared(self):
+        """Create a prepared script of single-segment narrator batches."""
+        batches = [
+            SegmentBatch(
+                segments=[Segment(speaker="Narrator", text=f"line {i}")],
+                speakers=["Narrator"],
+            )
+            for i in range(10)
+        ]
+        return PreparedScript(
+            script=None,  # type: ignore[arg-type]
+            batches=batches,
+            speaker_configs_map={"Narrator": SpeakerConfig(name="Narrator")},
+            character_profiles={},
+        )
+
+    def _run(self, client, prepared, max_concurrency):
+        pipeline = AudioGenerationPipeline(tts_client=client)
+        results: list[bytes | None] = [None] * len(prepared.batches)
+        asyncio.run(
+            pipeline._agenerate_batches(
+                prepared=prepared,
+                progress=None,
+                results=results,
+                progress_callback=None,
+                max_concurrency=max_concurrency,
+                request_timeout=None,
+            )
+        )
+        return results
+
+    def test_async_results_in_batch_order(self, prepared):
+        """Test that async generation fills results in batch order."""
+        client = FakeTTSClient()
+
+        results = self._run(client, prepared, 3)
+
+        assert results == [f"Narrator: line {i}".encode() for i in range(10)]
+        assert 1 < client.max_in_flight <= 3
+
+    def test_async_failure_cancels_outstanding(self, prepared):
+        """Test that a failed batch raises and leaves no task running."""
+        client = FakeTTSClient(fail_on="line 2")
+
+        with pytest.raises(RuntimeError, match="Batch 3 failed"):
+            self._run(client, prepared, 2)
+
+        assert client.in_flight == 0
+
+    def test_async_batch_saves_do_not_block_loop(self, prepared, tmp_path):
+        """Test that saving finished batches leaves the event loop responsive."""
+        manager = SlowProgressManager(tmp_path)
+        input_file = tmp_path / "script.md"
+        input_file.write_text("---\n---\n")
+        progress = manager.create_initial_progress(
+            input_file, [f"fp{i}" for i in range(len(prepared.batches))]
+        )
+        pipeline = AudioGenerationPipeline(
+            tts_client=FakeTTSClient(), progress_manager=manager
+        )
+        results: list[bytes | None] = [None] * len(prepared.batches)
+        gaps: list[float] = []
+
+        async def run() -> None:
+            generating = asyncio.create_task(
+                pipeline._agenerate_batches(
+                    prepared=prepared,
+                    progress=progress,
+                    results=results,
+                    progress_callback=None,
+                    max_concurrency=4,
+                    request_timeout=None,
+                )
+            )
+            last = time.perf_counter()
+            while not generating.done():
+                await asyncio.sleep(0.005)
+                now = time.perf_counter()
+                gaps.append(now - last)
+                last = now
+            await generating
+
+        asyncio.run(run())
+
+        assert results == [f"Narrator: line {i}".encode() for i in range(10)]
+        assert sorted(progress.completed_batches) == list(range(10))
+        assert max(gaps) < 0.04
@@ -0,0 +1,197 @@
+"""Unit tests for story pack discovery and build."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from audio_generation.domain.constants import DEFAULT_TTS_MODEL
+from audio_generation.domain.models import EncodedMP3
+from audio_generation.pack.builder import PackBuilder
+from audio_generation.pack.discovery import PackDiscovery
+from audio_generation.scheduling.rate_limiter import TokenBucketRateLimiter
+
+SCRIPT = """---
+stageUuid: "{uuid}"
+{model}speakers:
+  - name: Narrator
+    voice: Sulafat
+---
+
+**Narrator:** {text} one.
+
+**Narrator:** {text} two.
+"""
+
+
+def write_script(path: Path, text: str, model: str | None = None) -> None:
+    """Write a minimal single-speaker audio script."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    model_line = f"model: {model}\n" if model else ""
+    path.write_text(SCRIPT.format(uuid=path.stem, model=model_line, text=text))
+
+
+class FakeTTSClient:
+    """Async TTS client stand-in returning a short silent PCM buffer."""
+
+    def __init__(self, model: str = DEFAULT_TTS_MODEL):
+        self.model = model
+        self.rate_limiter = TokenBucketRateLimiter(requests_per_minute=60_000)
+        self.calls: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def with_model(self, model, rate_limiter=None):
+        clone = FakeTTSClient(model)
+        clone.calls = self.calls
+        return clone
+
+    async def agenerate(
+        self, prompt, speech_config, system_instruction="", batch_num=0, timeout=None
+    ):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+            self.calls.append(self.model)
+            return b"\x00\x00" * 2400
+        finally:
+            self.in_flight -= 1
+
+
+class FakeExporter:
+    """Exporter stand-in writing a marker instead of encoding MP3."""
+
+    def export(self, audio, output_path: Path) -> EncodedMP3:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(b"mp3")
+        return EncodedMP3(output_path, size_bytes=3)
+
+
+@pytest.fixture
+def pack_dir(tmp_path: Path) -> Path:
+    """Create a small pack with hub and story scripts."""
+    pack = tmp_path / "pack"
+    src = pack / "src"
+    write_script(src / "hub" / "menu.md", "Menu")
+    write_script(src / "hub" / "welcome-back.md", "Welcome")
+    write_script(src / "hub" / "option-nil.md", "Nil")
+    write_script(src / "stories" / "01-dieux-olympe" / "audio-script.md", "Olympe")
+    write_script(
+        src / "stories" / "02-mysteres-nil" / "audio-script.md", "Nil", "other-model"
+    )
+    (pack / "story.json").write_text(
+        json.dumps(
+            {
+                "stageNodes": [
+                    {"audio": "hub-menu.mp3"},
+                    {"audio": "story-01-olympe.mp3"},
+                    {"audio": "story-02-nil.mp3"},
+                ]
+            }
+        )
+    )
+    return pack
+
+
+class TestPackDiscovery:
+    """Tests for PackDiscovery class."""
+
+    def test_maps_scripts_to_assets(self, pack_dir: Path):
+        """Test the hub and story output naming convention."""
+        scripts = PackDiscovery().discover(pack_dir)
+
+        outputs = {s.source.relative_to(pack_dir).as_posix(): s.name for s in scripts}
+        assert outputs == {
+            "src/hub/menu.md": "hub-menu.mp3",
+            "src/hub/option-nil.md": "option-nil.mp3",
+            "src/hub/welcome-back.md": "hub-welcome-back.mp3",
+            "src/stories/01-dieux-olympe/audio-script.md": "story-01-olympe.mp3",
+            "src/stories/02-mysteres-nil/audio-script.md": "story-02-nil.mp3",
+        }
+        assert all(s.output.parent == pack_dir / "assets" for s in scripts)
+
+    def test_story_without_story_json_entry(self, pack_dir: Path):
+        """Test the fallback name when story.json has no matching entry."""
+        (pack_dir / "story.json").unlink()
+
+        scripts = PackDiscovery().discover(pack_dir)
+
+        assert "story-01-dieux-olympe.mp3" in [s.name for s in scripts]
+
+    def test_empty_pack_raises(self, tmp_path: Path):
+        """Test that a pack without scripts is rejected."""
+        with pytest.raises(FileNotFoundError):
+            PackDiscovery().discover(tmp_path)
+
+
+class TestPackBuilder:
+    """Tests for PackBuilder class."""
+
+    def test_builds_every_script(self, pack_dir: Path):
+        """Test that all assets are written through one shared scheduler."""
+        client = FakeTTSClient()
+        builder = PackBuilder(client, exporter=FakeExporter())
+
+        result = builder.build(pack_dir, verify=False, max_concurrency=3)
+
+        assert result.passed
+        assert len(result.built) == 5
+        assert sorted(p.name for p in (pack_dir / "assets").glob("*.mp3")) == [
+            "hub-menu.mp3",
+            "hub-welcome-back.mp3",
+            "option-nil.mp3",
+            "story-01-olympe.mp3",
+            "story-02-nil.mp3",
+        ]
+        assert not (pack_dir / "assets" / ".progress").exists()
+        assert [(m.name, m.items) for m in result.stage_metrics] == [
+            ("fetch", 5),
+            ("decode", 5),
+            ("mix", 5),
+            ("encode", 5),
+        ]
+
+    def test_encode_stage_matches_encoder_pool(self, pack_dir: Path):
+        """Test that one encode worker runs per pooled encoder."""
+        builder = PackBuilder(
+            FakeTTSClient(), exporter=FakeExporter(), encoder_workers=3
+        )
+
+        result = builder.build(pack_dir, verify=False)
+
+        assert result.stage_metrics[-1].name == "encode"
+        assert result.stage_metrics[-1].workers == 3
+
+    def test_uses_script_model(self, pack_dir: Path):
+        """Test that scripts declaring another model get a derived client."""
+        client = FakeTTSClient()
+
+        PackBuilder(client, exporter=FakeExporter()).build(pack_dir, verify=False)
+
+        assert client.calls.count("other-model") > 0
+        assert client.calls.count(DEFAULT_TTS_MODEL) > 0
+
+    def test_skip_existing(self, pack_dir: Path):
+        """Test that existing assets are left alone when requested."""
+        (pack_dir / "assets").mkdir()
+        (pack_dir / "assets" / "hub-menu.mp3").write_bytes(b"old")
+
+        result = PackBuilder(FakeTTSClient(), exporter=FakeExporter()).build(
+            pack_dir, verify=False, skip_existing=True
+        )
+
+        assert [s.name for s in result.skipped] == ["hub-menu.mp3"]
+        assert (pack_dir / "assets" / "hub-menu.mp3").read_bytes() == b"old"
+
+    def test_unparseable_script_does_not_stop_pack(self, pack_dir: Path):
+        """Test that one broken script is reported while others build."""
+        (pack_dir / "src" / "hub" / "menu.md").write_text("no frontmatter")
+
+        result = PackBuilder(FakeTTSClient(), exporter=FakeExporter()).build(
+            pack_dir, verify=False
+        )
+
+        assert list(result.failed) == ["hub-menu.mp3"]
+        assert len(result.built) == 4
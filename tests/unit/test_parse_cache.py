@@ -0,0 +1,83 @@
+"""Unit tests for ParseCache."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from audio_generation.parsing.parse_cache import ParseCache
+from audio_generation.parsing.script_parser import AudioScriptParser
+
+SCRIPT = """---
+stageUuid: "test-uuid-123"
+speakers:
+  - name: Narrator
+    voice: Sulafat
+  - name: Emma
+    voice: Leda
+---
+
+**Narrator:** <emotion: warm> Once upon a time. <emotion: tense> Then a sound.
+
+**Emma:** What's that?
+"""
+
+
+class TestParseCache:
+    """Tests for ParseCache class."""
+
+    @pytest.fixture
+    def script_path(self, tmp_path: Path) -> Path:
+        """Create a script file."""
+        path = tmp_path / "script.md"
+        path.write_text(SCRIPT, encoding="utf-8")
+        return path
+
+    def test_cached_parse_matches_parse(self, script_path: Path, tmp_path: Path):
+        """Test that a cached script equals a fresh parse."""
+        parser = AudioScriptParser(cache=ParseCache(tmp_path / "cache"))
+
+        first = parser.parse(script_path)
+        second = parser.parse(script_path)
+
+        assert first == second == AudioScriptParser().parse(script_path)
+        assert len(list((tmp_path / "cache").glob("*/*.json"))) == 1
+
+    def test_shared_across_instances(
+        self, script_path: Path, tmp_path: Path, monkeypatch
+    ):
+        """Test that a new cache serves entries written by an earlier one."""
+        AudioScriptParser(cache=ParseCache(tmp_path / "cache")).parse(script_path)
+
+        parser = AudioScriptParser(cache=ParseCache(tmp_path / "cache"))
+        monkeypatch.setattr(parser, "parse_text", lambda _: pytest.fail("parsed"))
+
+        assert parser.parse(script_path).stage_uuid == "test-uuid-123"
+
+    def test_returns_independent_copies(self, script_path: Path, tmp_path: Path):
+        """Test that modifying a returned script does not affect the cache."""
+        parser = AudioScriptParser(cache=ParseCache(tmp_path / "cache"))
+        parser.parse(script_path).speaker_configs[0].voice = "Puck"
+
+        assert parser.parse(script_path).speaker_configs[0].voice == "Sulafat"
+
+    def test_edited_file_is_parsed_again(self, script_path: Path, tmp_path: Path):
+        """Test that changed content is never served from the cache."""
+        parser = AudioScriptParser(cache=ParseCache(tmp_path / "cache"))
+        parser.parse(script_path)
+
+        script_path.write_text(SCRIPT.replace("Leda", "Puck"), encoding="utf-8")
+        os.utime(script_path, ns=(0, 0))
+
+        assert parser.parse(script_path).speaker_configs[1].voice == "Puck"
+
+    def test_unreadable_entry_is_ignored(self, script_path: Path, tmp_path: Path):
+        """Test that a corrupt entry is treated as a miss."""
+        cache = ParseCache(tmp_path / "cache")
+        key = cache.make_key(script_path.read_bytes())
+        entry = tmp_path / "cache" / key[:2] / f"{key}.json"
+        entry.parent.mkdir(parents=True)
+        entry.write_text("{not json")
+
+        assert cache.get(script_path) is None
+        assert AudioScriptParser(cache=cache).parse(script_path).segments
@@ -0,0 +1,59 @@
+"""Unit tests for PCMCodec."""
+
+import numpy as np
+import pytest
+
+from audio_generation.caching.pcm_codec import PCMCodec
+
+
+def speech_like(seconds: float = 1.0) -> bytes:
+    """Create a voiced tone with a syllable envelope and a noise floor."""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(24000 * seconds)) / 24000
+    voiced = sum(np.sin(2 * np.pi * 140 * k * t) / k for k in range(1, 8))
+    envelope = np.clip(np.sin(2 * np.pi * 3 * t), 0, None)
+    samples = voiced * envelope * 8000 + rng.standard_normal(len(t)) * 20
+    return samples.astype(np.int16).tobytes()
+
+
+class TestPCMCodec:
+    """Tests for PCMCodec class."""
+
+    @pytest.mark.parametrize("level", ["none", "fast", "small"])
+    def test_roundtrip_is_lossless(self, level: str):
+        """Test that every level restores the exact input."""
+        codec = PCMCodec(level)
+        pcm = speech_like()
+        # Full-scale jumps exercise the 16-bit wraparound of the deltas
+        pcm += np.array([32767, -32768, 32767], dtype="<i2").tobytes()
+
+        assert codec.decode(codec.encode(pcm)) == pcm
+
+    def test_compresses_speech(self):
+        """Test that both compressing levels shrink speech-like PCM."""
+        pcm = speech_like()
+
+        fast = PCMCodec("fast").encode(pcm)
+        small = PCMCodec("small").encode(pcm)
+
+        assert len(small) <= len(fast) < len(pcm) / 1.5
+
+    def test_uncompressed_data_passes_through(self):
+        """Test that PCM stored before compression is decoded as is."""
+        codec = PCMCodec("fast")
+
+        assert codec.decode(b"\x01\x02\x03\x04") == b"\x01\x02\x03\x04"
+        assert PCMCodec("none").encode(b"\x01\x02") == b"\x01\x02"
+        assert codec.encode(b"\x01\x02\x03") == b"\x01\x02\x03"
+
+    def test_corrupt_data_raises(self):
+        """Test that truncated compressed data is reported."""
+        stored = PCMCodec("fast").encode(speech_like(0.1))
+
+        with pytest.raises(ValueError, match="Corrupt compressed PCM"):
+            PCMCodec.decode(stored[:-10])
+
+    def test_unknown_level_raises(self):
+        """Test that an unknown level name is rejected."""
+        with pytest.raises(ValueError, match="Unknown PCM compression level"):
+            PCMCodec("maximum")
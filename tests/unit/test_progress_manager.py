@@ -0,0 +1,223 @@
+"""Unit tests for ProgressManager."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from audio_generation.domain.models import (
+    CharacterProfile,
+    Segment,
+    SegmentBatch,
+    SpeakerConfig,
+)
+from audio_generation.progress.batch_store import BatchAudioStore
+from audio_generation.progress.progress_manager import ProgressManager
+
+
+def make_batch(text: str, emotion: str = "") -> SegmentBatch:
+    """Create a single-segment narrator batch."""
+    return SegmentBatch(
+        segments=[Segment(speaker="Narrator", text=text, emotion=emotion)],
+        speakers=["Narrator"],
+    )
+
+
+class TestProgressManager:
+    """Tests for ProgressManager class."""
+
+    @pytest.fixture
+    def manager(self, tmp_path: Path):
+        """Create progress manager in a temporary directory."""
+        return ProgressManager(tmp_path)
+
+    @pytest.fixture
+    def input_file(self, tmp_path: Path) -> Path:
+        """Create an input file."""
+        path = tmp_path / "script.md"
+        path.write_text("---\n---\n")
+        return path
+
+    @pytest.fixture
+    def configs(self):
+        """Create speaker configs map."""
+        return {"Narrator": SpeakerConfig(name="Narrator", voice="Sulafat")}
+
+    def _fingerprints(self, batches, configs, profiles=None):
+        return [
+            ProgressManager.fingerprint_batch(b, configs, profiles) for b in batches
+        ]
+
+    def _complete_all(self, manager, input_file, fingerprints):
+        progress = manager.create_initial_progress(input_file, fingerprints)
+        for i, fingerprint in enumerate(fingerprints):
+            filename = manager.save_batch_audio(fingerprint, f"audio {i}".encode())
+            progress.completed_batches.add(i)
+            progress.audio_files[i] = filename
+        manager.save(progress)
+        return progress
+
+    # ---- Fingerprint tests ----
+
+    def test_fingerprint_is_stable(self, configs):
+        """Test that identical batches share a fingerprint."""
+        assert ProgressManager.fingerprint_batch(
+            make_batch("Hello."), configs
+        ) == ProgressManager.fingerprint_batch(make_batch("Hello."), configs)
+
+    def test_fingerprint_changes_with_text_and_emotion(self, configs):
+        """Test that text and emotion edits change the fingerprint."""
+        base = ProgressManager.fingerprint_batch(make_batch("Hello."), configs)
+
+        assert base != ProgressManager.fingerprint_batch(make_batch("Hello!"), configs)
+        assert base != ProgressManager.fingerprint_batch(
+            make_batch("Hello.", emotion="warm"), configs
+        )
+
+    def test_fingerprint_changes_with_voice(self, configs):
+        """Test that a voice change invalidates the batch."""
+        other = {"Narrator": SpeakerConfig(name="Narrator", voice="Puck")}
+
+        assert ProgressManager.fingerprint_batch(
+            make_batch("Hello."), configs
+        ) != ProgressManager.fingerprint_batch(make_batch("Hello."), other)
+
+    def test_fingerprint_changes_with_profile(self, configs):
+        """Test that editing the speaker's character profile invalidates it."""
+        profile = {"Narrator": CharacterProfile(name="Narrator", role="Storyteller")}
+        edited = {"Narrator": CharacterProfile(name="Narrator", role="Grandmother")}
+
+        assert ProgressManager.fingerprint_batch(
+            make_batch("Hello."), configs, profile
+        ) != ProgressManager.fingerprint_batch(make_batch("Hello."), configs, edited)
+
+    # ---- Reconcile tests ----
+
+    def test_reconcile_reuses_unchanged_batches(self, manager, input_file, configs):
+        """Test that only the edited batch needs regenerating."""
+        old = self._fingerprints([make_batch(f"Line {i}.") for i in range(4)], configs)
+        self._complete_all(manager, input_file, old)
+
+        edited = [make_batch(f"Line {i}.") for i in range(4)]
+        edited[2] = make_batch("Line 2, fixed.")
+        progress = manager.reconcile(
+            manager.load(), input_file, self._fingerprints(edited, configs)
+        )
+
+        assert sorted(progress.completed_batches) == [0, 1, 3]
+        assert manager.load_batch_audio(progress.audio_files[3]) == b"audio 3"
+
+    def test_reconcile_handles_inserted_batch(self, manager, input_file, configs):
+        """Test that inserting a batch does not invalidate the following ones."""
+        old = self._fingerprints([make_batch(f"Line {i}.") for i in range(3)], configs)
+        self._complete_all(manager, input_file, old)
+
+        inserted = [make_batch("Line 0."), make_batch("New line.")] + [
+            make_batch(f"Line {i}.") for i in range(1, 3)
+        ]
+        progress = manager.reconcile(
+            manager.load(), input_file, self._fingerprints(inserted, configs)
+        )
+
+        assert sorted(progress.completed_batches) == [0, 2, 3]
+        assert manager.load_batch_audio(progress.audio_files[2]) == b"audio 1"
+        assert progress.total_batches == 4
+
+    def test_reconcile_removes_stale_audio(
+        self, manager, input_file, configs, tmp_path
+    ):
+        """Test that audio of removed batches is deleted."""
+        old = self._fingerprints([make_batch(f"Line {i}.") for i in range(3)], configs)
+        self._complete_all(manager, input_file, old)
+
+        manager.reconcile(manager.load(), input_file, old[:1])
+
+        assert len(BatchAudioStore(tmp_path / "batches")) == 1
+
+    def test_reconcile_without_previous_starts_fresh(self, manager, input_file):
+        """Test that no saved progress yields an empty run."""
+        progress = manager.reconcile(None, input_file, ["a", "b"])
+
+        assert progress.completed_batches == set()
+        assert progress.batch_fingerprints == ["a", "b"]
+
+    def test_fresh_start_empties_batch_store(
+        self, manager, input_file, configs, tmp_path
+    ):
+        """Test that audio of an earlier run is dropped when not resuming."""
+        old = self._fingerprints([make_batch(f"Line {i}.") for i in range(3)], configs)
+        self._complete_all(manager, input_file, old)
+
+        manager.reconcile(None, input_file, old)
+
+        assert len(BatchAudioStore(tmp_path / "batches")) == 0
+
+    def test_progress_roundtrip_keeps_fingerprints(self, manager, input_file):
+        """Test that fingerprints survive save and load."""
+        manager.save(manager.create_initial_progress(input_file, ["a", "b"]))
+
+        loaded = manager.load()
+
+        assert loaded is not None
+        assert loaded.batch_fingerprints == ["a", "b"]
+
+    # ---- Journal tests ----
+
+    def test_saved_audio_loads_without_copy_by_default(self, manager):
+        """Test that uncompressed batch audio is served from the mapped store."""
+        key = manager.save_batch_audio("a", b"\x01\x02" * 100)
+
+        audio = manager.load_batch_audio(key)
+
+        assert isinstance(audio, memoryview)
+        assert audio == b"\x01\x02" * 100
+
+    def test_record_batch_appends_to_journal(self, manager, input_file, tmp_path):
+        """Test that a completed batch is journaled, not rewritten."""
+        progress = manager.create_initial_progress(input_file, ["a", "b"])
+        manager.save(progress)
+        snapshot = (tmp_path / ".progress.json").read_text()
+
+        manager.record_batch(progress, 1, manager.save_batch_audio("b", b"pcm"))
+
+        assert (tmp_path / ".progress.json").read_text() == snapshot
+        assert len((tmp_path / ".progress.journal").read_text().splitlines()) == 1
+        assert progress.completed_batches == {1}
+
+    def test_load_replays_and_compacts(self, manager, input_file, tmp_path):
+        """Test that loading applies the journal and folds it into the snapshot."""
+        progress = manager.create_initial_progress(input_file, ["a", "b", "c"])
+        manager.save(progress)
+        manager.record_batch(progress, 0, "batch_a.pcm")
+        manager.record_error(progress, 1, "API Error 429")
+        manager.record_batch(progress, 2, "batch_c.pcm")
+
+        loaded = manager.load()
+
+        assert loaded.completed_batches == {0, 2}
+        assert loaded.audio_files == {0: "batch_a.pcm", 2: "batch_c.pcm"}
+        assert loaded.last_error is None
+        assert not (tmp_path / ".progress.journal").exists()
+        assert ProgressManager(tmp_path).load().completed_batches == {0, 2}
+
+    def test_torn_journal_line_is_ignored(self, manager, input_file, tmp_path):
+        """Test that a record cut short by a crash does not lose the others."""
+        progress = manager.create_initial_progress(input_file, ["a", "b"])
+        manager.save(progress)
+        manager.record_batch(progress, 0, "batch_a.pcm")
+        with open(tmp_path / ".progress.journal", "a") as f:
+            f.write('{"type": "batch", "batch": 1, "finger')
+
+        loaded = manager.load()
+
+        assert loaded.completed_batches == {0}
+
+    def test_journal_of_other_batches_is_ignored(self, manager, input_file, tmp_path):
+        """Test that records whose fingerprint does not match are skipped."""
+        manager.save(manager.create_initial_progress(input_file, ["a", "b"]))
+        record = {"type": "batch", "batch": 0, "fingerprint": "x", "file": "f"}
+        (tmp_path / ".progress.journal").write_text(
+            json.dumps(record | {"time": ""}) + "\n"
+        )
+
+        assert manager.load().completed_batches == set()
@@ -0,0 +1,196 @@
+"""Unit tests for rate limiters."""
+
+from pathlib import Path
+
+import pytest
+
+from audio_generation.scheduling.rate_limiter import (
+    AdaptiveRateLimiter,
+    RateLimiter,
+    TokenBucketRateLimiter,
+)
+from audio_generation.scheduling.rate_state import RateStateStore
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRateLimiter:
+    """Tests for the RateLimiter base class."""
+
+    def test_subclass_without_reserve_cannot_be_created(self):
+        """Test that a limiter missing reserve fails at construction."""
+
+        class Incomplete(RateLimiter):
+            pass
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+
+class TestTokenBucketRateLimiter:
+    """Tests for TokenBucketRateLimiter class."""
+
+    @pytest.fixture
+    def clock(self):
+        """Create fake clock."""
+        return FakeClock()
+
+    def test_first_request_is_immediate(self, clock: FakeClock):
+        """Test that a full bucket grants the first request without waiting."""
+        limiter = TokenBucketRateLimiter(requests_per_minute=10, clock=clock)
+
+        assert limiter.reserve() == 0.0
+
+    def test_back_to_back_requests_are_spaced(self, clock: FakeClock):
+        """Test that reservations made at once are spaced by the interval."""
+        limiter = TokenBucketRateLimiter(requests_per_minute=10, clock=clock)
+
+        delays = [limiter.reserve() for _ in range(4)]
+
+        assert delays == pytest.approx([0.0, 6.0, 12.0, 18.0])
+
+    def test_tokens_refill_over_time(self, clock: FakeClock):
+        """Test that waiting one interval makes a token available again."""
+        limiter = TokenBucketRateLimiter(requests_per_minute=30, clock=clock)
+        limiter.reserve()
+
+        clock.now = 2.0
+
+        assert limiter.reserve() == 0.0
+
+    def test_burst_allows_immediate_requests(self, clock: FakeClock):
+        """Test that burst capacity lets several requests start at once."""
+        limiter = TokenBucketRateLimiter(requests_per_minute=60, burst=3, clock=clock)
+
+        delays = [limiter.reserve() for _ in range(4)]
+
+        assert delays == pytest.approx([0.0, 0.0, 0.0, 1.0])
+
+    def test_idle_time_does_not_exceed_burst(self, clock: FakeClock):
+        """Test that a long idle period only refills up to the burst size."""
+        limiter = TokenBucketRateLimiter(requests_per_minute=60, burst=2, clock=clock)
+        clock.now = 1000.0
+
+        delays = [limiter.reserve() for _ in range(3)]
+
+        assert delays == pytest.approx([0.0, 0.0, 1.0])
+
+    def test_invalid_rate_rejected(self):
+        """Test that non-positive rates are rejected."""
+        with pytest.raises(ValueError):
+            TokenBucketRateLimiter(requests_per_minute=0)
+
+    def test_retry_after_pauses_all_requests(self, clock: FakeClock):
+        """Test that a throttle with retry-after delays the next slot."""
+        limiter = TokenBucketRateLimiter(requests_per_minute=60, clock=clock)
+
+        limiter.record_throttle(retry_after=5.0)
+
+        assert limiter.reserve() == pytest.approx(6.0)
+
+
+class TestAdaptiveRateLimiter:
+    """Tests for AdaptiveRateLimiter class."""
+
+    @pytest.fixture
+    def clock(self):
+        """Create fake clock."""
+        return FakeClock()
+
+    def test_throttle_halves_rate(self, clock: FakeClock):
+        """Test multiplicative decrease on a quota error."""
+        limiter = AdaptiveRateLimiter(requests_per_minute=20, clock=clock)
+
+        limiter.record_throttle()
+
+        assert limiter.requests_per_minute == pytest.approx(10)
+
+    def test_concurrent_throttles_count_once(self, clock: FakeClock):
+        """Test that quota errors within the cooldown decrease only once."""
+        limiter = AdaptiveRateLimiter(
+            requests_per_minute=20, decrease_cooldown=10, clock=clock
+        )
+
+        limiter.record_throttle()
+        clock.now = 5.0
+        limiter.record_throttle()
+
+        assert limiter.requests_per_minute == pytest.approx(10)
+
+        clock.now = 20.0
+        limiter.record_throttle()
+
+        assert limiter.requests_per_minute == pytest.approx(5)
+
+    def test_success_increases_additively(self, clock: FakeClock):
+        """Test that a minute of successes gains about increase_rpm."""
+        limiter = AdaptiveRateLimiter(
+            requests_per_minute=10, increase_rpm=1.0, clock=clock
+        )
+
+        for _ in range(10):
+            limiter.record_success()
+
+        assert limiter.requests_per_minute == pytest.approx(11, abs=0.05)
+
+    def test_rate_stays_within_bounds(self, clock: FakeClock):
+        """Test that the rate is clamped to min_rpm and max_rpm."""
+        limiter = AdaptiveRateLimiter(
+            requests_per_minute=10,
+            min_rpm=4,
+            max_rpm=10.5,
+            decrease_cooldown=0,
+            clock=clock,
+        )
+
+        for _ in range(100):
+            limiter.record_success()
+        assert limiter.requests_per_minute == pytest.approx(10.5)
+
+        for _ in range(5):
+            limiter.record_throttle()
+        assert limiter.requests_per_minute == pytest.approx(4)
+
+    def test_learned_rate_is_persisted(self, clock: FakeClock, tmp_path: Path):
+        """Test that rate changes are saved to the state store."""
+        state = RateStateStore(tmp_path / "rates.json")
+        limiter = AdaptiveRateLimiter(
+            requests_per_minute=30, clock=clock, state=state, state_key="p/r/m"
+        )
+
+        limiter.record_throttle()
+
+        assert state.load("p/r/m") == pytest.approx(15)
+
+
+class TestRateStateStore:
+    """Tests for RateStateStore class."""
+
+    def test_roundtrip_per_key(self, tmp_path: Path):
+        """Test that rates are stored independently per quota key."""
+        state = RateStateStore(tmp_path / "rates.json")
+        key_a = state.make_key("project-a", "us-central1", "tts")
+        key_b = state.make_key("project-b", "europe-west1", "tts")
+
+        state.save(key_a, 12.5)
+        state.save(key_b, 40)
+
+        assert state.load(key_a) == pytest.approx(12.5)
+        assert state.load(key_b) == pytest.approx(40)
+
+    def test_missing_or_corrupt_file_returns_none(self, tmp_path: Path):
+        """Test that unreadable state is treated as nothing learned."""
+        path = tmp_path / "rates.json"
+        assert RateStateStore(path).load("p/r/m") is None
+
+        path.write_text("{not json")
+
+        assert RateStateStore(path).load("p/r/m") is None
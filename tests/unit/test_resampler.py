@@ -0,0 +1,60 @@
+"""Unit tests for PolyphaseResampler."""
+
+import numpy as np
+import pytest
+
+from audio_generation.audio.buffer import AudioBuffer
+from audio_generation.audio.resampler import PolyphaseResampler, get_resampler
+
+
+class TestPolyphaseResampler:
+    """Tests for PolyphaseResampler class."""
+
+    @pytest.fixture
+    def resampler(self):
+        """Create the 24 kHz to 44.1 kHz resampler."""
+        return get_resampler(24000, 44100)
+
+    def test_ratio(self, resampler: PolyphaseResampler):
+        """Test that 24 kHz to 44.1 kHz is 147/80."""
+        assert resampler.ratio == (147, 80)
+
+    def test_output_length(self, resampler: PolyphaseResampler):
+        """Test that the duration is preserved, rounded up."""
+        assert len(resampler.resample(np.zeros(24000, dtype=np.int16))) == 44100
+        assert len(resampler.resample(np.zeros(1, dtype=np.int16))) == 2
+        assert len(resampler.resample(np.zeros(0, dtype=np.int16))) == 0
+
+    @pytest.mark.parametrize("frequency", [100, 1000, 5000, 9000])
+    def test_sine_accuracy(self, resampler: PolyphaseResampler, frequency: int):
+        """Test that passband tones come out on the analytic sine."""
+        t_in = np.arange(24000) / 24000
+        samples = np.rint(np.sin(2 * np.pi * frequency * t_in) * 10000)
+
+        output = resampler.resample(samples.astype(np.int16))
+
+        expected = np.sin(2 * np.pi * frequency * np.arange(44100) / 44100) * 10000
+        error = (output - expected)[2000:-2000]  # Skip filter edge effects
+        assert np.sqrt(np.mean(error**2)) < 10000 * 10 ** (-60 / 20)
+
+    def test_stopband_rejects_images(self, resampler: PolyphaseResampler):
+        """Test that a tone near the 12 kHz input Nyquist does not image above it."""
+        t_in = np.arange(24000) / 24000
+        samples = (np.sin(2 * np.pi * 11000 * t_in) * 10000).astype(np.int16)
+
+        output = resampler.resample(samples).astype(np.float64)
+
+        spectrum = np.abs(np.fft.rfft(output * np.hanning(len(output))))
+        image_bin = 24000 - 11000  # 1 Hz bins over one second
+        assert spectrum[image_bin - 5 : image_bin + 6].max() < spectrum.max() * 1e-3
+
+    def test_audio_buffer_resample(self):
+        """Test that AudioBuffer.resample uses the polyphase resampler."""
+        audio = AudioBuffer(np.full(2400, 1000, dtype=np.int16), 24000)
+
+        resampled = audio.resample(44100)
+
+        assert resampled.sample_rate == 44100
+        assert resampled.num_samples == 4410
+        assert np.all(np.abs(resampled.samples[200:-200] - 1000) <= 1)
+        assert audio.resample(24000) is audio
@@ -0,0 +1,128 @@
+"""Unit tests for SharedRateLimiter."""
+
+import asyncio
+import threading
+from pathlib import Path
+
+import pytest
+
+from audio_generation.scheduling.rate_limiter import AIMDPolicy
+from audio_generation.scheduling.shared_limiter import SharedRateLimiter
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestSharedRateLimiter:
+    """Tests for SharedRateLimiter class."""
+
+    @pytest.fixture
+    def clock(self):
+        """Create fake clock."""
+        return FakeClock()
+
+    @pytest.fixture
+    def path(self, tmp_path: Path) -> Path:
+        """Create coordination file path."""
+        return SharedRateLimiter.path_for("project/us-central1/model", tmp_path)
+
+    def test_processes_share_one_schedule(self, path: Path, clock: FakeClock):
+        """Test that limiters on the same file interleave their slots."""
+        first = SharedRateLimiter(path, requests_per_minute=10, clock=clock)
+        second = SharedRateLimiter(path, requests_per_minute=10, clock=clock)
+
+        delays = [first.reserve(), second.reserve(), first.reserve()]
+
+        assert delays == pytest.approx([0.0, 6.0, 12.0])
+
+    def test_joining_process_keeps_shared_rate(self, path: Path, clock: FakeClock):
+        """Test that a new limiter adopts the rate already in the file."""
+        SharedRateLimiter(path, requests_per_minute=30, clock=clock)
+
+        joined = SharedRateLimiter(path, requests_per_minute=10, clock=clock)
+
+        assert joined.requests_per_minute == pytest.approx(30)
+
+    def test_throttle_lowers_rate_for_everyone(self, path: Path, clock: FakeClock):
+        """Test that one process's quota error slows all of them."""
+        policy = AIMDPolicy()
+        first = SharedRateLimiter(path, 20, policy=policy, clock=clock)
+        second = SharedRateLimiter(path, 20, policy=policy, clock=clock)
+
+        first.record_throttle()
+        second.record_throttle()  # Same congestion event: no second cut
+
+        assert second.requests_per_minute == pytest.approx(10)
+
+    def test_retry_after_delays_next_slot(self, path: Path, clock: FakeClock):
+        """Test that a retry-after hint holds back every process."""
+        first = SharedRateLimiter(path, requests_per_minute=60, clock=clock)
+        second = SharedRateLimiter(path, requests_per_minute=60, clock=clock)
+
+        first.record_throttle(retry_after=5.0)
+
+        assert second.reserve() == pytest.approx(5.0)
+
+    def test_concurrent_reservations_get_distinct_slots(self, path: Path):
+        """Test that the file lock serializes reservations across instances."""
+        clock = FakeClock()
+        limiters = [SharedRateLimiter(path, 60, clock=clock) for _ in range(4)]
+        delays: list[float] = []
+        lock = threading.Lock()
+
+        def reserve_many(limiter: SharedRateLimiter) -> None:
+            for _ in range(5):
+                delay = limiter.reserve()
+                with lock:
+                    delays.append(delay)
+
+        threads = [
+            threading.Thread(target=reserve_many, args=(limiter,))
+            for limiter in limiters
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(delays) == pytest.approx([float(i) for i in range(20)])
+
+    @pytest.mark.parametrize("contents", [None, "{not json"])
+    def test_lost_coordination_file_falls_back_to_last_rate(
+        self, path: Path, clock: FakeClock, contents: str | None
+    ):
+        """Test that a deleted or corrupt file reports the last known rate."""
+        limiter = SharedRateLimiter(path, requests_per_minute=30, clock=clock)
+
+        if contents is None:
+            path.unlink()
+        else:
+            path.write_text(contents)
+
+        assert limiter.requests_per_minute == pytest.approx(30)
+
+    def test_acquire_async_reserves_off_event_loop(
+        self, path: Path, clock: FakeClock, monkeypatch
+    ):
+        """Test that the file-locked reservation never runs on the loop thread."""
+        limiter = SharedRateLimiter(path, requests_per_minute=60, clock=clock)
+        threads: list[str] = []
+        reserve = limiter.reserve
+
+        def recording_reserve() -> float:
+            threads.append(threading.current_thread().name)
+            return reserve()
+
+        monkeypatch.setattr(limiter, "reserve", recording_reserve)
+
+        asyncio.run(limiter.acquire_async())
+
+        assert len(threads) == 1
+        assert threads[0] != threading.main_thread().name
@@ -0,0 +1,225 @@
+"""Unit tests for StreamingMP3Encoder, ID3Stripper and EncoderPool."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from audio_generation.audio.buffer import AudioBuffer
+from audio_generation.audio.encoder_pool import EncoderPool
+from audio_generation.audio.exporter import MP3Exporter
+from audio_generation.audio.stream_encoder import ID3Stripper, StreamingMP3Encoder
+from audio_generation.verification.mp3_verifier import FrameWalker, MP3Verifier
+
+FRAME_HEADER = bytes([0xFF, 0xFB, 0x90, 0xC0])  # MPEG1 Layer III, 44.1 kHz, mono
+ID3V2_TAG = b"ID3\x04\x00\x00\x00\x00\x00\x05" + b"title"
+ID3V1_TAG = b"TAG" + b"\x00" * 125
+
+# Stand-in for ffmpeg: wraps the PCM it receives in 417-byte frames between
+# ID3 tags, and records its arguments
+FAKE_FFMPEG = f"""#!{sys.executable}
+import sys
+from pathlib import Path
+
+Path(sys.argv[0] + ".args").write_text(" ".join(sys.argv[1:]))
+pcm = sys.stdin.buffer.read()
+if pcm[:2] == b"\\xff\\x7f":
+    sys.stderr.write("encoder failed")
+    sys.exit(1)
+out = sys.stdout.buffer
+out.write({ID3V2_TAG!r})
+for start in range(0, len(pcm), 413):
+    out.write({FRAME_HEADER!r} + pcm[start : start + 413].ljust(413, b"\\0"))
+    out.flush()
+out.write({ID3V1_TAG!r})
+"""
+
+
+@pytest.fixture
+def ffmpeg(tmp_path: Path) -> Path:
+    """Create a fake ffmpeg executable."""
+    path = tmp_path / "ffmpeg"
+    path.write_text(FAKE_FFMPEG)
+    path.chmod(0o755)
+    return path
+
+
+def as_frames(pcm: bytes) -> bytes:
+    """Frame PCM the way the fake ffmpeg does."""
+    return b"".join(
+        FRAME_HEADER + pcm[i : i + 413].ljust(413, b"\0")
+        for i in range(0, len(pcm), 413)
+    )
+
+
+def tone(num_samples: int) -> AudioBuffer:
+    """Create a 44.1 kHz test signal."""
+    samples = (np.arange(num_samples) % 2000 - 1000).astype(np.int16)
+    return AudioBuffer(samples, 44100)
+
+
+class TestID3Stripper:
+    """Tests for ID3Stripper class."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 128, 4096])
+    def test_streamed_matches_whole(self, chunk_size: int):
+        """Test that any chunking strips the same tags as whole data."""
+        body = FRAME_HEADER + bytes(range(256)) * 3
+        data = ID3V2_TAG + ID3V2_TAG + body + ID3V1_TAG
+
+        stripper = ID3Stripper()
+        output = b"".join(
+            stripper.feed(data[i : i + chunk_size])
+            for i in range(0, len(data), chunk_size)
+        )
+
+        assert output + stripper.finish() == body
+        assert ID3Stripper.strip(data) == body
+
+    def test_keeps_untagged_data(self):
+        """Test that data without tags passes through unchanged."""
+        assert ID3Stripper.strip(FRAME_HEADER + b"\x00" * 200) == (
+            FRAME_HEADER + b"\x00" * 200
+        )
+        assert ID3Stripper.strip(b"ID") == b"ID"
+        assert ID3Stripper.strip(b"") == b""
+
+
+class TestStreamingMP3Encoder:
+    """Tests for StreamingMP3Encoder class."""
+
+    def test_command_reads_raw_mono_pcm(self):
+        """Test that ffmpeg is asked for mono s16le in, untagged MP3 out."""
+        command = " ".join(StreamingMP3Encoder().command(44100))
+
+        assert "-f s16le -ar 44100 -ac 1 -i pipe:0" in command
+        assert "-id3v2_version 0 -write_id3v1 0 -f mp3 pipe:1" in command
+
+    def test_encode_streams_to_file(self, ffmpeg: Path, tmp_path: Path):
+        """Test that PCM goes through the pipe and tags are stripped."""
+        audio = tone(10_000)
+        output_path = tmp_path / "out" / "chapter.mp3"
+        encoder = StreamingMP3Encoder(str(ffmpeg), chunk_samples=1024, read_bytes=512)
+
+        encoded = encoder.encode(audio, output_path)
+
+        data = output_path.read_bytes()
+        assert data == as_frames(audio.to_pcm())
+        assert encoded.size_bytes == len(data)
+        assert MP3Verifier().verify_encoded(encoded).passed
+        assert not output_path.with_name("chapter.mp3.part").exists()
+
+    def test_encode_verifies_while_writing(self, ffmpeg: Path, tmp_path: Path):
+        """Test that frames are walked as written, so the file isn't reread."""
+        output_path = tmp_path / "chapter.mp3"
+        encoder = StreamingMP3Encoder(str(ffmpeg), read_bytes=100)
+
+        encoded = encoder.encode(tone(10_000), output_path)
+
+        assert encoded.verification == MP3Verifier().verify_file(output_path)
+        assert encoded.verification.frame_count == 49
+        output_path.unlink()
+        assert MP3Verifier().verify_encoded(encoded).passed
+
+    def test_write_failure_leaves_no_file(
+        self, ffmpeg: Path, tmp_path: Path, monkeypatch
+    ):
+        """Test that an error writing the output removes the partial file."""
+
+        def fail(self, chunk):
+            raise OSError("No space left on device")
+
+        monkeypatch.setattr(FrameWalker, "feed", fail)
+        output_path = tmp_path / "chapter.mp3"
+
+        with pytest.raises(OSError, match="No space left"):
+            StreamingMP3Encoder(str(ffmpeg)).encode(tone(10_000), output_path)
+
+        assert not output_path.exists()
+        assert not output_path.with_name("chapter.mp3.part").exists()
+
+    def test_encode_failure_leaves_no_file(self, ffmpeg: Path, tmp_path: Path):
+        """Test that a failing encoder raises and removes the partial file."""
+        audio = AudioBuffer(np.full(1000, 32767, dtype=np.int16), 44100)
+        output_path = tmp_path / "chapter.mp3"
+
+        with pytest.raises(RuntimeError, match="encoder failed"):
+            StreamingMP3Encoder(str(ffmpeg)).encode(audio, output_path)
+
+        assert not output_path.exists()
+        assert not output_path.with_name("chapter.mp3.part").exists()
+
+    def test_encode_stream_pulls_chunks(self, ffmpeg: Path, tmp_path: Path):
+        """Test that lazily produced chunks are encoded in order."""
+        samples = tone(3000).samples
+        chunks = iter([samples[:1000], samples[1000:2500], samples[2500:]])
+        output_path = tmp_path / "chapter.mp3"
+
+        encoded = StreamingMP3Encoder(str(ffmpeg)).encode_stream(
+            chunks, 44100, output_path
+        )
+
+        assert output_path.read_bytes() == as_frames(samples.tobytes())
+        assert encoded.size_bytes == len(as_frames(samples.tobytes()))
+
+    def test_encode_stream_source_failure(self, ffmpeg: Path, tmp_path: Path):
+        """Test that an error producing chunks is raised and no file is kept."""
+
+        def chunks():
+            yield tone(1000).samples
+            raise OSError("batch audio missing")
+
+        output_path = tmp_path / "chapter.mp3"
+        with pytest.raises(OSError, match="batch audio missing"):
+            StreamingMP3Encoder(str(ffmpeg)).encode_stream(chunks(), 44100, output_path)
+
+        assert not output_path.exists()
+        assert not output_path.with_name("chapter.mp3.part").exists()
+
+    def test_missing_encoder(self, tmp_path: Path):
+        """Test that a missing ffmpeg is reported."""
+        encoder = StreamingMP3Encoder(str(tmp_path / "no-ffmpeg"))
+
+        with pytest.raises(RuntimeError, match="not found"):
+            encoder.encode(tone(100), tmp_path / "chapter.mp3")
+
+    def test_exporter_resamples_before_streaming(self, ffmpeg: Path, tmp_path: Path):
+        """Test that the exporter hands 44.1 kHz audio to the encoder."""
+        exporter = MP3Exporter(encoder=StreamingMP3Encoder(str(ffmpeg)))
+        audio = AudioBuffer(np.zeros(24000, dtype=np.int16), 24000)
+
+        encoded = exporter.export(audio, tmp_path / "chapter.mp3")
+
+        assert "-ar 44100" in Path(f"{ffmpeg}.args").read_text()
+        assert encoded.size_bytes == len(as_frames(bytes(44100 * 2)))
+
+
+class TestEncoderPool:
+    """Tests for EncoderPool class."""
+
+    def test_encodes_in_parallel(self, ffmpeg: Path, tmp_path: Path):
+        """Test that files are encoded concurrently and verified."""
+        exporter = MP3Exporter(encoder=StreamingMP3Encoder(str(ffmpeg)))
+        jobs = [(tone(1000 + i), tmp_path / f"chapter-{i}.mp3") for i in range(6)]
+
+        with EncoderPool(exporter, workers=3) as pool:
+            results = pool.encode_all(jobs)
+
+        assert [r.output_path for r in results] == [path for _, path in jobs]
+        assert all(r.verification.passed for r in results)
+        assert results[5].encoded.size_bytes == len(as_frames(tone(1005).to_pcm()))
+        assert results[5].verification.frame_count == 5
+
+    def test_failure_raises_from_result(self, ffmpeg: Path, tmp_path: Path):
+        """Test that a failed export surfaces when its result is read."""
+        exporter = MP3Exporter(encoder=StreamingMP3Encoder(str(ffmpeg)))
+        failing = AudioBuffer(np.full(100, 32767, dtype=np.int16), 44100)
+
+        with EncoderPool(exporter, workers=2) as pool:
+            ok = pool.submit(tone(100), tmp_path / "ok.mp3", verify=False)
+            failed = pool.submit(failing, tmp_path / "failed.mp3")
+
+            assert ok.result().verification is None
+            with pytest.raises(RuntimeError):
+                failed.result()
@@ -0,0 +1,150 @@
+"""Unit tests for Timeline."""
+
+import numpy as np
+import pytest
+
+from audio_generation.audio.buffer import AudioBuffer
+from audio_generation.audio.concatenator import SegmentConcatenator
+from audio_generation.audio.effects import AudioEffects
+from audio_generation.audio.timeline import Timeline
+from audio_generation.domain.models import PauseConfig, Segment
+
+# 48 kHz keeps every millisecond a whole number of samples, so pydub's
+# millisecond slicing in apply_crossfade lines up with the timeline exactly
+RATE = 48000
+
+
+def make_clips(durations_ms: list[int]) -> list[np.ndarray]:
+    """Create random 16-bit clips of the given durations."""
+    rng = np.random.default_rng(0)
+    return [
+        (rng.standard_normal(RATE * ms // 1000) * 3000).astype(np.int16)
+        for ms in durations_ms
+    ]
+
+
+def to_buffer(samples: np.ndarray) -> AudioBuffer:
+    """Wrap samples in an AudioBuffer."""
+    return AudioBuffer(samples, RATE)
+
+
+class TestTimeline:
+    """Tests for Timeline class."""
+
+    @pytest.mark.parametrize(
+        "curve", ["logarithmic", "s_curve", "exponential", "equal_power", "linear"]
+    )
+    def test_matches_iterative_crossfades(self, curve: str):
+        """Test that one-pass mixing equals joining clip by clip."""
+        clips = make_clips([500, 2000, 700, 40, 1500, 8, 1000])
+        effects = AudioEffects()
+        combined = to_buffer(clips[0])
+        for clip in clips[1:]:
+            combined = effects.apply_crossfade(combined, to_buffer(clip), 75, curve)
+
+        timeline = Timeline(RATE, crossfade_ms=75, curve_type=curve)
+        for clip in clips:
+            timeline.append(clip)
+
+        np.testing.assert_array_equal(timeline.render(), combined.samples)
+
+    def test_placement(self):
+        """Test overlaps are capped by clip length and skipped below 10ms."""
+        timeline = Timeline(RATE, crossfade_ms=75)
+        first = timeline.append(np.ones(RATE, dtype=np.int16))
+        short = timeline.append(np.ones(RATE // 50, dtype=np.int16))  # 20ms
+        tiny = timeline.append(np.ones(RATE // 200, dtype=np.int16))  # 5ms
+
+        assert (first.start, first.overlap) == (0, 0)
+        assert short.overlap == RATE // 50
+        assert short.start == RATE - RATE // 50
+        assert tiny.overlap == 0
+        assert len(timeline) == RATE + RATE // 200
+
+    def test_flushing_matches_render(self):
+        """Test that flushing after every clip yields the same mix."""
+        clips = make_clips([500, 2000, 700, 40, 1500, 8, 1000])
+        whole = Timeline(RATE, crossfade_ms=75)
+        streamed = Timeline(RATE, crossfade_ms=75)
+        chunks = []
+        for clip in clips:
+            whole.append(clip)
+            streamed.append(clip)
+            chunks.append(streamed.flush())
+        chunks.append(streamed.render())
+
+        np.testing.assert_array_equal(np.concatenate(chunks), whole.render())
+        assert len(streamed) == RATE * 75 // 1000
+
+    def test_append_buffer_converts_rate(self):
+        """Test that buffers at another rate are resampled to the timeline's."""
+        timeline = Timeline(RATE)
+        timeline.append_buffer(AudioBuffer.silent(1000, 24000))
+
+        assert len(timeline) == RATE
+        assert timeline.to_buffer().sample_rate == RATE
+
+
+class TestSegmentConcatenatorMix:
+    """Tests for SegmentConcatenator.mix on the timeline."""
+
+    def test_mix_length(self):
+        """Test that the mix spans buffers and pauses minus the crossfades."""
+        config = PauseConfig(use_comfort_noise=False, crossfade_ms=75)
+        concatenator = SegmentConcatenator(pause_config=config)
+        pcm = np.full(24000, 1000, dtype=np.int16).tobytes()  # 1s at 24kHz
+        normalized = concatenator.normalize([pcm, pcm])
+        segments = [Segment("Narrator", "One."), Segment("Narrator", "Two.")]
+
+        combined = concatenator.mix(normalized, segments)
+
+        seg_ms = normalized.segments[0].duration_ms
+        expected = (
+            config.file_leading_ms
+            + 2 * seg_ms
+            + config.narrator_to_narrator_ms
+            + config.file_trailing_ms
+            - 4 * config.crossfade_ms
+        )
+        assert combined.sample_rate == 44100
+        assert abs(combined.duration_ms - expected) <= 1
+
+    def test_stream_matches_concatenate(self):
+        """Test that streaming one segment at a time gives the same mix."""
+        config = PauseConfig(use_comfort_noise=False, crossfade_ms=75)
+        concatenator = SegmentConcatenator(pause_config=config)
+        rng = np.random.default_rng(1)
+        pcm = [
+            (rng.standard_normal(24000 * n // 4) * 3000).astype(np.int16).tobytes()
+            for n in (3, 1, 5)
+        ]
+        segments = [
+            Segment("Narrator", "One..."),
+            Segment("Hero", "Two?"),
+            Segment("Narrator", "Three."),
+        ]
+        loaded = []
+
+        def load(i: int) -> bytes:
+            loaded.append(i)
+            return pcm[i]
+
+        chunks = list(concatenator.stream(len(pcm), load, segments))
+
+        combined = concatenator.concatenate(pcm, segments)
+        np.testing.assert_array_equal(np.concatenate(chunks), combined.samples)
+        assert loaded == [0, 1, 2]  # No noise floor pass without comfort noise
+
+    def test_stream_matches_concatenate_with_comfort_noise(self):
+        """Test that streamed pauses get the same comfort noise as a full mix."""
+        rng = np.random.default_rng(2)
+        pcm = [
+            (rng.standard_normal(24000 * n // 4) * 3000).astype(np.int16).tobytes()
+            for n in (2, 3)
+        ]
+        concatenator = SegmentConcatenator()
+
+        chunks = list(concatenator.stream(len(pcm), pcm.__getitem__))
+
+        combined = SegmentConcatenator().concatenate(pcm)
+        np.testing.assert_array_equal(np.concatenate(chunks), combined.samples)
@@ -0,0 +1,132 @@
+"""Unit tests for TTSResponseCache."""
+
+import os
+from pathlib import Path
+
+import pytest
+from google.genai import types
+
+from audio_generation.caching.pcm_codec import PCMCodec
+from audio_generation.caching.tts_cache import TTSResponseCache
+from audio_generation.domain.models import SpeakerConfig
+from audio_generation.tts.config_builder import SpeechConfigBuilder
+
+
+class TestTTSResponseCache:
+    """Tests for TTSResponseCache class."""
+
+    @pytest.fixture
+    def cache(self, tmp_path: Path):
+        """Create uncompressed cache in a temporary directory."""
+        return TTSResponseCache(
+            tmp_path / "cache", max_bytes=1000, codec=PCMCodec("none")
+        )
+
+    @pytest.fixture
+    def speech_config(self) -> types.SpeechConfig:
+        """Create a single-speaker speech config."""
+        return SpeechConfigBuilder().build_single_speaker(
+            SpeakerConfig(name="Narrator", voice="Sulafat")
+        )
+
+    def test_key_is_stable(self, speech_config: types.SpeechConfig):
+        """Test that identical requests produce identical keys."""
+        key1 = TTSResponseCache.make_key("model", "rules", "prompt", speech_config)
+        key2 = TTSResponseCache.make_key("model", "rules", "prompt", speech_config)
+
+        assert key1 == key2
+
+    def test_key_depends_on_every_input(self, speech_config: types.SpeechConfig):
+        """Test that model, instruction, prompt and voice all change the key."""
+        other_voice = SpeechConfigBuilder().build_single_speaker(
+            SpeakerConfig(name="Narrator", voice="Puck")
+        )
+        base = TTSResponseCache.make_key("model", "rules", "prompt", speech_config)
+
+        keys = {
+            TTSResponseCache.make_key("model-2", "rules", "prompt", speech_config),
+            TTSResponseCache.make_key("model", "rules 2", "prompt", speech_config),
+            TTSResponseCache.make_key("model", "rules", "prompt 2", speech_config),
+            TTSResponseCache.make_key("model", "rules", "prompt", other_voice),
+        }
+
+        assert base not in keys
+        assert len(keys) == 4
+
+    def test_get_miss_returns_none(self, cache: TTSResponseCache):
+        """Test lookup of an unknown key."""
+        assert cache.get("ab" * 32) is None
+        assert cache.stats().misses == 1
+
+    def test_put_then_get_roundtrip(self, cache: TTSResponseCache):
+        """Test that stored audio is returned unchanged."""
+        cache.put("ab" * 32, b"\x01\x02" * 10)
+
+        assert cache.get("ab" * 32) == b"\x01\x02" * 10
+        assert cache.stats().hits == 1
+
+    def test_persists_across_instances(self, cache: TTSResponseCache):
+        """Test that a new cache instance sees earlier entries."""
+        cache.put("cd" * 32, b"pcm")
+
+        reopened = TTSResponseCache(cache.cache_dir)
+
+        assert reopened.get("cd" * 32) == b"pcm"
+
+    def test_evicts_least_recently_used(self, cache: TTSResponseCache):
+        """Test that exceeding the size limit evicts the oldest entries."""
+        keys = [f"{i:02x}" * 32 for i in range(3)]
+        for age, key in enumerate(keys):
+            cache.put(key, b"x" * 300)
+            path = cache.cache_dir / key[:2] / f"{key}.pcm"
+            os.utime(path, (1000 + age, 1000 + age))
+
+        # Touch the oldest entry so the middle one becomes least recent
+        cache.get(keys[0])
+        cache.put("ff" * 32, b"x" * 300)
+
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[1]) is None
+        assert cache.stats().total_bytes <= 1000
+
+    def test_clear_removes_everything(self, cache: TTSResponseCache):
+        """Test that clear empties the cache."""
+        cache.put("aa" * 32, b"a")
+        cache.put("bb" * 32, b"b")
+
+        assert cache.clear() == 2
+        assert cache.stats().entries == 0
+
+    def test_entries_are_compressed(self, tmp_path: Path):
+        """Test that entries are stored compressed and read back exactly."""
+        cache = TTSResponseCache(tmp_path / "cache", codec=PCMCodec("fast"))
+        audio = bytes(range(256)) * 40
+        cache.put("ab" * 32, audio)
+
+        assert cache.stats().total_bytes < len(audio)
+        assert cache.get("ab" * 32) == audio
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path: Path):
+        """Test that an undecodable entry is dropped instead of returned."""
+        cache = TTSResponseCache(tmp_path / "cache", codec=PCMCodec("fast"))
+        cache.put("ab" * 32, b"\x01\x02" * 100)
+        path = cache.cache_dir / "ab" / f"{'ab' * 32}.pcm"
+        path.write_bytes(path.read_bytes()[:20])
+
+        assert cache.get("ab" * 32) is None
+        assert not path.exists()
+
+    def test_recompress_rewrites_other_levels(self, tmp_path: Path):
+        """Test that recompress converts entries and keeps their recency."""
+        audio = bytes(range(256)) * 40
+        TTSResponseCache(tmp_path / "cache", codec=PCMCodec("fast")).put(
+            "ab" * 32, audio
+        )
+        path = tmp_path / "cache" / "ab" / f"{'ab' * 32}.pcm"
+        os.utime(path, (1000, 1000))
+        cache = TTSResponseCache(tmp_path / "cache", codec=PCMCodec("none"))
+
+        assert cache.recompress() == 1
+        assert cache.recompress() == 0
+        assert path.read_bytes() == audio
+        assert path.stat().st_mtime == 1000
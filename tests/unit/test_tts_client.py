@@ -0,0 +1,152 @@
+"""Unit tests for TTSClient error classification and async generation."""
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+from google import genai
+from google.genai import errors
+
+from audio_generation.caching.tts_cache import TTSResponseCache
+from audio_generation.domain.models import Segment, SegmentBatch, SpeakerConfig
+from audio_generation.scheduling.rate_limiter import TokenBucketRateLimiter
+from audio_generation.tts.client import TTSClient
+from audio_generation.tts.config_builder import SpeechConfigBuilder
+
+
+def make_api_error(
+    code: int, status: str, details: list | None = None, headers: dict | None = None
+) -> errors.APIError:
+    """Create an APIError as raised by the SDK."""
+    body = {"error": {"code": code, "status": status, "message": "quota"}}
+    if details is not None:
+        body["error"]["details"] = details
+    response = httpx.Response(code, headers=headers or {})
+    return errors.APIError(code, body, response)
+
+
+class TestTTSClientRetry:
+    """Tests for TTSClient quota error handling."""
+
+    def test_detects_quota_error(self):
+        """Test that 429 and RESOURCE_EXHAUSTED are quota errors."""
+        assert TTSClient._is_quota_error(make_api_error(429, "RESOURCE_EXHAUSTED"))
+        assert not TTSClient._is_quota_error(make_api_error(500, "INTERNAL"))
+        assert not TTSClient._is_quota_error(RuntimeError("boom"))
+
+    def test_retry_after_header(self):
+        """Test that the Retry-After header is honoured."""
+        error = make_api_error(429, "RESOURCE_EXHAUSTED", headers={"Retry-After": "7"})
+
+        assert TTSClient._retry_after(error) == pytest.approx(7.0)
+
+    def test_retry_info_detail(self):
+        """Test that a RetryInfo retryDelay is honoured."""
+        error = make_api_error(
+            429,
+            "RESOURCE_EXHAUSTED",
+            details=[
+                {
+                    "@type": "type.googleapis.com/google.rpc.RetryInfo",
+                    "retryDelay": "2.5s",
+                }
+            ],
+        )
+
+        assert TTSClient._retry_after(error) == pytest.approx(2.5)
+
+    def test_no_retry_hint(self):
+        """Test that errors without a hint return None."""
+        assert TTSClient._retry_after(make_api_error(429, "RESOURCE_EXHAUSTED")) is None
+
+    def test_backoff_grows_with_jitter(self):
+        """Test that backoff doubles per attempt within jitter bounds."""
+        for attempt in range(4):
+            delay = TTSClient._backoff_delay(attempt)
+            assert 2**attempt / 2 <= delay <= 2**attempt
+
+
+class RecordingCache:
+    """Response cache stand-in recording the thread of every call."""
+
+    make_key = staticmethod(TTSResponseCache.make_key)
+
+    def __init__(self, hit: bytes | None = None):
+        self.hit = hit
+        self.threads: list[str] = []
+
+    def get(self, key):
+        self.threads.append(threading.current_thread().name)
+        return self.hit
+
+    def put(self, key, audio_data):
+        self.threads.append(threading.current_thread().name)
+
+
+class TestTTSClientAsync:
+    """Tests for TTSClient.agenerate."""
+
+    @pytest.fixture
+    def speech_config(self):
+        """Create a single-speaker speech config."""
+        return SpeechConfigBuilder().build_for_batch(
+            SegmentBatch(
+                segments=[Segment(speaker="Narrator", text="Hello")],
+                speakers=["Narrator"],
+            ),
+            {"Narrator": SpeakerConfig(name="Narrator")},
+        )
+
+    def make_client(self, monkeypatch, cache, rate_limiter=None) -> TTSClient:
+        """Create a client whose API call returns fixed audio."""
+        monkeypatch.setattr(genai, "Client", lambda **kwargs: None)
+        client = TTSClient(
+            "project", "region", "model", rate_limiter=rate_limiter, cache=cache
+        )
+
+        async def request(prompt, speech_config, system_instruction):
+            return b"pcm"
+
+        monkeypatch.setattr(client, "_amake_request", request)
+        return client
+
+    @pytest.mark.parametrize("hit", [None, b"cached"])
+    def test_cache_access_runs_off_event_loop(self, monkeypatch, speech_config, hit):
+        """Test that cache lookups and writes never run on the loop thread."""
+        cache = RecordingCache(hit)
+        client = self.make_client(monkeypatch, cache)
+
+        audio = asyncio.run(client.agenerate("prompt", speech_config))
+
+        assert audio == (hit or b"pcm")
+        assert len(cache.threads) == (1 if hit else 2)
+        assert threading.main_thread().name not in cache.threads
+
+    def test_throttle_reported_off_event_loop(self, monkeypatch, speech_config):
+        """Test that limiter updates after a quota error leave the loop free."""
+        threads: list[str] = []
+
+        class RecordingLimiter(TokenBucketRateLimiter):
+            def record_throttle(self, retry_after=None):
+                threads.append(threading.current_thread().name)
+
+            def record_success(self):
+                threads.append(threading.current_thread().name)
+
+        client = self.make_client(
+            monkeypatch, None, RecordingLimiter(requests_per_minute=60_000)
+        )
+        outcomes = [make_api_error(429, "RESOURCE_EXHAUSTED"), b"pcm"]
+
+        async def request(prompt, speech_config, system_instruction):
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        monkeypatch.setattr(client, "_amake_request", request)
+
+        assert asyncio.run(client.agenerate("prompt", speech_config)) == b"pcm"
+        assert len(threads) == 2
+        assert threading.main_thread().name not in threads